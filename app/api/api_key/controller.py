@@ -0,0 +1,92 @@
+"""Controller for API key operations."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import Row, Select, select
+
+from app.database.session import Session
+from app.models.api_key import ApiKey
+from app.models.user import User
+from app.utils.exceptions import ObjectNotFoundException
+from app.utils.generic_controller import GenericController
+from app.utils.logging import get_logger
+from app.utils.security import (
+    api_key_digest,
+    api_key_matches,
+    generate_api_key,
+    split_api_key,
+)
+from app.utils.timestamps import as_utc
+
+
+def api_key_identity_query(prefix: str) -> Select:
+    """Select the secret hash and expiry of a key, with its user's id and username."""
+    return (
+        select(ApiKey.secret_hash, ApiKey.expires_at, User.id, User.username)
+        .join(User, User.id == ApiKey.user_id)
+        .where(ApiKey.prefix == prefix)
+    )
+
+
+class ApiKeyController(GenericController):
+    """Controller for API key operations."""
+
+    def __init__(self) -> None:
+        super().__init__(ApiKey)
+        self.logger = get_logger(self.__class__.__name__)
+
+    def create_for_user(
+        self, db_session: Session, obj: ApiKey, expires_in_days: int | None = None
+    ) -> tuple[ApiKey, str]:
+        """Issue a key for `obj.user_id`; the full key is only returned here."""
+        prefix, secret, api_key = generate_api_key()
+        obj.prefix = prefix
+        obj.secret_hash = api_key_digest(secret)
+        if expires_in_days:
+            obj.expires_at = datetime.now(UTC) + timedelta(days=expires_in_days)
+        self.logger.info("Issuing API key prefix=%s user_id=%s", prefix, obj.user_id)
+        return self.save(db_session, obj), api_key
+
+    def get_user_keys(self, db_session: Session, user_id: int) -> list[ApiKey]:
+        """List the keys of a user."""
+        return list(
+            db_session.scalars(
+                select(ApiKey).where(ApiKey.user_id == user_id).order_by(ApiKey.id)
+            )
+        )
+
+    def delete_user_key(self, db_session: Session, user_id: int, key_id: int) -> None:
+        """Delete one of the user's keys; other users' keys look missing."""
+        instance = db_session.get(ApiKey, key_id)
+        if instance is None or instance.user_id != user_id:
+            raise ObjectNotFoundException(ApiKey.__name__, str(key_id))
+        db_session.delete(instance)
+        db_session.commit()
+        self.logger.info("API key deleted id=%s user_id=%s", key_id, user_id)
+
+    def authenticate(self, db_session: Session, api_key: str) -> tuple[int, str] | None:
+        """
+        Resolve an API key into the id and username of its user.
+
+        One indexed lookup by prefix and one HMAC; returns None for unknown,
+        mismatching or expired keys.
+        """
+        parts = split_api_key(api_key)
+        if parts is None:
+            return None
+        prefix, secret = parts
+
+        row = db_session.execute(api_key_identity_query(prefix)).first()
+        return self.identity_from_row(prefix, secret, row)
+
+    def identity_from_row(
+        self, prefix: str, secret: str, row: Row | None
+    ) -> tuple[int, str] | None:
+        """Check the secret and expiry of a key row from `api_key_identity_query`."""
+        if row is None or not api_key_matches(secret, row.secret_hash):
+            self.logger.warning("API key rejected prefix=%s", prefix)
+            return None
+        if row.expires_at is not None and as_utc(row.expires_at) <= datetime.now(UTC):
+            self.logger.warning("API key expired prefix=%s", prefix)
+            return None
+        return row.id, row.username
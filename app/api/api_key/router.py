@@ -0,0 +1,83 @@
+"""API key management routes for the current user."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import status as HTTP_STATUS
+from sqlalchemy.orm import Session
+
+from app.api.api_key.controller import ApiKeyController
+from app.api.api_key.schemas import (
+    ApiKeyCreatedSchema,
+    ApiKeyDTOSchema,
+    ApiKeyListSchema,
+    ApiKeySchema,
+)
+from app.api.authentication.controller import get_current_user
+from app.api.authentication.principal import Principal
+from app.database.session import get_session
+from app.models.api_key import ApiKey
+from app.utils.base_schemas import SimpleMessageSchema
+from app.utils.client_ip import get_client_ip
+from app.utils.exceptions import ObjectNotFoundException
+from app.utils.logging import get_logger
+
+router = APIRouter()
+api_key_controller = ApiKeyController()
+logger = get_logger("api_key.router")
+
+SessionDep = Annotated[Session, Depends(get_session)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
+
+
+@router.post(
+    "/",
+    status_code=HTTP_STATUS.HTTP_201_CREATED,
+    response_model=ApiKeyCreatedSchema,
+)
+def create_api_key(
+    api_key: ApiKeyDTOSchema,
+    db_session: SessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """Issue an API key for the current user; the key is only shown once."""
+    logger.info(
+        "Create API key name=%s by user=%s ip=%s",
+        api_key.name,
+        current_user.username,
+        get_client_ip(request),
+    )
+    new_key = ApiKey(name=api_key.name, user_id=current_user.id)
+    new_key.audit_user_ip = get_client_ip(request)
+    new_key.audit_user_login = current_user.username
+
+    created, plain_key = api_key_controller.create_for_user(
+        db_session, new_key, api_key.expires_in_days
+    )
+    logger.info("API key created id=%s", created.id)
+    return ApiKeyCreatedSchema(
+        **ApiKeySchema.model_validate(created).model_dump(), api_key=plain_key
+    )
+
+
+@router.get("/", response_model=ApiKeyListSchema)
+def get_my_api_keys(db_session: SessionDep, current_user: CurrentUser):
+    """List the current user's API keys."""
+    logger.info("List API keys by user=%s", current_user.username)
+    return {"api_keys": api_key_controller.get_user_keys(db_session, current_user.id)}
+
+
+@router.delete("/{api_key_id}", response_model=SimpleMessageSchema)
+def delete_api_key(api_key_id: int, db_session: SessionDep, current_user: CurrentUser):
+    """Delete one of the current user's API keys."""
+    logger.info("Delete API key id=%s by user=%s", api_key_id, current_user.username)
+    try:
+        api_key_controller.delete_user_key(db_session, current_user.id, api_key_id)
+    except ObjectNotFoundException as ex:
+        logger.warning("API key delete failed id=%s: %s", api_key_id, ex.args[0])
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_404_NOT_FOUND, detail=ex.args[0]
+        ) from ex
+
+    return {"detail": "API key deleted"}
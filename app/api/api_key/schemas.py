@@ -0,0 +1,36 @@
+"""Schemas for the API keys of machine clients."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.utils.base_schemas import BaseAuditModelSchema
+
+
+class ApiKeyDTOSchema(BaseModel):
+    """Represents a request to issue an API key for the current user."""
+
+    name: str
+    expires_in_days: int | None = Field(default=None, gt=0)
+
+
+class ApiKeySchema(BaseAuditModelSchema):
+    """Represents an API key, without its secret."""
+
+    id: int
+    name: str
+    prefix: str
+    expires_at: datetime | None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ApiKeyCreatedSchema(ApiKeySchema):
+    """Represents a newly issued API key; the full key is only shown once."""
+
+    api_key: str
+
+
+class ApiKeyListSchema(BaseModel):
+    """Represents a list of API keys."""
+
+    api_keys: list[ApiKeySchema]
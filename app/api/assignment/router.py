@@ -7,22 +7,26 @@ from fastapi import status as HTTP_STATUS
 from sqlalchemy.orm import Session
 
 from app.api.assignment.schemas import (
+    AssignmentBulkPatchSchema,
     AssignmentDTOSchema,
     AssignmentListSchema,
+    AssignmentPatchSchema,
     AssignmentSchema,
 )
 from app.api.authentication.controller import get_current_user
+from app.api.authentication.principal import Principal
 from app.api.authorization.controller import validate_transaction_access
 from app.api.transaction.enum_operation_code import EnumOperationCode as op
 from app.database.session import get_session
 from app.models.assignment import Assignment
-from app.models.user import User
-from app.utils.base_schemas import SimpleMessageSchema
+from app.utils.base_schemas import BulkResultSchema, SimpleMessageSchema
+from app.utils.bulk import BulkBody, bulk_response
 from app.utils.client_ip import get_client_ip
 from app.utils.exceptions import (
     IntegrityValidationException,
     ObjectNotFoundException,
 )
+from app.utils.filters import FilterQuery
 from app.utils.generic_controller import GenericController
 from app.utils.logging import get_logger
 
@@ -31,7 +35,7 @@ controller = GenericController(Assignment)
 logger = get_logger(__name__)
 
 SessionDep = Annotated[Session, Depends(get_session)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
 @router.get(
@@ -64,17 +68,32 @@ def get_all_assignments(
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    order_by: str | None = None,
+    filters: FilterQuery = None,
 ):
-    """Get all assignments with pagination."""
+    """
+    Get all assignments with pagination.
+
+    Pass `next_cursor` back as `cursor` for the next page.
+
+    Narrow the list with repeated `filter` parameters, e.g.
+    `filter=user_id:in:1,2`.
+    """
     validate_transaction_access(db_session, current_user, op.OP_1010003.value)
     logger.info(
-        "List assignments skip=%s limit=%s by user=%s",
+        "List assignments skip=%s limit=%s cursor=%s filter=%s order_by=%s by user=%s",
         skip,
         limit,
+        cursor,
+        filters,
+        order_by,
         current_user.username,
     )
-    assignments = controller.get_all(db_session, skip, limit)
-    return {"assignments": assignments}
+    page = controller.get_page(
+        db_session, limit, cursor, skip, order_by, filters=filters or ()
+    )
+    return {"assignments": page.items, "next_cursor": page.next_cursor}
 
 
 @router.post(
@@ -116,6 +135,88 @@ def create_assignment(
     return new_assignment
 
 
+@router.post(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def create_assignments_bulk(
+    assignments: BulkBody[AssignmentDTOSchema],
+    db_session: SessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """
+    Create many assignments in one request.
+
+    Every item gets its own result, in body order; items the database rejects
+    (e.g. an unknown user or role) do not stop the others.
+    """
+    validate_transaction_access(db_session, current_user, op.OP_1010001.value)
+    logger.info(
+        "Bulk create assignments count=%s by user=%s ip=%s",
+        len(assignments),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    results = controller.bulk_save(
+        db_session, [{**item.model_dump(), **audit} for item in assignments]
+    )
+    return bulk_response(results, "ASSIGNMENT", HTTP_STATUS.HTTP_201_CREATED)
+
+
+@router.patch(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def patch_assignments_bulk(
+    assignments: BulkBody[AssignmentBulkPatchSchema],
+    db_session: SessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """Partially update many assignments; each item carries the `id` it changes."""
+    validate_transaction_access(db_session, current_user, op.OP_1010002.value)
+    logger.info(
+        "Bulk patch assignments count=%s by user=%s ip=%s",
+        len(assignments),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    rows = [
+        {**item.model_dump(exclude_unset=True, exclude_none=True), **audit}
+        for item in assignments
+    ]
+    results = controller.bulk_partial_update(db_session, rows)
+    return bulk_response(results, "ASSIGNMENT", HTTP_STATUS.HTTP_200_OK)
+
+
+@router.post(
+    "/bulk/delete",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def delete_assignments_bulk(
+    ids: BulkBody[int], db_session: SessionDep, current_user: CurrentUser
+):
+    """Delete many assignments by ID."""
+    validate_transaction_access(db_session, current_user, op.OP_1010004.value)
+    logger.info(
+        "Bulk delete assignments count=%s by user=%s", len(ids), current_user.username
+    )
+    results = controller.bulk_delete(db_session, ids)
+    return bulk_response(results, "ASSIGNMENT", HTTP_STATUS.HTTP_200_OK)
+
+
 @router.put(
     "/{assignment_id}",
     status_code=HTTP_STATUS.HTTP_200_OK,
@@ -158,6 +259,49 @@ def update_assignment(
     return new_assignment
 
 
+@router.patch(
+    "/{assignment_id}",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=AssignmentSchema,
+)
+def patch_assignment(
+    assignment_id: int,
+    assignment: AssignmentPatchSchema,
+    db_session: SessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """Partially update an existing assignment."""
+    validate_transaction_access(db_session, current_user, op.OP_1010002.value)
+
+    values = assignment.model_dump(exclude_unset=True, exclude_none=True)
+    logger.info(
+        "Patch assignment id=%s fields=%s by user=%s ip=%s",
+        assignment_id,
+        sorted(values),
+        current_user.username,
+        get_client_ip(request),
+    )
+    values["audit_user_ip"] = get_client_ip(request)
+    values["audit_user_login"] = current_user.username
+
+    try:
+        updated = controller.partial_update(db_session, assignment_id, values)
+        logger.info("Assignment patched id=%s", assignment_id)
+        return updated
+    except ObjectNotFoundException as ex:
+        logger.warning("Assignment patch failed id=%s: %s", assignment_id, ex.args[0])
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_404_NOT_FOUND, detail=ex.args[0]
+        ) from ex
+    except IntegrityValidationException as ex:
+        logger.warning("Assignment patch failed id=%s: %s", assignment_id, ex.args[0])
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_400_BAD_REQUEST,
+            detail="Object ASSIGNMENT was not accepted",
+        ) from ex
+
+
 @router.delete(
     "/{assignment_id}",
     status_code=HTTP_STATUS.HTTP_200_OK,
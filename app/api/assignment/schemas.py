@@ -2,7 +2,11 @@
 
 from pydantic import BaseModel
 
-from app.utils.base_schemas import BaseAuditDTOSchema, BaseAuditModelSchema
+from app.utils.base_schemas import (
+    BaseAuditDTOSchema,
+    BaseAuditModelSchema,
+    CursorPageSchema,
+)
 
 
 class AssignmentDTOSchema(BaseAuditDTOSchema):
@@ -14,13 +18,26 @@ class AssignmentDTOSchema(BaseAuditDTOSchema):
     role_id: int
 
 
+class AssignmentPatchSchema(BaseModel):
+    """Represents a partial update of an Assignment; only sent fields are changed."""
+
+    user_id: int | None = None
+    role_id: int | None = None
+
+
+class AssignmentBulkPatchSchema(AssignmentPatchSchema):
+    """Represents one item of a bulk partial update of Assignments, by `id`."""
+
+    id: int
+
+
 class AssignmentSchema(AssignmentDTOSchema, BaseAuditModelSchema):
     """Schema representing an Assignment with audit fields."""
 
     id: int
 
 
-class AssignmentListSchema(BaseModel):
+class AssignmentListSchema(CursorPageSchema):
     """Schema representing a list of Assignments."""
 
     assignments: list[AssignmentSchema]
@@ -0,0 +1,105 @@
+"""Async variant of the principal resolution, for an AsyncSession (DB_ASYNC)."""
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.api_key.controller import api_key_identity_query
+from app.api.authentication.controller import (
+    OAuth2Token,
+    api_key_controller,
+    cached_user_id,
+    decode_token_data,
+)
+from app.api.authentication.principal import Principal
+from app.api.authentication.schemas import TokenData
+from app.api.authentication.user_cache import current_user_cache
+from app.api.authorization.async_controller import (
+    current_permissions_version_async,
+    get_user_permission_mask_async,
+)
+from app.database.session import get_async_session
+from app.models.user import User
+from app.utils.exceptions import CredentialsValidationException
+from app.utils.logging import get_logger
+from app.utils.security import split_api_key
+from app.utils.settings import get_settings
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+
+logger = get_logger("authentication.async_controller")
+
+
+async def resolve_api_key_principal_async(
+    db_session: AsyncSession, api_key: str
+) -> Principal:
+    """Resolve an API key into a Principal with its user's permissions."""
+    prefix, secret = split_api_key(api_key)
+    row = (await db_session.execute(api_key_identity_query(prefix))).first()
+    identity = api_key_controller.identity_from_row(prefix, secret, row)
+    if identity is None:
+        raise CredentialsValidationException()
+
+    user_id, username = identity
+    mask = await get_user_permission_mask_async(db_session, user_id)
+    return Principal(user_id, username, mask)
+
+
+async def _resolve_user_id_async(db_session: AsyncSession, tokendata: TokenData) -> int:
+    """Confirm the token subject still exists and return its id."""
+    if tokendata.user_id is not None:
+        db_user = await db_session.get(User, tokendata.user_id)
+        # The username guards against a deleted user whose id was reused.
+        if db_user is not None and db_user.username == tokendata.username:
+            return db_user.id
+    else:
+        user_id = await db_session.scalar(
+            select(User.id).where(User.username == tokendata.username)
+        )
+        if user_id is not None:
+            return user_id
+
+    logger.warning("Token subject not found username=%s", tokendata.username)
+    raise CredentialsValidationException()
+
+
+async def _resolve_permission_mask_async(
+    db_session: AsyncSession, user_id: int, tokendata: TokenData
+) -> int:
+    """Use the token's permission claims unless their version is outdated."""
+    if (
+        get_settings().SECURITY_TOKEN_PERMISSION_CLAIMS
+        and tokendata.permissions is not None
+        and tokendata.permissions_version
+        == await current_permissions_version_async(db_session)
+    ):
+        return tokendata.permissions
+
+    return await get_user_permission_mask_async(db_session, user_id)
+
+
+async def get_current_user_async(
+    db_session: AsyncSessionDep, token: OAuth2Token
+) -> Principal:
+    """
+    Resolve the bearer credential into a Principal on the request's AsyncSession.
+
+    Same caches and rules as get_current_user; every query is awaited, so the
+    event loop keeps serving other requests meanwhile.
+    """
+    if split_api_key(token) is not None:
+        return await resolve_api_key_principal_async(db_session, token)
+
+    tokendata = decode_token_data(token)
+    user_id = cached_user_id(tokendata)
+    if user_id is None:
+        user_id = await _resolve_user_id_async(db_session, tokendata)
+        current_user_cache.set(tokendata.username, user_id)
+
+    return Principal(
+        user_id,
+        tokendata.username,
+        await _resolve_permission_mask_async(db_session, user_id, tokendata),
+    )
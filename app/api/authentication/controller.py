@@ -6,20 +6,39 @@ import jwt
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 
+from app.api.api_key.controller import ApiKeyController
+from app.api.authentication.principal import Principal
+from app.api.authentication.refresh_token import (
+    issue_refresh_token,
+    rotate_refresh_token,
+)
 from app.api.authentication.schemas import TokenData
+from app.api.authentication.user_cache import (
+    current_user_cache,
+    unknown_username_cache,
+)
+from app.api.authorization.controller import get_user_permission_mask
+from app.api.authorization.permission_cache import current_permissions_version
 from app.api.user.controller import UserController
 from app.database.session import Session, get_session
 from app.models.user import User
 from app.utils.exceptions import (
     CredentialsValidationException,
+    HashingCapacityException,
     IncorrectCredentialException,
+    ObjectNotFoundException,
+    UnknownUsernameException,
 )
 from app.utils.logging import get_logger
 from app.utils.security import (
     create_access_token,
-    extract_username,
+    decode_access_token,
+    get_password_hash,
+    password_needs_rehash,
+    split_api_key,
     verify_password,
 )
+from app.utils.settings import get_settings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
@@ -27,43 +46,218 @@ SessionDep = Annotated[Session, Depends(get_session)]
 OAuth2Token = Annotated[str, Depends(oauth2_scheme)]
 
 user_controller = UserController()
+api_key_controller = ApiKeyController()
 logger = get_logger("authentication.controller")
 
+USER_ID_CLAIM = "uid"
+PERMISSIONS_CLAIM = "perms"
+PERMISSIONS_VERSION_CLAIM = "pv"
+
+
+def build_token_claims(db_session: Session, db_user: User) -> dict:
+    """
+    Build the access token claims for a user.
+
+    The token carries the user id next to the username, so the user can be
+    resolved by primary key. With SECURITY_TOKEN_PERMISSION_CLAIMS enabled
+    the token also carries the user's permission mask (hex encoded) and the
+    permissions version it was resolved at, so authorization checks can skip
+    the database.
+    """
+    claims = {"sub": db_user.username, USER_ID_CLAIM: db_user.id}
+    if get_settings().SECURITY_TOKEN_PERMISSION_CLAIMS:
+        # Read the version first: a concurrent write can only make it older.
+        version = current_permissions_version(db_session, use_cache=False)
+        mask = get_user_permission_mask(db_session, db_user.id, use_cache=False)
+        claims[PERMISSIONS_CLAIM] = format(mask, "x")
+        claims[PERMISSIONS_VERSION_CLAIM] = version
+    return claims
+
+
+def token_data_from_claims(payload: dict) -> TokenData:
+    """Map verified JWT claims into TokenData."""
+    tokendata = TokenData(username=payload.get("sub") or None)
+    user_id = payload.get(USER_ID_CLAIM)
+    if isinstance(user_id, int) and not isinstance(user_id, bool):
+        tokendata.user_id = user_id
+    permissions = payload.get(PERMISSIONS_CLAIM)
+    version = payload.get(PERMISSIONS_VERSION_CLAIM)
+    if isinstance(permissions, str) and isinstance(version, int):
+        try:
+            tokendata.permissions = int(permissions, 16)
+            tokendata.permissions_version = version
+        except ValueError:
+            logger.warning("Token carries malformed permission claims")
+    return tokendata
+
+
+def _rehash_password(db_session: Session, db_user: User, password: str) -> None:
+    """Store the password again with the configured bcrypt cost."""
+    try:
+        db_user.password = get_password_hash(password)
+        db_session.commit()
+        logger.info("Password rehashed username=%s", db_user.username)
+    except HashingCapacityException:
+        # The old hash is still valid; retry on a later login.
+        logger.warning("Password rehash skipped username=%s", db_user.username)
+
 
 def execute_user_login(db_session: SessionDep, username: str, password: str) -> dict:
-    """Authenticate user and return JWT token."""
+    """
+    Authenticate user and return JWT token.
+
+    Unknown usernames raise UnknownUsernameException right away; the caller
+    spends the verify time (`spend_password_verify_time`) before answering.
+    """
     logger.info("Authenticating username=%s", username)
+    if unknown_username_cache.get(username):
+        logger.warning("Authentication failed: unknown username=%s", username)
+        raise UnknownUsernameException()
+
     db_user = user_controller.get_user_by_username(db_session, username)
 
     if not db_user:
         logger.warning("Authentication failed: user not found username=%s", username)
-        raise IncorrectCredentialException()
+        unknown_username_cache.set(username, True)
+        raise UnknownUsernameException()
 
     if not verify_password(password, db_user.password):
         logger.warning("Authentication failed: invalid password username=%s", username)
         raise IncorrectCredentialException()
 
-    token = create_access_token(data={"sub": db_user.username})
+    if password_needs_rehash(db_user.password):
+        _rehash_password(db_session, db_user, password)
+
+    token = create_access_token(data=build_token_claims(db_session, db_user))
+    refresh_token = issue_refresh_token(db_session, db_user.id)
+    db_session.commit()
     logger.info("Authentication success username=%s", username)
 
-    return {"access_token": token, "token_type": "bearer"}
+    return {
+        "access_token": token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
+
+
+def execute_token_refresh(db_session: SessionDep, refresh_token: str) -> dict:
+    """Rotate the refresh token and return a new token pair, without bcrypt."""
+    db_user, new_refresh_token = rotate_refresh_token(db_session, refresh_token)
+    token = create_access_token(data=build_token_claims(db_session, db_user))
+    username = db_user.username
+    # Committed once the claims are built, as the login does.
+    db_session.commit()
+    logger.info("Token refreshed username=%s", username)
+
+    return {
+        "access_token": token,
+        "token_type": "bearer",
+        "refresh_token": new_refresh_token,
+    }
+
+
+def _resolve_permission_mask(
+    db_session: Session, user_id: int, tokendata: TokenData
+) -> int:
+    """
+    Use the token's permission claims unless their version is outdated.
+
+    The version only moves while SECURITY_TOKEN_PERMISSION_CLAIMS is enabled,
+    so claims are ignored once the setting is turned off.
+    """
+    if (
+        get_settings().SECURITY_TOKEN_PERMISSION_CLAIMS
+        and tokendata.permissions is not None
+        and tokendata.permissions_version == current_permissions_version(db_session)
+    ):
+        return tokendata.permissions
+
+    return get_user_permission_mask(db_session, user_id)
 
 
-async def get_current_user(dbsession: SessionDep, token: OAuth2Token) -> User:
-    tokendata = TokenData()
+def resolve_api_key_principal(dbsession: Session, api_key: str) -> Principal:
+    """Resolve an API key into a Principal with its user's permissions."""
+    identity = api_key_controller.authenticate(dbsession, api_key)
+    if identity is None:
+        raise CredentialsValidationException()
+
+    user_id, username = identity
+    return Principal(user_id, username, get_user_permission_mask(dbsession, user_id))
+
+
+def _resolve_user_id(dbsession: Session, tokendata: TokenData) -> int:
+    """
+    Confirm the token subject still exists and return its id.
+
+    Tokens with a user id claim are resolved by primary key through the
+    identity map; older tokens fall back to the username lookup.
+    """
+    if tokendata.user_id is not None:
+        db_user = user_controller.get_user_identity(dbsession, tokendata.user_id)
+        # The username guards against a deleted user whose id was reused.
+        if db_user is not None and db_user.username == tokendata.username:
+            return db_user.id
+    else:
+        user_id = user_controller.get_user_id_by_username(dbsession, tokendata.username)
+        if user_id is not None:
+            return user_id
+
+    logger.warning("Token subject not found username=%s", tokendata.username)
+    raise CredentialsValidationException()
+
+
+def decode_token_data(token: str) -> TokenData:
+    """Verify an access token and map its claims, or raise 401."""
     try:
-        username = extract_username(token)
-        if not username:
-            logger.warning("Token missing subject")
-            raise CredentialsValidationException()
-        tokendata.username = username
+        tokendata = token_data_from_claims(decode_access_token(token))
     except jwt.PyJWTError as ex:
         logger.warning("Token decode failed")
         raise CredentialsValidationException() from ex
+    if not tokendata.username:
+        logger.warning("Token missing subject")
+        raise CredentialsValidationException()
+    return tokendata
 
-    db_user = user_controller.get_user_by_username(dbsession, tokendata.username)
 
-    if db_user is None:
-        logger.warning("Token subject not found username=%s", tokendata.username)
-        raise CredentialsValidationException()
-    return db_user
+def cached_user_id(tokendata: TokenData) -> int | None:
+    """User id of the token subject from the cache, unless it disagrees with `uid`."""
+    user_id = current_user_cache.get(tokendata.username)
+    if tokendata.user_id is not None and user_id != tokendata.user_id:
+        return None
+    return user_id
+
+
+def get_current_user(dbsession: SessionDep, token: OAuth2Token) -> Principal:
+    """
+    Resolve the bearer credential into a Principal, without loading the ORM User.
+
+    Accepts access tokens and API keys (`fak_...`). A plain function, so its
+    queries run in the threadpool; `get_current_user_async` resolves the
+    principal on an AsyncSession.
+    """
+    if split_api_key(token) is not None:
+        return resolve_api_key_principal(dbsession, token)
+
+    tokendata = decode_token_data(token)
+    user_id = cached_user_id(tokendata)
+    if user_id is None:
+        user_id = _resolve_user_id(dbsession, tokendata)
+        current_user_cache.set(tokendata.username, user_id)
+
+    return Principal(
+        user_id,
+        tokendata.username,
+        _resolve_permission_mask(dbsession, user_id, tokendata),
+    )
+
+
+CurrentPrincipal = Annotated[Principal, Depends(get_current_user)]
+
+
+def get_current_user_model(dbsession: SessionDep, principal: CurrentPrincipal) -> User:
+    """Load the ORM User of the principal, for handlers that need the entity."""
+    try:
+        return user_controller.get(dbsession, principal.id)
+    except ObjectNotFoundException as ex:
+        logger.warning("Principal not found user_id=%s", principal.id)
+        raise CredentialsValidationException() from ex
@@ -0,0 +1,38 @@
+"""Per-IP and per-username throttling of password logins."""
+
+from app.utils.exceptions import TooManyRequestsException
+from app.utils.logging import get_logger
+from app.utils.rate_limiter import RateLimiter
+from app.utils.settings import get_settings
+
+logger = get_logger("authentication.login_throttle")
+
+login_ip_limiter = RateLimiter(
+    limit=get_settings().SECURITY_LOGIN_RATE_LIMIT_PER_IP,
+    window=get_settings().SECURITY_LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+    maxsize=get_settings().SECURITY_LOGIN_RATE_LIMIT_MAX_KEYS,
+)
+login_username_limiter = RateLimiter(
+    limit=get_settings().SECURITY_LOGIN_RATE_LIMIT_PER_USERNAME,
+    window=get_settings().SECURITY_LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+    maxsize=get_settings().SECURITY_LOGIN_RATE_LIMIT_MAX_KEYS,
+)
+
+
+def enforce_login_rate_limits(client_ip: str, username: str) -> None:
+    """
+    Spend one login attempt for the IP and the username, or raise 429.
+
+    Runs before the user lookup and the bcrypt verify, so a rejected attempt
+    costs a dictionary update. The username is only charged once the IP
+    passes, so one noisy IP cannot drain a username's budget on its own.
+    """
+    retry_after = login_ip_limiter.hit(client_ip)
+    if retry_after:
+        logger.warning("Login throttled ip=%s", client_ip)
+        raise TooManyRequestsException(retry_after)
+
+    retry_after = login_username_limiter.hit(username)
+    if retry_after:
+        logger.warning("Login throttled username=%s ip=%s", username, client_ip)
+        raise TooManyRequestsException(retry_after)
@@ -0,0 +1,57 @@
+"""Principal resolved from the access token for the current request."""
+
+from app.api.transaction.enum_operation_code import mask_grants, op_codes_from_mask
+
+
+class Principal:
+    """
+    Represents the authenticated caller without loading the ORM User.
+
+    Immutable and slotted so it can be shared through per-worker caches.
+    `permission_mask` only holds op codes granted through exactly one
+    authorization; anything else must be checked against the database.
+    """
+
+    __slots__ = ("id", "username", "permission_mask")
+
+    id: int
+    username: str
+    permission_mask: int
+
+    def __init__(self, user_id: int, username: str, permission_mask: int = 0) -> None:
+        object.__setattr__(self, "id", user_id)
+        object.__setattr__(self, "username", username)
+        object.__setattr__(self, "permission_mask", permission_mask)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Principal):
+            return NotImplemented
+        return (self.id, self.username, self.permission_mask) == (
+            other.id,
+            other.username,
+            other.permission_mask,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.username, self.permission_mask))
+
+    def __repr__(self) -> str:
+        return (
+            f"Principal(id={self.id!r}, username={self.username!r}, "
+            f"permission_mask={self.permission_mask:#x})"
+        )
+
+    @property
+    def op_codes(self) -> list[str]:
+        """Op codes granted by the permission mask."""
+        return op_codes_from_mask(self.permission_mask)
+
+    def has_permission(self, op_code: str) -> bool:
+        """Check whether the permission mask grants the op code."""
+        return mask_grants(self.permission_mask, op_code)
@@ -0,0 +1,166 @@
+"""Rotating, revocable refresh tokens stored as keyed hashes."""
+
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import delete, or_, select, update
+
+from app.database.session import Session
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.utils.exceptions import CredentialsValidationException
+from app.utils.logging import get_logger
+from app.utils.security import generate_refresh_token, refresh_token_digest
+from app.utils.settings import get_settings
+from app.utils.timestamps import as_utc
+
+logger = get_logger("authentication.refresh_token")
+
+# Monotonic time after which this worker purges dead refresh tokens again.
+_next_purge_at = 0.0
+
+
+def issue_refresh_token(
+    db_session: Session, user_id: int, family_id: str | None = None
+) -> str:
+    """
+    Add a new refresh token for the user to the session and return it.
+
+    The caller commits. Only the keyed hash is persisted, so the returned
+    value cannot be recovered from the database.
+    """
+    refresh_token = generate_refresh_token()
+    db_session.add(
+        RefreshToken(
+            user_id=user_id,
+            family_id=family_id or uuid4().hex,
+            token_hash=refresh_token_digest(refresh_token),
+            expires_at=datetime.now(UTC)
+            + timedelta(days=get_settings().SECURITY_REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    return refresh_token
+
+
+def _revoke_family(db_session: Session, family_id: str, now: datetime) -> None:
+    db_session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+
+
+def purge_refresh_tokens(db_session: Session, now: datetime | None = None) -> int:
+    """
+    Delete the refresh tokens that can neither be used nor reveal a reuse.
+
+    A row is dead once it expires, or once no token of its family is valid
+    (a revoked family). Rotated rows of a live family are kept: presenting
+    one of them revokes the family. The caller commits.
+    """
+    now = now or datetime.now(UTC)
+    live_families = select(RefreshToken.family_id).where(
+        RefreshToken.revoked_at.is_(None), RefreshToken.expires_at > now
+    )
+    purged = db_session.execute(
+        delete(RefreshToken)
+        .where(
+            or_(
+                RefreshToken.expires_at <= now,
+                RefreshToken.family_id.not_in(live_families),
+            )
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    logger.info("Purged %s dead refresh tokens", purged)
+    return purged
+
+
+def _purge_due() -> bool:
+    """Whether this worker's purge interval elapsed; claims the next one."""
+    global _next_purge_at
+    interval = get_settings().SECURITY_REFRESH_TOKEN_PURGE_INTERVAL_SECONDS
+    now = time.monotonic()
+    if not interval or now < _next_purge_at:
+        return False
+    _next_purge_at = now + interval
+    return True
+
+
+def rotate_refresh_token(db_session: Session, refresh_token: str) -> tuple[User, str]:
+    """
+    Exchange a refresh token for a new one in the same family.
+
+    Returns the user and the new token; the caller commits the rotation.
+    Presenting a token that was already rotated or revoked is treated as theft:
+    the whole family is revoked (and committed). So is a token whose user no
+    longer exists. At most once per SECURITY_REFRESH_TOKEN_PURGE_INTERVAL_SECONDS
+    per worker, the dead tokens are purged in the same transaction.
+    """
+    now = datetime.now(UTC)
+    stored = db_session.execute(
+        select(
+            RefreshToken.id,
+            RefreshToken.user_id,
+            RefreshToken.family_id,
+            RefreshToken.expires_at,
+            RefreshToken.revoked_at,
+        ).where(RefreshToken.token_hash == refresh_token_digest(refresh_token))
+    ).first()
+
+    if stored is None:
+        logger.warning("Refresh failed: unknown token")
+        raise CredentialsValidationException()
+
+    if stored.revoked_at is None and as_utc(stored.expires_at) <= now:
+        logger.warning("Refresh failed: expired token user_id=%s", stored.user_id)
+        raise CredentialsValidationException()
+
+    # Conditional update, so two concurrent refreshes cannot both succeed.
+    rotated = db_session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == stored.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    ).rowcount
+    if not rotated:
+        _revoke_family(db_session, stored.family_id, now)
+        db_session.commit()
+        logger.warning(
+            "Refresh token reuse detected user_id=%s family=%s",
+            stored.user_id,
+            stored.family_id,
+        )
+        raise CredentialsValidationException()
+
+    # The database may not cascade user deletions to their refresh tokens.
+    db_user = db_session.get(User, stored.user_id)
+    if db_user is None:
+        _revoke_family(db_session, stored.family_id, now)
+        db_session.commit()
+        logger.warning("Refresh failed: deleted user_id=%s", stored.user_id)
+        raise CredentialsValidationException()
+
+    new_refresh_token = issue_refresh_token(
+        db_session, stored.user_id, stored.family_id
+    )
+    if _purge_due():
+        purge_refresh_tokens(db_session, now)
+    logger.info("Refresh token rotated user_id=%s", stored.user_id)
+    return db_user, new_refresh_token
+
+
+def revoke_refresh_token(db_session: Session, refresh_token: str) -> None:
+    """Revoke the token's whole family; unknown tokens are ignored."""
+    family_id = db_session.scalar(
+        select(RefreshToken.family_id).where(
+            RefreshToken.token_hash == refresh_token_digest(refresh_token)
+        )
+    )
+    if family_id is None:
+        logger.info("Revoke ignored: unknown refresh token")
+        return
+
+    _revoke_family(db_session, family_id, datetime.now(UTC))
+    db_session.commit()
+    logger.info("Refresh token family revoked family=%s", family_id)
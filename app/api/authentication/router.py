@@ -2,32 +2,92 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.api.authentication.controller import execute_user_login
-from app.api.authentication.schemas import AccessToken
+from app.api.authentication.controller import (
+    execute_token_refresh,
+    execute_user_login,
+    get_current_user,
+)
+from app.api.authentication.login_throttle import enforce_login_rate_limits
+from app.api.authentication.principal import Principal
+from app.api.authentication.refresh_token import revoke_refresh_token
+from app.api.authentication.schemas import (
+    AccessToken,
+    AuthCacheStatsSchema,
+    RefreshTokenRequest,
+)
+from app.api.authentication.user_cache import current_user_cache
 from app.database.session import Session, get_session
-from app.utils.exceptions import IncorrectCredentialException
+from app.utils.base_schemas import SimpleMessageSchema
+from app.utils.client_ip import get_client_ip
+from app.utils.exceptions import (
+    IncorrectCredentialException,
+    UnknownUsernameException,
+)
 from app.utils.logging import get_logger
+from app.utils.security import spend_password_verify_time, verified_token_cache
+from app.utils.signing_keys import get_signing_keys
 
 router = APIRouter()
 logger = get_logger(__name__)
 
 SessionDep = Annotated[Session, Depends(get_session)]
 OAuth2Form = Annotated[OAuth2PasswordRequestForm, Depends()]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
 @router.post("/token", response_model=AccessToken)
-def login_for_access_token(form_data: OAuth2Form, db_session: SessionDep) -> dict:
+async def login_for_access_token(
+    form_data: OAuth2Form, db_session: SessionDep, request: Request
+) -> dict:
     """Endpoint to obtain JWT token."""
+    enforce_login_rate_limits(get_client_ip(request), form_data.username)
     try:
         logger.info("Login attempt for username=%s", form_data.username)
-        return execute_user_login(db_session, form_data.username, form_data.password)
+        # The lookup and bcrypt block, keep them off the event loop.
+        return await run_in_threadpool(
+            execute_user_login, db_session, form_data.username, form_data.password
+        )
     except IncorrectCredentialException as ex:
+        if isinstance(ex, UnknownUsernameException):
+            await spend_password_verify_time()
         logger.warning(
             "Login failed for username=%s: %s",
             form_data.username,
             ex.args[0],
         )
         raise HTTPException(status_code=400, detail=ex.args[0]) from ex
+
+
+@router.post("/refresh", response_model=AccessToken)
+def refresh_access_token(body: RefreshTokenRequest, db_session: SessionDep) -> dict:
+    """Exchange a refresh token for a new access token and refresh token."""
+    logger.info("Token refresh attempt")
+    return execute_token_refresh(db_session, body.refresh_token)
+
+
+@router.post("/revoke", response_model=SimpleMessageSchema)
+def revoke_token(body: RefreshTokenRequest, db_session: SessionDep) -> dict:
+    """Revoke a refresh token and every token rotated from the same login."""
+    revoke_refresh_token(db_session, body.refresh_token)
+    return {"detail": "Refresh token revoked"}
+
+
+@router.get("/.well-known/jwks.json")
+def get_jwks(response: Response) -> dict:
+    """Public keys that verify our access tokens (empty for HS256)."""
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return get_signing_keys().jwks
+
+
+@router.get("/cache-stats", response_model=AuthCacheStatsSchema)
+def get_auth_cache_stats(current_user: CurrentUser) -> dict:
+    """Hit/miss counters of this worker's token and current user caches."""
+    logger.info("Auth cache stats requested by user=%s", current_user.username)
+    return {
+        "verified_tokens": verified_token_cache.stats(),
+        "current_users": current_user_cache.stats(),
+    }
@@ -10,6 +10,15 @@ class AccessToken(BaseModel):
 
     access_token: str
     token_type: str
+    refresh_token: str | None = None
+
+
+class RefreshTokenRequest(BaseModel):
+    """
+    Represents a refresh token sent to be rotated or revoked.
+    """
+
+    refresh_token: str
 
 
 class TokenData(BaseModel):
@@ -18,3 +27,25 @@ class TokenData(BaseModel):
     """
 
     username: str | None = None
+    user_id: int | None = None
+    permissions: int | None = None
+    permissions_version: int | None = None
+
+
+class CacheStatsSchema(BaseModel):
+    """
+    Represents the size and hit/miss counters of a per-worker cache.
+    """
+
+    size: int
+    hits: int
+    misses: int
+
+
+class AuthCacheStatsSchema(BaseModel):
+    """
+    Represents the authentication caches of the worker serving the request.
+    """
+
+    verified_tokens: CacheStatsSchema
+    current_users: CacheStatsSchema
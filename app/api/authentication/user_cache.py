@@ -0,0 +1,74 @@
+"""Per-worker caches of authenticated and unknown users, invalidated by writes."""
+
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.database.write_tracking import Written, track_writes
+from app.models.user import User
+from app.utils.logging import get_logger
+from app.utils.settings import get_settings
+from app.utils.ttl_cache import TTLCache
+
+logger = get_logger("authentication.user_cache")
+
+_USERS_DIRTY_KEY = "users_dirty"
+_USERNAMES_WRITTEN_KEY = "usernames_written"
+# Bind name of the username in a compiled UPDATE ... VALUES.
+_USERNAME_COLUMN = User.username.property.columns[0].key
+
+# User ids of authenticated users keyed by username.
+current_user_cache = TTLCache(
+    maxsize=get_settings().SECURITY_TOKEN_CACHE_MAX_ENTRIES,
+    ttl=get_settings().SECURITY_TOKEN_CACHE_TTL_SECONDS,
+)
+
+# Usernames that matched no user at login. Other workers only learn about a
+# new user once their entry expires, so keep the TTL short.
+unknown_username_cache = TTLCache(
+    maxsize=get_settings().SECURITY_UNKNOWN_USERNAME_CACHE_MAX_ENTRIES,
+    ttl=get_settings().SECURITY_UNKNOWN_USERNAME_CACHE_TTL_SECONDS,
+)
+
+
+def _track_user_writes(session: Session, written: Written) -> None:
+    """Flag the session and remember the usernames its user writes set."""
+    session.info[_USERS_DIRTY_KEY] = True
+    usernames = _written_usernames(session, written)
+    if usernames:
+        session.info.setdefault(_USERNAMES_WRITTEN_KEY, set()).update(usernames)
+
+
+def _written_usernames(session: Session, written: Written) -> set[str]:
+    """Usernames set by flushed users, or by an INSERT/UPDATE statement."""
+    if not isinstance(written, ORMExecuteState):
+        return {obj.username for obj in written if obj not in session.deleted}
+
+    state = written
+    if state.is_delete:
+        return set()
+    parameters = state.parameters
+    if parameters:
+        rows = parameters if isinstance(parameters, list) else [parameters]
+        return {row["username"] for row in rows if row.get("username")}
+    if state.is_update:
+        # update(User).values(...): the values live in the statement.
+        username = state.statement.compile().params.get(_USERNAME_COLUMN)
+        return {username} if username else set()
+    return set()
+
+
+def _invalidate_on_commit(session: Session) -> None:
+    """Drop cached users once a user write is committed."""
+    if session.info.pop(_USERS_DIRTY_KEY, False):
+        current_user_cache.clear()
+        logger.info("Current user cache invalidated")
+    for username in session.info.pop(_USERNAMES_WRITTEN_KEY, ()):
+        unknown_username_cache.invalidate(username)
+
+
+def _discard_on_rollback(session: Session) -> None:
+    """Rolled back writes never reached the database."""
+    session.info.pop(_USERS_DIRTY_KEY, None)
+    session.info.pop(_USERNAMES_WRITTEN_KEY, None)
+
+
+track_writes((User,), _track_user_writes, _invalidate_on_commit, _discard_on_rollback)
@@ -0,0 +1,99 @@
+"""Async variant of the authorization controller, for an AsyncSession."""
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.authentication.principal import Principal
+from app.api.authorization.controller import (
+    authorized_transactions_query,
+    check_granted_count,
+    granted_by_mask,
+    permission_mask_query,
+)
+from app.api.authorization.permission_cache import (
+    VERSION_CACHE_KEY,
+    permission_cache,
+    version_query,
+)
+from app.api.transaction.enum_operation_code import permission_mask
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.utils.logging import get_logger
+
+logger = get_logger("authorization.async_controller")
+
+
+async def validate_transaction_access_async(
+    db_session: AsyncSession,
+    current_user: Principal | User,
+    op_code: str,
+    user_permission_mask: int | None = None,
+) -> None:
+    """
+    Validate if the current user has access to the specified operation code.
+
+    Same rules, cache and exceptions as validate_transaction_access; only the
+    authorization count query is awaited.
+    """
+    if granted_by_mask(current_user, op_code, user_permission_mask):
+        return
+
+    cache_key = (current_user.id, op_code)
+    granted_count = permission_cache.get(cache_key)
+    if granted_count is None:
+        query = authorized_transactions_query(
+            select(func.count(Transaction.id)), current_user.id, op_code
+        )
+        granted_count = await db_session.scalar(query) or 0
+        permission_cache.set(cache_key, granted_count)
+
+    check_granted_count(current_user.id, op_code, granted_count)
+
+
+async def get_user_authorized_transactions_async(
+    db_session: AsyncSession, user_id: int, op_code: str | None = None
+) -> list[Transaction]:
+    """
+    Retrieve transactions authorized for a specific user,
+    optionally filtered by operation code.
+    """
+    query = authorized_transactions_query(select(Transaction), user_id, op_code)
+
+    transactions: list[Transaction] = list((await db_session.scalars(query)).all())
+    logger.info(
+        "Authorized transactions user_id=%s op_code=%s count=%s",
+        user_id,
+        op_code,
+        len(transactions),
+    )
+    return transactions
+
+
+async def get_user_permission_mask_async(
+    db_session: AsyncSession, user_id: int, use_cache: bool = True
+) -> int:
+    """Resolve every op code granted to the user into a single permission mask."""
+    cache_key = ("mask", user_id)
+    if use_cache:
+        mask = permission_cache.get(cache_key)
+        if mask is not None:
+            return mask
+
+    mask = permission_mask(await db_session.scalars(permission_mask_query(user_id)))
+    permission_cache.set(cache_key, mask)
+    logger.info("Permission mask user_id=%s mask=%#x", user_id, mask)
+    return mask
+
+
+async def current_permissions_version_async(
+    db_session: AsyncSession, use_cache: bool = True
+) -> int:
+    """Return the permissions version, cached for the permission cache TTL."""
+    if use_cache:
+        version = permission_cache.get(VERSION_CACHE_KEY)
+        if version is not None:
+            return version
+
+    version = await db_session.scalar(version_query()) or 0
+    permission_cache.set(VERSION_CACHE_KEY, version)
+    return version
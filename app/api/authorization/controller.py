@@ -1,8 +1,12 @@
 """Controller for handling authorization logic."""
 
-from sqlalchemy import Select, and_, select
+from sqlalchemy import Select, and_, func, select
 
+from app.api.authentication.principal import Principal
+from app.api.authorization.permission_cache import permission_cache
+from app.api.transaction.enum_operation_code import mask_grants, permission_mask
 from app.api.user.controller import UserController
+from app.database.replicas import PRIMARY_READ
 from app.database.session import Session
 from app.models.assignment import Assignment
 from app.models.authorization import Authorization
@@ -21,53 +25,95 @@ logger = get_logger("authorization.controller")
 
 
 def validate_transaction_access(
-    db_session: Session, current_user: User, op_code: str
+    db_session: Session,
+    current_user: Principal | User,
+    op_code: str,
+    user_permission_mask: int | None = None,
 ) -> None:
-    """Validate if the current user has access to the specified operation code."""
+    """
+    Validate if the current user has access to the specified operation code.
+
+    Op codes granted by the permission mask (given, or carried by the
+    Principal) are accepted with a single AND. Any other op code goes through
+    the cached authorization count, which also reports denials and ambiguous
+    authorizations.
+    """
+    if granted_by_mask(current_user, op_code, user_permission_mask):
+        return
+
+    cache_key = (current_user.id, op_code)
+    granted_count = permission_cache.get(cache_key)
+    if granted_count is None:
+        granted_count = _count_authorized_transactions(
+            db_session, current_user.id, op_code
+        )
+        permission_cache.set(cache_key, granted_count)
+
+    check_granted_count(current_user.id, op_code, granted_count)
+
+
+def granted_by_mask(
+    current_user: Principal | User | None,
+    op_code: str,
+    user_permission_mask: int | None = None,
+) -> bool:
+    """Check the user and whether its permission mask alone grants the op code."""
     if not current_user:
         logger.warning("Access validation failed: missing current user")
         raise CredentialsValidationException()
 
-    transactions = get_user_authorized_transactions(
-        db_session, current_user.id, op_code
-    )
-    if not transactions:
+    if user_permission_mask is None:
+        user_permission_mask = getattr(current_user, "permission_mask", None)
+
+    if user_permission_mask is not None and mask_grants(user_permission_mask, op_code):
+        logger.info(
+            "Access granted by mask user_id=%s op_code=%s", current_user.id, op_code
+        )
+        return True
+    return False
+
+
+def check_granted_count(user_id: int, op_code: str, granted_count: int) -> None:
+    """Raise unless exactly one authorization grants the op code."""
+    if not granted_count:
         logger.warning(
             "Access denied user_id=%s op_code=%s",
-            current_user.id,
+            user_id,
             op_code,
         )
-        raise IllegalAccessException(current_user.id, op_code)
+        raise IllegalAccessException(user_id, op_code)
 
-    if len(transactions) > 1:
+    if granted_count > 1:
         logger.warning(
             "Access ambiguous user_id=%s op_code=%s count=%s",
-            current_user.id,
+            user_id,
             op_code,
-            len(transactions),
+            granted_count,
         )
-        raise AmbiguousAuthorizationException(current_user.id, op_code)
+        raise AmbiguousAuthorizationException(user_id, op_code)
+    logger.info("Access granted user_id=%s op_code=%s", user_id, op_code)
 
-    if transactions[0].operation_code != op_code:
-        logger.warning(
-            "Access mismatch user_id=%s expected=%s actual=%s",
-            current_user.id,
-            op_code,
-            transactions[0].operation_code,
-        )
-        raise IllegalAccessException(current_user.id, transactions[0].operation_code)
-    logger.info("Access granted user_id=%s op_code=%s", current_user.id, op_code)
 
+def _count_authorized_transactions(
+    db_session: Session, user_id: int, op_code: str
+) -> int:
+    """Count the authorizations granting ``op_code`` to the user."""
+    query = authorized_transactions_query(
+        select(func.count(Transaction.id)), user_id, op_code
+    )
+    return db_session.scalar(query, bind_arguments=PRIMARY_READ) or 0
 
-def get_user_authorized_transactions(
-    db_session: Session, user_id: int, op_code: str | None = None
-) -> list[Transaction]:
-    """
-    Retrieve transactions authorized for a specific user,
-    optionally filtered by operation code.
-    """
-    query: Select = (
-        select(Transaction).join(Authorization).join(Role).join(Assignment).join(User)
+
+def authorized_transactions_query(
+    query: Select, user_id: int, op_code: str | None = None
+) -> Select:
+    """Join the RBAC chain from Transaction up to the given User."""
+    query = (
+        query.select_from(Transaction)
+        .join(Authorization)
+        .join(Role)
+        .join(Assignment)
+        .join(User)
     )
 
     criteria_and = []
@@ -76,7 +122,25 @@ def get_user_authorized_transactions(
     if op_code:
         criteria_and.append(Transaction.operation_code == op_code)
 
-    query = query.filter(and_(*criteria_and))
+    return query.filter(and_(*criteria_and))
+
+
+def permission_mask_query(user_id: int) -> Select:
+    """Op codes granted to the user through exactly one authorization."""
+    query = authorized_transactions_query(
+        select(Transaction.operation_code), user_id
+    ).group_by(Transaction.operation_code)
+    return query.having(func.count(Transaction.id) == 1)
+
+
+def get_user_authorized_transactions(
+    db_session: Session, user_id: int, op_code: str | None = None
+) -> list[Transaction]:
+    """
+    Retrieve transactions authorized for a specific user,
+    optionally filtered by operation code.
+    """
+    query = authorized_transactions_query(select(Transaction), user_id, op_code)
 
     transactions: list[Transaction] = list(db_session.scalars(query).all())
     logger.info(
@@ -86,3 +150,27 @@ def get_user_authorized_transactions(
         len(transactions),
     )
     return transactions
+
+
+def get_user_permission_mask(
+    db_session: Session, user_id: int, use_cache: bool = True
+) -> int:
+    """
+    Resolve every op code granted to the user into a single permission mask.
+
+    Only op codes declared in EnumOperationCode and granted through exactly one
+    authorization have a bit in the mask; ambiguous grants are left to
+    validate_transaction_access to report.
+    """
+    cache_key = ("mask", user_id)
+    if use_cache:
+        mask = permission_cache.get(cache_key)
+        if mask is not None:
+            return mask
+
+    mask = permission_mask(
+        db_session.scalars(permission_mask_query(user_id), bind_arguments=PRIMARY_READ)
+    )
+    permission_cache.set(cache_key, mask)
+    logger.info("Permission mask user_id=%s mask=%#x", user_id, mask)
+    return mask
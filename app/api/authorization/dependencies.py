@@ -0,0 +1,31 @@
+"""FastAPI dependencies fusing authentication and authorization."""
+
+from app.api.authentication.controller import CurrentPrincipal, SessionDep
+from app.api.authentication.principal import Principal
+from app.api.authorization.controller import validate_transaction_access
+from app.api.transaction.enum_operation_code import EnumOperationCode
+
+
+class RequireOp:
+    """
+    Dependency that authenticates the caller and requires an operation code.
+
+    The Principal comes from get_current_user (access token or API key, with
+    its real permission mask), so the op code is usually granted by the mask
+    without another query; the Principal is returned unchanged, or the same
+    exceptions as validate_transaction_access are raised.
+
+    Usage:
+        current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030003))]
+    """
+
+    def __init__(self, op_code: EnumOperationCode | str) -> None:
+        self.op_code = (
+            op_code.value if isinstance(op_code, EnumOperationCode) else op_code
+        )
+
+    def __call__(
+        self, db_session: SessionDep, current_user: CurrentPrincipal
+    ) -> Principal:
+        validate_transaction_access(db_session, current_user, self.op_code)
+        return current_user
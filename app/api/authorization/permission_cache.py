@@ -0,0 +1,94 @@
+"""Per-worker cache of permission checks with write-driven invalidation."""
+
+from sqlalchemy import Select, select, update
+from sqlalchemy.orm import Session
+
+from app.database.replicas import PRIMARY_READ
+from app.database.write_tracking import track_writes
+from app.models.assignment import Assignment
+from app.models.authorization import Authorization
+from app.models.permission_version import (
+    PERMISSION_VERSION_ROW_ID,
+    PermissionVersion,
+)
+from app.models.role import Role
+from app.models.transaction import Transaction
+from app.utils.logging import get_logger
+from app.utils.settings import get_settings
+from app.utils.ttl_cache import TTLCache
+
+logger = get_logger("authorization.permission_cache")
+
+# Entities whose writes can change the outcome of a permission check.
+RBAC_MODELS = (Assignment, Authorization, Role, Transaction)
+
+_RBAC_DIRTY_KEY = "rbac_dirty"
+VERSION_CACHE_KEY = "permissions_version"
+
+permission_cache = TTLCache(
+    maxsize=get_settings().PERMISSION_CACHE_MAX_ENTRIES,
+    ttl=get_settings().PERMISSION_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_permissions() -> None:
+    """Drop every cached permission check of this worker."""
+    permission_cache.clear()
+    logger.info("Permission cache invalidated")
+
+
+def version_query() -> Select:
+    return select(PermissionVersion.version).where(
+        PermissionVersion.id == PERMISSION_VERSION_ROW_ID
+    )
+
+
+def current_permissions_version(db_session: Session, use_cache: bool = True) -> int:
+    """Return the permissions version, cached for the permission cache TTL."""
+    if use_cache:
+        version = permission_cache.get(VERSION_CACHE_KEY)
+        if version is not None:
+            return version
+
+    version = db_session.scalar(version_query(), bind_arguments=PRIMARY_READ) or 0
+    permission_cache.set(VERSION_CACHE_KEY, version)
+    return version
+
+
+def mark_rbac_dirty(session: Session) -> None:
+    """
+    Flag the session so the permission cache is dropped on its next commit.
+
+    With SECURITY_TOKEN_PERMISSION_CLAIMS enabled the permissions version is
+    also bumped inside the session's transaction. The version is a single row,
+    so the bump is skipped otherwise to keep RBAC writers from queueing on it.
+    """
+    session.info[_RBAC_DIRTY_KEY] = True
+    if not get_settings().SECURITY_TOKEN_PERMISSION_CLAIMS:
+        return
+
+    # The row is seeded with the table, so concurrent bumps only ever update it.
+    session.connection().execute(
+        update(PermissionVersion)
+        .where(PermissionVersion.id == PERMISSION_VERSION_ROW_ID)
+        .values(version=PermissionVersion.version + 1)
+    )
+
+
+def _invalidate_on_commit(session: Session) -> None:
+    """Invalidate cached permissions once an RBAC write is committed."""
+    if session.info.pop(_RBAC_DIRTY_KEY, False):
+        invalidate_permissions()
+
+
+def _discard_on_rollback(session: Session) -> None:
+    """Rolled back writes never reached the database."""
+    session.info.pop(_RBAC_DIRTY_KEY, None)
+
+
+track_writes(
+    RBAC_MODELS,
+    lambda session, _written: mark_rbac_dirty(session),
+    _invalidate_on_commit,
+    _discard_on_rollback,
+)
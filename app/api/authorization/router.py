@@ -7,22 +7,26 @@ from fastapi import status as HTTP_STATUS
 from sqlalchemy.orm import Session
 
 from app.api.authentication.controller import get_current_user
+from app.api.authentication.principal import Principal
 from app.api.authorization.controller import validate_transaction_access
 from app.api.authorization.schemas import (
+    AuthorizationBulkPatchSchema,
     AuthorizationDTOSchema,
     AuthorizationListSchema,
+    AuthorizationPatchSchema,
     AuthorizationSchema,
 )
 from app.api.transaction.enum_operation_code import EnumOperationCode as op
 from app.database.session import get_session
 from app.models.authorization import Authorization
-from app.models.user import User
-from app.utils.base_schemas import SimpleMessageSchema
+from app.utils.base_schemas import BulkResultSchema, SimpleMessageSchema
+from app.utils.bulk import BulkBody, bulk_response
 from app.utils.client_ip import get_client_ip
 from app.utils.exceptions import (
     IntegrityValidationException,
     ObjectNotFoundException,
 )
+from app.utils.filters import FilterQuery
 from app.utils.generic_controller import GenericController
 from app.utils.logging import get_logger
 
@@ -31,7 +35,7 @@ controller = GenericController(Authorization)
 logger = get_logger("authorization.router")
 
 SessionDep = Annotated[Session, Depends(get_session)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
 @router.post(
@@ -82,17 +86,33 @@ def get_all_authorizations(
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    order_by: str | None = None,
+    filters: FilterQuery = None,
 ):
-    """Get all authorizations with pagination."""
+    """
+    Get all authorizations with pagination.
+
+    Pass `next_cursor` back as `cursor` for the next page.
+
+    Narrow the list with repeated `filter` parameters, e.g.
+    `filter=role_id:eq:1`.
+    """
     validate_transaction_access(db_session, current_user, op.OP_1020003.value)
     logger.info(
-        "List authorizations skip=%s limit=%s by user=%s",
+        "List authorizations skip=%s limit=%s cursor=%s filter=%s order_by=%s "
+        "by user=%s",
         skip,
         limit,
+        cursor,
+        filters,
+        order_by,
         current_user.username,
     )
-    authorizations = controller.get_all(db_session, skip, limit)
-    return {"authorizations": authorizations}
+    page = controller.get_page(
+        db_session, limit, cursor, skip, order_by, filters=filters or ()
+    )
+    return {"authorizations": page.items, "next_cursor": page.next_cursor}
 
 
 @router.get(
@@ -127,6 +147,90 @@ def get_authorization_by_id(
     return authorization
 
 
+@router.post(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def create_authorizations_bulk(
+    authorizations: BulkBody[AuthorizationDTOSchema],
+    db_session: SessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """
+    Create many authorizations in one request.
+
+    Every item gets its own result, in body order; items the database rejects
+    (e.g. a role and transaction pair that already exists) do not stop the others.
+    """
+    validate_transaction_access(db_session, current_user, op.OP_1020001.value)
+    logger.info(
+        "Bulk create authorizations count=%s by user=%s ip=%s",
+        len(authorizations),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    results = controller.bulk_save(
+        db_session, [{**item.model_dump(), **audit} for item in authorizations]
+    )
+    return bulk_response(results, "AUTHORIZATION", HTTP_STATUS.HTTP_201_CREATED)
+
+
+@router.patch(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def patch_authorizations_bulk(
+    authorizations: BulkBody[AuthorizationBulkPatchSchema],
+    db_session: SessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """Partially update many authorizations; each item carries the `id` it changes."""
+    validate_transaction_access(db_session, current_user, op.OP_1020002.value)
+    logger.info(
+        "Bulk patch authorizations count=%s by user=%s ip=%s",
+        len(authorizations),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    rows = [
+        {**item.model_dump(exclude_unset=True, exclude_none=True), **audit}
+        for item in authorizations
+    ]
+    results = controller.bulk_partial_update(db_session, rows)
+    return bulk_response(results, "AUTHORIZATION", HTTP_STATUS.HTTP_200_OK)
+
+
+@router.post(
+    "/bulk/delete",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def delete_authorizations_bulk(
+    ids: BulkBody[int], db_session: SessionDep, current_user: CurrentUser
+):
+    """Delete many authorizations by ID."""
+    validate_transaction_access(db_session, current_user, op.OP_1020004.value)
+    logger.info(
+        "Bulk delete authorizations count=%s by user=%s",
+        len(ids),
+        current_user.username,
+    )
+    results = controller.bulk_delete(db_session, ids)
+    return bulk_response(results, "AUTHORIZATION", HTTP_STATUS.HTTP_200_OK)
+
+
 @router.delete(
     "/{autorization_id}",
     status_code=HTTP_STATUS.HTTP_200_OK,
@@ -201,3 +305,54 @@ def update_authorization(
         raise HTTPException(
             status_code=HTTP_STATUS.HTTP_404_NOT_FOUND, detail=ex.args[0]
         ) from ex
+
+
+@router.patch(
+    "/{autorization_id}",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=AuthorizationSchema,
+)
+def patch_authorization(
+    autorization_id: int,
+    authorization: AuthorizationPatchSchema,
+    db_session: SessionDep,
+    request: Request,
+    current_user: CurrentUser,
+):
+    """Partially update an existing authorization."""
+    validate_transaction_access(db_session, current_user, op.OP_1020002.value)
+
+    values = authorization.model_dump(exclude_unset=True, exclude_none=True)
+    logger.info(
+        "Patch authorization id=%s fields=%s by user=%s ip=%s",
+        autorization_id,
+        sorted(values),
+        current_user.username,
+        get_client_ip(request),
+    )
+    values["audit_user_ip"] = get_client_ip(request)
+    values["audit_user_login"] = current_user.username
+
+    try:
+        updated = controller.partial_update(db_session, autorization_id, values)
+        logger.info("Authorization patched id=%s", autorization_id)
+        return updated
+    except ObjectNotFoundException as ex:
+        logger.warning(
+            "Authorization patch failed id=%s: %s",
+            autorization_id,
+            ex.args[0],
+        )
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_404_NOT_FOUND, detail=ex.args[0]
+        ) from ex
+    except IntegrityValidationException as ex:
+        logger.warning(
+            "Authorization patch failed id=%s: %s",
+            autorization_id,
+            ex.args[0],
+        )
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_400_BAD_REQUEST,
+            detail="Object AUTHORIZATION was not accepted",
+        ) from ex
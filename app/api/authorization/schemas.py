@@ -2,7 +2,11 @@
 
 from pydantic import BaseModel
 
-from app.utils.base_schemas import BaseAuditDTOSchema, BaseAuditModelSchema
+from app.utils.base_schemas import (
+    BaseAuditDTOSchema,
+    BaseAuditModelSchema,
+    CursorPageSchema,
+)
 
 
 class AuthorizationDTOSchema(BaseAuditDTOSchema):
@@ -14,6 +18,23 @@ class AuthorizationDTOSchema(BaseAuditDTOSchema):
     transaction_id: int
 
 
+class AuthorizationPatchSchema(BaseModel):
+    """
+    Authorization Patch Schema; only sent fields are changed.
+    """
+
+    role_id: int | None = None
+    transaction_id: int | None = None
+
+
+class AuthorizationBulkPatchSchema(AuthorizationPatchSchema):
+    """
+    Authorization Bulk Patch Schema; the `id` of the authorization to change.
+    """
+
+    id: int
+
+
 class AuthorizationSchema(AuthorizationDTOSchema, BaseAuditModelSchema):
     """
     Authorization Schema
@@ -22,7 +43,7 @@ class AuthorizationSchema(AuthorizationDTOSchema, BaseAuditModelSchema):
     id: int
 
 
-class AuthorizationListSchema(BaseModel):
+class AuthorizationListSchema(CursorPageSchema):
     """
     Authorization List Schema
     """
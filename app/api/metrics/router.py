@@ -0,0 +1,24 @@
+"""Runtime metrics of this worker, for capacity planning."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi import status as HTTP_STATUS
+
+from app.api.authentication.controller import get_current_user
+from app.api.authentication.principal import Principal
+from app.database.pool import pool_metrics
+
+router = APIRouter()
+
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
+
+
+@router.get("/db-pool", status_code=HTTP_STATUS.HTTP_200_OK)
+def get_db_pool_metrics(current_user: CurrentUser):
+    """
+    Connection pool metrics of every engine in the worker that served the call.
+
+    Each uvicorn worker has its own pools, so sample several times to see all.
+    """
+    return {"pools": [metrics.snapshot() for metrics in pool_metrics.values()]}
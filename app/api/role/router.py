@@ -8,17 +8,25 @@ from sqlalchemy.orm import Session
 from utils.client_ip import get_client_ip
 
 from app.api.authentication.controller import get_current_user
+from app.api.authentication.principal import Principal
 from app.api.authorization.controller import validate_transaction_access
-from app.api.role.schemas import RoleDTOSchema, RoleListSchema, RoleSchema
+from app.api.role.schemas import (
+    RoleBulkPatchSchema,
+    RoleDTOSchema,
+    RoleListSchema,
+    RolePatchSchema,
+    RoleSchema,
+)
 from app.api.transaction.enum_operation_code import EnumOperationCode as op
 from app.database.session import get_session
 from app.models.role import Role
-from app.models.user import User
-from app.utils.base_schemas import SimpleMessageSchema
+from app.utils.base_schemas import BulkResultSchema, SimpleMessageSchema
+from app.utils.bulk import BulkBody, bulk_response
 from app.utils.exceptions import (
     IntegrityValidationException,
     ObjectNotFoundException,
 )
+from app.utils.filters import FilterQuery
 from app.utils.generic_controller import GenericController
 from app.utils.logging import get_logger
 
@@ -27,7 +35,7 @@ role_controller = GenericController(Role)
 logger = get_logger("role.router")
 
 SessionDep = Annotated[Session, Depends(get_session)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
 @router.get(
@@ -48,17 +56,44 @@ def get_all_roles(
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    order_by: str | None = None,
+    filters: FilterQuery = None,
+    search: str | None = None,
 ):
-    """Get all roles with pagination."""
+    """
+    Get all roles with pagination.
+
+    Pass `next_cursor` back as `cursor` for the next page; `order_by` may be
+    `id` (default) or `name`.
+
+    Narrow the list with repeated `filter` parameters, e.g.
+    `filter=name:prefix:Admin`.
+
+    `search` keeps the rows whose `name` contains it, using the search index.
+    """
     validate_transaction_access(db_session, current_user, op.OP_1050003.value)
     logger.info(
-        "List roles skip=%s limit=%s by user=%s",
+        "List roles skip=%s limit=%s cursor=%s filter=%s search=%s order_by=%s "
+        "by user=%s",
         skip,
         limit,
+        cursor,
+        filters,
+        search,
+        order_by,
         current_user.username,
     )
-    roles = role_controller.get_all(db_session, skip, limit)
-    return {"roles": roles}
+    page = role_controller.get_page(
+        db_session,
+        limit,
+        cursor,
+        skip,
+        order_by,
+        filters=filters or (),
+        search=search,
+    )
+    return {"roles": page.items, "next_cursor": page.next_cursor}
 
 
 @router.post("/", status_code=HTTP_STATUS.HTTP_201_CREATED, response_model=RoleSchema)
@@ -94,6 +129,88 @@ def create_role(
     return new_role
 
 
+@router.post(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def create_roles_bulk(
+    roles: BulkBody[RoleDTOSchema],
+    db_session: SessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """
+    Create many roles in one request.
+
+    Every item gets its own result, in body order; items the database rejects
+    (e.g. a duplicated name) do not stop the others.
+    """
+    validate_transaction_access(db_session, current_user, op.OP_1050001.value)
+    logger.info(
+        "Bulk create roles count=%s by user=%s ip=%s",
+        len(roles),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    results = role_controller.bulk_save(
+        db_session, [{**item.model_dump(), **audit} for item in roles]
+    )
+    return bulk_response(results, "ROLE", HTTP_STATUS.HTTP_201_CREATED)
+
+
+@router.patch(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def patch_roles_bulk(
+    roles: BulkBody[RoleBulkPatchSchema],
+    db_session: SessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """Partially update many roles; each item carries the `id` it changes."""
+    validate_transaction_access(db_session, current_user, op.OP_1050002.value)
+    logger.info(
+        "Bulk patch roles count=%s by user=%s ip=%s",
+        len(roles),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    rows = [
+        {**item.model_dump(exclude_unset=True, exclude_none=True), **audit}
+        for item in roles
+    ]
+    results = role_controller.bulk_partial_update(db_session, rows)
+    return bulk_response(results, "ROLE", HTTP_STATUS.HTTP_200_OK)
+
+
+@router.post(
+    "/bulk/delete",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def delete_roles_bulk(
+    ids: BulkBody[int], db_session: SessionDep, current_user: CurrentUser
+):
+    """Delete many roles by ID."""
+    validate_transaction_access(db_session, current_user, op.OP_1050004.value)
+    logger.info(
+        "Bulk delete roles count=%s by user=%s", len(ids), current_user.username
+    )
+    results = role_controller.bulk_delete(db_session, ids)
+    return bulk_response(results, "ROLE", HTTP_STATUS.HTTP_200_OK)
+
+
 @router.put(
     "/{role_id}",
     status_code=HTTP_STATUS.HTTP_200_OK,
@@ -133,6 +250,49 @@ def update_role(
         ) from ex
 
 
+@router.patch(
+    "/{role_id}",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=RoleSchema,
+)
+def patch_role(
+    role_id: int,
+    role: RolePatchSchema,
+    db_session: SessionDep,
+    request: Request,
+    current_user: CurrentUser,
+):
+    """Partially update an existing role."""
+    validate_transaction_access(db_session, current_user, op.OP_1050002.value)
+
+    values = role.model_dump(exclude_unset=True, exclude_none=True)
+    logger.info(
+        "Patch role id=%s fields=%s by user=%s ip=%s",
+        role_id,
+        sorted(values),
+        current_user.username,
+        get_client_ip(request),
+    )
+    values["audit_user_ip"] = get_client_ip(request)
+    values["audit_user_login"] = current_user.username
+
+    try:
+        updated = role_controller.partial_update(db_session, role_id, values)
+        logger.info("Role patched id=%s", role_id)
+        return updated
+    except ObjectNotFoundException as ex:
+        logger.warning("Role patch failed id=%s: %s", role_id, ex.args[0])
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_404_NOT_FOUND, detail=ex.args[0]
+        ) from ex
+    except IntegrityValidationException as ex:
+        logger.warning("Role patch failed id=%s: %s", role_id, ex.args[0])
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_400_BAD_REQUEST,
+            detail="Object ROLE was not accepted",
+        ) from ex
+
+
 @router.delete(
     "/{role_id}",
     status_code=HTTP_STATUS.HTTP_200_OK,
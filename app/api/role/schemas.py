@@ -2,7 +2,11 @@
 
 from pydantic import BaseModel
 
-from app.utils.base_schemas import BaseAuditDTOSchema, BaseAuditModelSchema
+from app.utils.base_schemas import (
+    BaseAuditDTOSchema,
+    BaseAuditModelSchema,
+    CursorPageSchema,
+)
 
 
 class RoleDTOSchema(BaseAuditDTOSchema):
@@ -14,13 +18,26 @@ class RoleDTOSchema(BaseAuditDTOSchema):
     description: str
 
 
+class RolePatchSchema(BaseModel):
+    """Represents a partial update of a Role; only sent fields are changed."""
+
+    name: str | None = None
+    description: str | None = None
+
+
+class RoleBulkPatchSchema(RolePatchSchema):
+    """Represents one item of a bulk partial update of Roles, by `id`."""
+
+    id: int
+
+
 class RoleSchema(RoleDTOSchema, BaseAuditModelSchema):
     """Represents a Role for the system."""
 
     id: int
 
 
-class RoleListSchema(BaseModel):
+class RoleListSchema(CursorPageSchema):
     """Represents a list of Roles for the system."""
 
     roles: list[RoleSchema]
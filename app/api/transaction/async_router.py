@@ -0,0 +1,373 @@
+"""Router for transaction-related operations on the async engine (DB_ASYNC)."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import status as HTTP_STATUS
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.authentication.async_controller import get_current_user_async
+from app.api.authentication.principal import Principal
+from app.api.authorization.async_controller import validate_transaction_access_async
+from app.api.transaction.enum_operation_code import EnumOperationCode as op
+from app.api.transaction.schemas import (
+    TransactionBulkPatchSchema,
+    TransactionDTOSchema,
+    TransactionListSchema,
+    TransactionPatchSchema,
+    TransactionSchema,
+)
+from app.database.session import get_async_session
+from app.models.transaction import Transaction
+from app.utils.async_generic_controller import AsyncGenericController
+from app.utils.base_schemas import BulkResultSchema, SimpleMessageSchema
+from app.utils.bulk import BulkBody, bulk_response
+from app.utils.client_ip import get_client_ip
+from app.utils.exceptions import (
+    IntegrityValidationException,
+    ObjectNotFoundException,
+)
+from app.utils.filters import FilterQuery
+from app.utils.logging import get_logger
+
+router = APIRouter()
+transaction_controller = AsyncGenericController(Transaction)
+logger = get_logger("transaction.async_router")
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+CurrentUser = Annotated[Principal, Depends(get_current_user_async)]
+
+
+@router.post(
+    "/",
+    status_code=HTTP_STATUS.HTTP_201_CREATED,
+    response_model=TransactionSchema,
+)
+async def create_transaction(
+    transaction: TransactionDTOSchema,
+    request: Request,
+    current_user: CurrentUser,
+    db_session: AsyncSessionDep,
+):
+    """Create a new transaction."""
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030001.value
+    )
+    logger.info(
+        "Create transaction op_code=%s by user=%s ip=%s",
+        transaction.operation_code,
+        current_user.username,
+        get_client_ip(request),
+    )
+    new_transaction: Transaction = Transaction(**transaction.model_dump())
+
+    new_transaction.audit_user_login = current_user.username
+    new_transaction.audit_user_ip = get_client_ip(request)
+
+    try:
+        new_transaction = await transaction_controller.save(db_session, new_transaction)
+        logger.info("Transaction created id=%s", new_transaction.id)
+    except IntegrityValidationException as ex:
+        logger.warning("Transaction create failed: %s", ex.args[0])
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_400_BAD_REQUEST,
+            detail="Object TRANSACTION was not accepted",
+        ) from ex
+    return new_transaction
+
+
+@router.get(
+    "/",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=TransactionListSchema,
+)
+async def get_all_transactions(
+    db_session: AsyncSessionDep,
+    current_user: CurrentUser,
+    skip: int = 0,
+    limit: int = 100,
+    op_code: str | None = None,
+    cursor: str | None = None,
+    order_by: str | None = None,
+    filters: FilterQuery = None,
+    search: str | None = None,
+):
+    """
+    Get all transactions, optionally those whose operation code starts with
+    `op_code`.
+
+    Pass `next_cursor` back as `cursor` for the next page; `order_by` may be
+    `id` (default) or `operation_code`.
+
+    Narrow the list with repeated `filter` parameters, e.g.
+    `filter=id:range:100..199`.
+
+    `search` keeps the rows whose `name` contains it, using the search index.
+    """
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030003.value
+    )
+    logger.info(
+        "List transactions skip=%s limit=%s op_code=%s cursor=%s filter=%s search=%s "
+        "by user=%s",
+        skip,
+        limit,
+        op_code,
+        cursor,
+        filters,
+        search,
+        current_user.username,
+    )
+    if op_code:
+        filters = [*(filters or ()), f"operation_code:prefix:{op_code}"]
+
+    page = await transaction_controller.get_page(
+        db_session,
+        limit,
+        cursor,
+        skip,
+        order_by,
+        filters=filters or (),
+        search=search,
+    )
+    return {"transactions": page.items, "next_cursor": page.next_cursor}
+
+
+@router.get(
+    "/{transaction_id}",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=TransactionSchema,
+)
+async def get_transaction_by_id(
+    transaction_id: int, db_session: AsyncSessionDep, current_user: CurrentUser
+):
+    """Get transaction by ID."""
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030005.value
+    )
+
+    logger.info(
+        "Fetch transaction id=%s by user=%s",
+        transaction_id,
+        current_user.username,
+    )
+
+    return await transaction_controller.get(db_session, transaction_id)
+
+
+@router.post(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+async def create_transactions_bulk(
+    transactions: BulkBody[TransactionDTOSchema],
+    db_session: AsyncSessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """
+    Create many transactions in one request.
+
+    Every item gets its own result, in body order; items the database rejects
+    (e.g. a duplicated operation code) do not stop the others.
+    """
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030001.value
+    )
+    logger.info(
+        "Bulk create transactions count=%s by user=%s ip=%s",
+        len(transactions),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    results = await transaction_controller.bulk_save(
+        db_session, [{**item.model_dump(), **audit} for item in transactions]
+    )
+    return bulk_response(results, "TRANSACTION", HTTP_STATUS.HTTP_201_CREATED)
+
+
+@router.patch(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+async def patch_transactions_bulk(
+    transactions: BulkBody[TransactionBulkPatchSchema],
+    db_session: AsyncSessionDep,
+    current_user: CurrentUser,
+    request: Request,
+):
+    """Partially update many transactions; each item carries the `id` it changes."""
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030002.value
+    )
+    logger.info(
+        "Bulk patch transactions count=%s by user=%s ip=%s",
+        len(transactions),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    rows = [
+        {**item.model_dump(exclude_unset=True, exclude_none=True), **audit}
+        for item in transactions
+    ]
+    results = await transaction_controller.bulk_partial_update(db_session, rows)
+    return bulk_response(results, "TRANSACTION", HTTP_STATUS.HTTP_200_OK)
+
+
+@router.post(
+    "/bulk/delete",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+async def delete_transactions_bulk(
+    ids: BulkBody[int], db_session: AsyncSessionDep, current_user: CurrentUser
+):
+    """Delete many transactions by ID."""
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030004.value
+    )
+    logger.info(
+        "Bulk delete transactions count=%s by user=%s", len(ids), current_user.username
+    )
+    results = await transaction_controller.bulk_delete(db_session, ids)
+    return bulk_response(results, "TRANSACTION", HTTP_STATUS.HTTP_200_OK)
+
+
+@router.put(
+    "/{transaction_id}",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=TransactionSchema,
+)
+async def update_transaction(
+    db_session: AsyncSessionDep,
+    transaction_id: int,
+    transaction: TransactionDTOSchema,
+    request: Request,
+    current_user: CurrentUser,
+):
+    """Update an existing transaction."""
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030002.value
+    )
+
+    logger.info(
+        "Update transaction id=%s op_code=%s by user=%s ip=%s",
+        transaction_id,
+        transaction.operation_code,
+        current_user.username,
+        get_client_ip(request),
+    )
+
+    new_transaction: Transaction = Transaction(**transaction.model_dump())
+    new_transaction.id = transaction_id
+    new_transaction.audit_user_login = current_user.username
+    new_transaction.audit_user_ip = get_client_ip(request)
+
+    try:
+        updated = await transaction_controller.update(db_session, new_transaction)
+        logger.info("Transaction updated id=%s", transaction_id)
+        return updated
+    except ObjectNotFoundException as ex:
+        logger.warning(
+            "Transaction update failed id=%s: %s",
+            transaction_id,
+            ex.args[0],
+        )
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_404_NOT_FOUND, detail=ex.args[0]
+        ) from ex
+
+
+@router.patch(
+    "/{transaction_id}",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=TransactionSchema,
+)
+async def patch_transaction(
+    db_session: AsyncSessionDep,
+    transaction_id: int,
+    transaction: TransactionPatchSchema,
+    request: Request,
+    current_user: CurrentUser,
+):
+    """Partially update an existing transaction."""
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030002.value
+    )
+
+    values = transaction.model_dump(exclude_unset=True, exclude_none=True)
+    logger.info(
+        "Patch transaction id=%s fields=%s by user=%s ip=%s",
+        transaction_id,
+        sorted(values),
+        current_user.username,
+        get_client_ip(request),
+    )
+    values["audit_user_ip"] = get_client_ip(request)
+    values["audit_user_login"] = current_user.username
+
+    try:
+        updated = await transaction_controller.partial_update(
+            db_session, transaction_id, values
+        )
+        logger.info("Transaction patched id=%s", transaction_id)
+        return updated
+    except ObjectNotFoundException as ex:
+        logger.warning(
+            "Transaction patch failed id=%s: %s",
+            transaction_id,
+            ex.args[0],
+        )
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_404_NOT_FOUND, detail=ex.args[0]
+        ) from ex
+    except IntegrityValidationException as ex:
+        logger.warning(
+            "Transaction patch failed id=%s: %s",
+            transaction_id,
+            ex.args[0],
+        )
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_400_BAD_REQUEST,
+            detail="Object TRANSACTION was not accepted",
+        ) from ex
+
+
+@router.delete("/{transaction_id}", response_model=SimpleMessageSchema)
+async def delete_existing_transaction(
+    transaction_id: int,
+    db_session: AsyncSessionDep,
+    current_user: CurrentUser,
+):
+    """Delete a transaction by ID."""
+    await validate_transaction_access_async(
+        db_session, current_user, op.OP_1030004.value
+    )
+
+    logger.info(
+        "Delete transaction id=%s by user=%s",
+        transaction_id,
+        current_user.username,
+    )
+
+    try:
+        await transaction_controller.delete(db_session, transaction_id)
+    except ObjectNotFoundException as ex:
+        logger.warning(
+            "Transaction delete failed id=%s: %s",
+            transaction_id,
+            ex.args[0],
+        )
+        raise HTTPException(status_code=404, detail=ex.args[0]) from ex
+
+    return {"detail": "Transaction deleted"}
@@ -1,5 +1,6 @@
 """Enumeration of operation codes for transactions in the system."""
 
+from collections.abc import Iterable
 from enum import Enum
 
 
@@ -37,3 +38,40 @@ class EnumOperationCode(Enum):
     OP_1050003 = "1050003"  # Role - List
     OP_1050004 = "1050004"  # Role - Delete
     OP_1050005 = "1050005"  # Role - View
+
+    @property
+    def bit(self) -> int:
+        """Bit of this op code inside a permission mask."""
+        return OP_CODE_BITS[self.value]
+
+
+# Bit of each op code inside a permission mask. The index follows declaration
+# order, so new op codes must be appended to the end of EnumOperationCode and
+# existing members must never be reordered or removed.
+OP_CODE_BITS: dict[str, int] = {
+    member.value: 1 << index for index, member in enumerate(EnumOperationCode)
+}
+
+
+def op_code_bit(op_code: str) -> int | None:
+    """Return the mask bit of an op code, or None if it is not in the enum."""
+    return OP_CODE_BITS.get(op_code)
+
+
+def permission_mask(op_codes: Iterable[str]) -> int:
+    """Encode op codes as an integer bitmask, ignoring codes outside the enum."""
+    mask = 0
+    for op_code in op_codes:
+        mask |= OP_CODE_BITS.get(op_code, 0)
+    return mask
+
+
+def op_codes_from_mask(mask: int) -> list[str]:
+    """Decode a permission mask back into its op codes."""
+    return [op_code for op_code, bit in OP_CODE_BITS.items() if mask & bit]
+
+
+def mask_grants(mask: int, op_code: str) -> bool:
+    """Check whether a permission mask grants the op code."""
+    bit = OP_CODE_BITS.get(op_code)
+    return bit is not None and bool(mask & bit)
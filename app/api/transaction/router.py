@@ -6,23 +6,26 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi import status as HTTP_STATUS
 from sqlalchemy.orm import Session
 
-from app.api.authentication.controller import get_current_user
-from app.api.authorization.controller import validate_transaction_access
+from app.api.authentication.principal import Principal
+from app.api.authorization.dependencies import RequireOp
 from app.api.transaction.enum_operation_code import EnumOperationCode as op
 from app.api.transaction.schemas import (
+    TransactionBulkPatchSchema,
     TransactionDTOSchema,
     TransactionListSchema,
+    TransactionPatchSchema,
     TransactionSchema,
 )
 from app.database.session import get_session
 from app.models.transaction import Transaction
-from app.models.user import User
-from app.utils.base_schemas import SimpleMessageSchema
+from app.utils.base_schemas import BulkResultSchema, SimpleMessageSchema
+from app.utils.bulk import BulkBody, bulk_response
 from app.utils.client_ip import get_client_ip
 from app.utils.exceptions import (
     IntegrityValidationException,
     ObjectNotFoundException,
 )
+from app.utils.filters import FilterQuery
 from app.utils.generic_controller import GenericController
 from app.utils.logging import get_logger
 
@@ -31,7 +34,6 @@ transaction_controller = GenericController(Transaction)
 logger = get_logger("transaction.router")
 
 SessionDep = Annotated[Session, Depends(get_session)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
 @router.post(
@@ -39,14 +41,13 @@ CurrentUser = Annotated[User, Depends(get_current_user)]
     status_code=HTTP_STATUS.HTTP_201_CREATED,
     response_model=TransactionSchema,
 )
-async def create_transaction(
+def create_transaction(
     transaction: TransactionDTOSchema,
     request: Request,
-    current_user: CurrentUser,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030001))],
     db_session: SessionDep,
 ):
     """Create a new transaction."""
-    validate_transaction_access(db_session, current_user, op.OP_1030001.value)
     logger.info(
         "Create transaction op_code=%s by user=%s ip=%s",
         transaction.operation_code,
@@ -75,30 +76,53 @@ async def create_transaction(
     status_code=HTTP_STATUS.HTTP_200_OK,
     response_model=TransactionListSchema,
 )
-async def get_all_transactions(
+def get_all_transactions(
     db_session: SessionDep,
-    current_user: CurrentUser,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030003))],
     skip: int = 0,
     limit: int = 100,
     op_code: str | None = None,
+    cursor: str | None = None,
+    order_by: str | None = None,
+    filters: FilterQuery = None,
+    search: str | None = None,
 ):
-    """Get all transactions with optional filtering by operation code."""
-    validate_transaction_access(db_session, current_user, op.OP_1030003.value)
+    """
+    Get all transactions, optionally those whose operation code starts with
+    `op_code`.
+
+    Pass `next_cursor` back as `cursor` for the next page; `order_by` may be
+    `id` (default) or `operation_code`.
+
+    Narrow the list with repeated `filter` parameters, e.g.
+    `filter=id:range:100..199`.
+
+    `search` keeps the rows whose `name` contains it, using the search index.
+    """
     logger.info(
-        "List transactions skip=%s limit=%s op_code=%s by user=%s",
+        "List transactions skip=%s limit=%s op_code=%s cursor=%s filter=%s search=%s "
+        "by user=%s",
         skip,
         limit,
         op_code,
+        cursor,
+        filters,
+        search,
         current_user.username,
     )
-    criterias = {}
     if op_code:
-        criterias["operation_code"] = op_code
+        filters = [*(filters or ()), f"operation_code:prefix:{op_code}"]
 
-    transactions: list[Transaction] = transaction_controller.get_all(
-        db_session, skip, limit, **criterias
+    page = transaction_controller.get_page(
+        db_session,
+        limit,
+        cursor,
+        skip,
+        order_by,
+        filters=filters or (),
+        search=search,
     )
-    return {"transactions": transactions}
+    return {"transactions": page.items, "next_cursor": page.next_cursor}
 
 
 @router.get(
@@ -107,11 +131,11 @@ async def get_all_transactions(
     response_model=TransactionSchema,
 )
 def get_transaction_by_id(
-    transaction_id: int, db_session: SessionDep, current_user: CurrentUser
+    transaction_id: int,
+    db_session: SessionDep,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030005))],
 ):
     """Get transaction by ID."""
-    validate_transaction_access(db_session, current_user, op.OP_1030005.value)
-
     logger.info(
         "Fetch transaction id=%s by user=%s",
         transaction_id,
@@ -121,21 +145,100 @@ def get_transaction_by_id(
     return transaction_controller.get(db_session, transaction_id)
 
 
+@router.post(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def create_transactions_bulk(
+    transactions: BulkBody[TransactionDTOSchema],
+    db_session: SessionDep,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030001))],
+    request: Request,
+):
+    """
+    Create many transactions in one request.
+
+    Every item gets its own result, in body order; items the database rejects
+    (e.g. a duplicated operation code) do not stop the others.
+    """
+    logger.info(
+        "Bulk create transactions count=%s by user=%s ip=%s",
+        len(transactions),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    results = transaction_controller.bulk_save(
+        db_session, [{**item.model_dump(), **audit} for item in transactions]
+    )
+    return bulk_response(results, "TRANSACTION", HTTP_STATUS.HTTP_201_CREATED)
+
+
+@router.patch(
+    "/bulk",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def patch_transactions_bulk(
+    transactions: BulkBody[TransactionBulkPatchSchema],
+    db_session: SessionDep,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030002))],
+    request: Request,
+):
+    """Partially update many transactions; each item carries the `id` it changes."""
+    logger.info(
+        "Bulk patch transactions count=%s by user=%s ip=%s",
+        len(transactions),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    rows = [
+        {**item.model_dump(exclude_unset=True, exclude_none=True), **audit}
+        for item in transactions
+    ]
+    results = transaction_controller.bulk_partial_update(db_session, rows)
+    return bulk_response(results, "TRANSACTION", HTTP_STATUS.HTTP_200_OK)
+
+
+@router.post(
+    "/bulk/delete",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=BulkResultSchema,
+)
+def delete_transactions_bulk(
+    ids: BulkBody[int],
+    db_session: SessionDep,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030004))],
+):
+    """Delete many transactions by ID."""
+    logger.info(
+        "Bulk delete transactions count=%s by user=%s", len(ids), current_user.username
+    )
+    results = transaction_controller.bulk_delete(db_session, ids)
+    return bulk_response(results, "TRANSACTION", HTTP_STATUS.HTTP_200_OK)
+
+
 @router.put(
     "/{transaction_id}",
     status_code=HTTP_STATUS.HTTP_200_OK,
     response_model=TransactionSchema,
 )
-async def update_transaction(
+def update_transaction(
     db_session: SessionDep,
     transaction_id: int,
     transaction: TransactionDTOSchema,
     request: Request,
-    current_user: CurrentUser,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030002))],
 ):
     """Update an existing transaction."""
-    validate_transaction_access(db_session, current_user, op.OP_1030002.value)
-
     logger.info(
         "Update transaction id=%s op_code=%s by user=%s ip=%s",
         transaction_id,
@@ -164,15 +267,64 @@ async def update_transaction(
         ) from ex
 
 
+@router.patch(
+    "/{transaction_id}",
+    status_code=HTTP_STATUS.HTTP_200_OK,
+    response_model=TransactionSchema,
+)
+def patch_transaction(
+    db_session: SessionDep,
+    transaction_id: int,
+    transaction: TransactionPatchSchema,
+    request: Request,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030002))],
+):
+    """Partially update an existing transaction."""
+    values = transaction.model_dump(exclude_unset=True, exclude_none=True)
+    logger.info(
+        "Patch transaction id=%s fields=%s by user=%s ip=%s",
+        transaction_id,
+        sorted(values),
+        current_user.username,
+        get_client_ip(request),
+    )
+    values["audit_user_ip"] = get_client_ip(request)
+    values["audit_user_login"] = current_user.username
+
+    try:
+        updated = transaction_controller.partial_update(
+            db_session, transaction_id, values
+        )
+        logger.info("Transaction patched id=%s", transaction_id)
+        return updated
+    except ObjectNotFoundException as ex:
+        logger.warning(
+            "Transaction patch failed id=%s: %s",
+            transaction_id,
+            ex.args[0],
+        )
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_404_NOT_FOUND, detail=ex.args[0]
+        ) from ex
+    except IntegrityValidationException as ex:
+        logger.warning(
+            "Transaction patch failed id=%s: %s",
+            transaction_id,
+            ex.args[0],
+        )
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_400_BAD_REQUEST,
+            detail="Object TRANSACTION was not accepted",
+        ) from ex
+
+
 @router.delete("/{transaction_id}", response_model=SimpleMessageSchema)
 def delete_existing_transaction(
     transaction_id: int,
     db_session: SessionDep,
-    current_user: CurrentUser,
+    current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030004))],
 ):
     """Delete a transaction by ID."""
-    validate_transaction_access(db_session, current_user, op.OP_1030004.value)
-
     logger.info(
         "Delete transaction id=%s by user=%s",
         transaction_id,
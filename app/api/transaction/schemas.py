@@ -2,7 +2,11 @@
 
 from pydantic import BaseModel
 
-from app.utils.base_schemas import BaseAuditDTOSchema, BaseAuditModelSchema
+from app.utils.base_schemas import (
+    BaseAuditDTOSchema,
+    BaseAuditModelSchema,
+    CursorPageSchema,
+)
 
 
 class TransactionDTOSchema(BaseAuditDTOSchema):
@@ -13,13 +17,27 @@ class TransactionDTOSchema(BaseAuditDTOSchema):
     operation_code: str
 
 
+class TransactionPatchSchema(BaseModel):
+    """Represents a partial update of a Transaction; only sent fields are changed."""
+
+    name: str | None = None
+    description: str | None = None
+    operation_code: str | None = None
+
+
+class TransactionBulkPatchSchema(TransactionPatchSchema):
+    """Represents one item of a bulk partial update of Transactions, by `id`."""
+
+    id: int
+
+
 class TransactionSchema(TransactionDTOSchema, BaseAuditModelSchema):
     """Represents a Transaction for the system."""
 
     id: int
 
 
-class TransactionListSchema(BaseModel):
+class TransactionListSchema(CursorPageSchema):
     """Represents a list of Transactions for the system."""
 
     transactions: list[TransactionSchema]
@@ -2,12 +2,14 @@
 
 from sqlalchemy import select
 
+from app.database.replicas import PRIMARY_READ
 from app.database.session import Session
 from app.models.user import User
 from app.utils.base_model import AbstractBaseModel
+from app.utils.bulk import BulkItemResult
 from app.utils.generic_controller import GenericController
 from app.utils.logging import get_logger
-from app.utils.security import get_password_hash
+from app.utils.security import get_password_hash, get_password_hashes
 
 
 class UserController(GenericController):
@@ -22,6 +24,22 @@ class UserController(GenericController):
         self.logger.info("Fetch user by username=%s", username)
         return db_session.scalar(select(User).where(User.username == username))
 
+    def get_user_id_by_username(self, db_session: Session, username: str) -> int | None:
+        """Get only the id of a user, without loading the entity graph."""
+        self.logger.info("Fetch user id by username=%s", username)
+        return db_session.scalar(
+            select(User.id).where(User.username == username),
+            bind_arguments=PRIMARY_READ,
+        )
+
+    def get_user_identity(self, db_session: Session, user_id: int) -> User | None:
+        """
+        Get a user by primary key, without its relationships.
+
+        Served from the session's identity map when the user is already loaded.
+        """
+        return db_session.get(User, user_id, bind_arguments=PRIMARY_READ)
+
     def save(self, db_session: Session, obj: User) -> AbstractBaseModel:
         """Save a new user to the database with hashed password."""
         self.logger.info("Hashing password for new user username=%s", obj.username)
@@ -33,3 +51,35 @@ class UserController(GenericController):
         self.logger.info("Hashing password for update user id=%s", obj.id)
         obj.password = get_password_hash(obj.password)
         return super().update(db_session, obj)
+
+    def partial_update(
+        self, db_session: Session, obj_id: int, values: dict
+    ) -> AbstractBaseModel:
+        """Update the given user fields, hashing the password only if supplied."""
+        if values.get("password") is not None:
+            self.logger.info("Hashing password for patch user id=%s", obj_id)
+            values = {**values, "password": get_password_hash(values["password"])}
+        return super().partial_update(db_session, obj_id, values)
+
+    def bulk_save(self, db_session: Session, rows: list[dict]) -> list[BulkItemResult]:
+        """Save many new users, hashing their passwords in the hashing pool."""
+        self.logger.info("Hashing passwords for %s new users", len(rows))
+        hashes = get_password_hashes([row["password"] for row in rows])
+        rows = [
+            {**row, "password": hashed}
+            for row, hashed in zip(rows, hashes, strict=True)
+        ]
+        return super().bulk_save(db_session, rows)
+
+    def bulk_partial_update(
+        self, db_session: Session, rows: list[dict]
+    ) -> list[BulkItemResult]:
+        """Update many users, hashing only the passwords supplied."""
+        changed = [i for i, row in enumerate(rows) if row.get("password") is not None]
+        if changed:
+            self.logger.info("Hashing passwords for %s patched users", len(changed))
+            hashes = get_password_hashes([rows[i]["password"] for i in changed])
+            rows = list(rows)
+            for i, hashed in zip(changed, hashes, strict=True):
+                rows[i] = {**rows[i], "password": hashed}
+        return super().bulk_partial_update(db_session, rows)
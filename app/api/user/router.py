@@ -4,9 +4,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi import status as HTTP_STATUS
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.api.authentication.controller import get_current_user
+from app.api.authentication.principal import Principal
 from app.api.authorization.controller import (
     get_user_authorized_transactions,
     validate_transaction_access,
@@ -14,15 +16,23 @@ from app.api.authorization.controller import (
 from app.api.transaction.enum_operation_code import EnumOperationCode as op
 from app.api.transaction.schemas import TransactionListSchema
 from app.api.user.controller import UserController
-from app.api.user.schemas import UserList, UserPublic, UserSchema
+from app.api.user.schemas import (
+    UserBulkPatchSchema,
+    UserList,
+    UserPatchSchema,
+    UserPublic,
+    UserSchema,
+)
 from app.database.session import get_session
 from app.models.user import User
-from app.utils.base_schemas import SimpleMessageSchema
+from app.utils.base_schemas import BulkResultSchema, SimpleMessageSchema
+from app.utils.bulk import BulkBody, bulk_response
 from app.utils.client_ip import get_client_ip
 from app.utils.exceptions import (
     IntegrityValidationException,
     ObjectNotFoundException,
 )
+from app.utils.filters import FilterQuery
 from app.utils.logging import get_logger
 
 router = APIRouter()
@@ -30,7 +40,7 @@ user_controller = UserController()
 logger = get_logger("user.router")
 
 DbSession = Annotated[Session, Depends(get_session)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
 @router.post("/", status_code=201, response_model=UserPublic)
@@ -47,7 +57,8 @@ async def create_new_user(user: UserSchema, request: Request, session: DbSession
     new_user.audit_user_login = "system"
 
     try:
-        created = user_controller.save(session, new_user)
+        # Hashing and the insert block, keep them off the event loop.
+        created = await run_in_threadpool(user_controller.save, session, new_user)
         logger.info("User created id=%s", created.id)
         return created
     except IntegrityValidationException as ex:
@@ -58,6 +69,75 @@ async def create_new_user(user: UserSchema, request: Request, session: DbSession
         ) from ex
 
 
+@router.post("/bulk", response_model=BulkResultSchema)
+def create_users_bulk(
+    users: BulkBody[UserSchema],
+    request: Request,
+    db_session: DbSession,
+    current_user: CurrentUser,
+):
+    """
+    Create many users in one request; unlike sign-up, this needs access.
+
+    Every item gets its own result, in body order; items the database rejects
+    (e.g. a username or email already taken) do not stop the others.
+    """
+    validate_transaction_access(db_session, current_user, op.OP_1040001.value)
+    logger.info(
+        "Bulk create users count=%s by user=%s ip=%s",
+        len(users),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    rows = [{**user.model_dump(), **audit} for user in users]
+    results = user_controller.bulk_save(db_session, rows)
+    return bulk_response(results, "USER", HTTP_STATUS.HTTP_201_CREATED)
+
+
+@router.patch("/bulk", response_model=BulkResultSchema)
+def patch_users_bulk(
+    users: BulkBody[UserBulkPatchSchema],
+    request: Request,
+    db_session: DbSession,
+    current_user: CurrentUser,
+):
+    """Partially update many users; each item carries the `id` it changes."""
+    validate_transaction_access(db_session, current_user, op.OP_1040002.value)
+    logger.info(
+        "Bulk patch users count=%s by user=%s ip=%s",
+        len(users),
+        current_user.username,
+        get_client_ip(request),
+    )
+    audit = {
+        "audit_user_ip": get_client_ip(request),
+        "audit_user_login": current_user.username,
+    }
+    rows = [
+        {**user.model_dump(exclude_unset=True, exclude_none=True), **audit}
+        for user in users
+    ]
+    results = user_controller.bulk_partial_update(db_session, rows)
+    return bulk_response(results, "USER", HTTP_STATUS.HTTP_200_OK)
+
+
+@router.post("/bulk/delete", response_model=BulkResultSchema)
+def delete_users_bulk(
+    ids: BulkBody[int], db_session: DbSession, current_user: CurrentUser
+):
+    """Delete many users by ID."""
+    validate_transaction_access(db_session, current_user, op.OP_1040004.value)
+    logger.info(
+        "Bulk delete users count=%s by user=%s", len(ids), current_user.username
+    )
+    results = user_controller.bulk_delete(db_session, ids)
+    return bulk_response(results, "USER", HTTP_STATUS.HTTP_200_OK)
+
+
 @router.get(
     "/{user_id}",
     status_code=HTTP_STATUS.HTTP_200_OK,
@@ -78,17 +158,45 @@ def read_users(
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    order_by: str | None = None,
+    filters: FilterQuery = None,
+    search: str | None = None,
 ):
-    """Retrieve all users with pagination."""
+    """
+    Retrieve all users with pagination.
+
+    Pass `next_cursor` back as `cursor` for the next page; `order_by` may be
+    `id` (default), `username` or `email`.
+
+    Narrow the list with repeated `filter` parameters, e.g.
+    `filter=username:prefix:adm`.
+
+    `search` keeps the rows whose `username` or `email` contains it, using the
+    search index.
+    """
     validate_transaction_access(db_session, current_user, op.OP_1040003.value)
     logger.info(
-        "List users skip=%s limit=%s by user=%s",
+        "List users skip=%s limit=%s cursor=%s filter=%s search=%s order_by=%s "
+        "by user=%s",
         skip,
         limit,
+        cursor,
+        filters,
+        search,
+        order_by,
         current_user.username,
     )
-    users: list[User] = user_controller.get_all(db_session, skip, limit)
-    return {"users": users}
+    page = user_controller.get_page(
+        db_session,
+        limit,
+        cursor,
+        skip,
+        order_by,
+        filters=filters or (),
+        search=search,
+    )
+    return {"users": page.items, "next_cursor": page.next_cursor}
 
 
 @router.put("/{user_id}", response_model=UserPublic)
@@ -125,6 +233,43 @@ def update_existing_user(
         raise HTTPException(status_code=404, detail=ex.args[0]) from ex
 
 
+@router.patch("/{user_id}", response_model=UserPublic)
+def patch_existing_user(
+    user_id: int,
+    user: UserPatchSchema,
+    request: Request,
+    db_session: DbSession,
+    current_user: CurrentUser,
+):
+    """Partially update an existing user; the password is hashed only if sent."""
+    validate_transaction_access(db_session, current_user, op.OP_1040002.value)
+
+    values = user.model_dump(exclude_unset=True, exclude_none=True)
+    logger.info(
+        "Patch user id=%s fields=%s by user=%s ip=%s",
+        user_id,
+        sorted(values),
+        current_user.username,
+        get_client_ip(request),
+    )
+    values["audit_user_ip"] = get_client_ip(request)
+    values["audit_user_login"] = current_user.username
+
+    try:
+        updated = user_controller.partial_update(db_session, user_id, values)
+        logger.info("User patched id=%s", user_id)
+        return updated
+    except ObjectNotFoundException as ex:
+        logger.warning("User patch failed id=%s: %s", user_id, ex.args[0])
+        raise HTTPException(status_code=404, detail=ex.args[0]) from ex
+    except IntegrityValidationException as ex:
+        logger.warning("User patch failed id=%s: %s", user_id, ex.args[0])
+        raise HTTPException(
+            status_code=HTTP_STATUS.HTTP_400_BAD_REQUEST,
+            detail="Object USER was not accepted",
+        ) from ex
+
+
 @router.delete("/{user_id}", response_model=SimpleMessageSchema)
 def delete_existing_user(
     user_id: int,
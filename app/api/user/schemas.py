@@ -1,5 +1,7 @@
 from pydantic import BaseModel, ConfigDict, EmailStr
 
+from app.utils.base_schemas import CursorPageSchema
+
 
 class UserSchema(BaseModel):
     """
@@ -14,6 +16,27 @@ class UserSchema(BaseModel):
     audit_user_login: str = None
 
 
+class UserPatchSchema(BaseModel):
+    """
+    Classe que representa a atualização parcial de um usuário; apenas os campos
+    enviados são alterados.
+    """
+
+    username: str | None = None
+    display_name: str | None = None
+    email: EmailStr | None = None
+    password: str | None = None
+
+
+class UserBulkPatchSchema(UserPatchSchema):
+    """
+    Classe que representa um item da atualização parcial de usuários em lote,
+    identificado pelo `id`.
+    """
+
+    id: int
+
+
 class UserPublic(BaseModel):
     """
     Classe que representa o usuário do sistema com as propriedades que podem ser
@@ -27,7 +50,7 @@ class UserPublic(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class UserList(BaseModel):
+class UserList(CursorPageSchema):
     """
     Representa uma lista de Usuários do sistema.
     """
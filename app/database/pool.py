@@ -0,0 +1,197 @@
+"""Connection pool settings and instrumentation for the database engines."""
+
+import bisect
+import threading
+import time
+
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.utils.logging import get_logger
+from app.utils.settings import Settings, get_settings
+
+logger = get_logger("database.pool")
+
+# Upper bounds (ms) of the checkout wait histogram; the last bucket is +Inf.
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """
+    Checkout counters and wait-time histogram of one engine's pool.
+
+    Counters are per worker process, like the pool itself. `checked_out` and
+    `peak_checked_out` follow the pool's checkout/checkin events; `wait_ms`
+    buckets the time callers spent obtaining a connection, which grows as the
+    pool runs out of connections and callers queue for `pool_timeout`.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.engine: Engine | None = None
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """Reset every counter; the checked-out gauge is kept."""
+        with self._lock:
+            self.peak_checked_out = self.checked_out
+            self.checkouts = 0
+            self.connects = 0
+            self.timeouts = 0
+            self.wait_total_ms = 0.0
+            self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def on_checkout(self, *_args) -> None:
+        """Pool `checkout` event."""
+        with self._lock:
+            self.checked_out += 1
+            self.checkouts += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self, *_args) -> None:
+        """Pool `checkin` event."""
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def on_connect(self, *_args) -> None:
+        """Pool `connect` event: a new DBAPI connection was opened."""
+        with self._lock:
+            self.connects += 1
+
+    def record_wait(self, elapsed_ms: float) -> None:
+        """Add one checkout wait to the histogram."""
+        with self._lock:
+            self.wait_total_ms += elapsed_ms
+            self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS_MS, elapsed_ms)] += 1
+
+    def record_timeout(self) -> None:
+        """Count a checkout that gave up after `pool_timeout`."""
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Current counters, plus the size and overflow of the live pool."""
+        pool = self.engine.pool if self.engine is not None else None
+        queue_pool = pool if isinstance(pool, QueuePool) else None
+        with self._lock:
+            buckets = [f"{bound}" for bound in WAIT_BUCKETS_MS] + ["+Inf"]
+            return {
+                "name": self.name,
+                "pool": type(pool).__name__ if pool else None,
+                "size": queue_pool.size() if queue_pool else None,
+                "overflow": max(queue_pool.overflow(), 0) if queue_pool else None,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_total_ms, 3),
+                "wait_ms": dict(zip(buckets, self.wait_buckets, strict=True)),
+            }
+
+
+# Metrics of every engine created in this worker, by engine name.
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def _timed_pool_class(base: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    """
+    Subclass `base` so `connect()` reports how long the caller waited.
+
+    Pool events only fire once a connection is handed out, so the wait is
+    taken around `Pool.connect()`. The class is kept by `Pool.recreate()`.
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return base.connect(self)
+        except PoolTimeoutError:
+            metrics.record_timeout()
+            logger.warning(
+                "Pool %s checkout timed out: %s", metrics.name, metrics.snapshot()
+            )
+            raise
+        finally:
+            metrics.record_wait((time.perf_counter() - start) * 1e3)
+
+    return type(f"Timed{base.__name__}", (base,), {"connect": connect})
+
+
+def engine_options(
+    url: str, metrics: PoolMetrics, settings: Settings | None = None
+) -> dict:
+    """
+    Pool keyword arguments for `create_engine`/`create_async_engine`.
+
+    Size, overflow and timeout only apply to queue pools; SQLite in-memory
+    databases keep their single-connection pool.
+    """
+    settings = settings or get_settings()
+    parsed = make_url(url)
+    pool_class = parsed.get_dialect().get_pool_class(parsed)
+
+    options: dict = {
+        "poolclass": _timed_pool_class(pool_class, metrics),
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if issubclass(pool_class, QueuePool):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        )
+    return options
+
+
+def instrument_engine(engine: Engine, metrics: PoolMetrics) -> None:
+    """Feed the engine's pool events into `metrics`."""
+    metrics.engine = engine
+    event.listen(engine, "checkout", metrics.on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
+    event.listen(engine, "connect", metrics.on_connect)
+
+
+def use_sqlite_savepoints(engine: Engine) -> None:
+    """
+    Open the transaction before a SAVEPOINT on SQLite connections.
+
+    pysqlite/aiosqlite only send BEGIN before the first write, so a SAVEPOINT
+    taken earlier opens a transaction of its own, which RELEASE commits and
+    the outer rollback cannot undo. Reads keep running outside a transaction,
+    as before, so they never hold a lock other connections wait on.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "savepoint")
+    def _begin_before_savepoint(connection, _name) -> None:
+        if not connection.connection.driver_connection.in_transaction:
+            connection.exec_driver_sql("BEGIN")
+
+
+def create_instrumented_engine(
+    url: str, name: str, settings: Settings | None = None
+) -> Engine:
+    """Create a sync engine with the configured, instrumented pool."""
+    metrics = pool_metrics.setdefault(name, PoolMetrics(name))
+    engine = create_engine(url, **engine_options(url, metrics, settings))
+    instrument_engine(engine, metrics)
+    use_sqlite_savepoints(engine)
+    return engine
+
+
+def create_instrumented_async_engine(
+    url: str, name: str, settings: Settings | None = None
+) -> AsyncEngine:
+    """Create an async engine with the configured, instrumented pool."""
+    metrics = pool_metrics.setdefault(name, PoolMetrics(name))
+    engine = create_async_engine(url, **engine_options(url, metrics, settings))
+    instrument_engine(engine.sync_engine, metrics)
+    use_sqlite_savepoints(engine.sync_engine)
+    return engine
@@ -0,0 +1,109 @@
+"""Read-replica selection and read/write routing of ORM sessions."""
+
+import itertools
+import threading
+import time
+
+from sqlalchemy import Engine, Select, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.orm import Session
+
+from app.utils.logging import get_logger
+
+logger = get_logger("database.replicas")
+
+# Set in session.info once the session wrote; later reads stay on the primary.
+PRIMARY_PINNED_KEY = "primary_pinned"
+
+# bind_arguments of a read that must see the primary, e.g. the authn/authz
+# lookups cached per worker: read from a lagging replica right after a revoke,
+# they would cache the revoked grant for the whole TTL.
+PRIMARY_READ = {"primary_read": True}
+
+
+class ReplicaSet:
+    """
+    Round-robin over the replica engines, skipping unhealthy ones.
+
+    A replica is ejected for `eject_seconds` when opening a connection to it
+    fails or the driver reports a disconnect; once that time passes it gets
+    traffic again, and a new failure ejects it again. With every replica
+    ejected `choose()` returns None and reads fall back to the primary.
+    """
+
+    def __init__(self, engines: list[Engine], eject_seconds: float) -> None:
+        self.engines = engines
+        self.eject_seconds = eject_seconds
+        self._ejected_until: dict[Engine, float] = {}
+        self._cycle = itertools.cycle(engines)
+        self._lock = threading.Lock()
+        for engine in engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> Engine | None:
+        """Next healthy replica in round-robin order, or None."""
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                engine = next(self._cycle)
+                if self._ejected_until.get(engine, 0) <= now:
+                    return engine
+        return None
+
+    def eject(self, engine: Engine) -> None:
+        """Stop routing reads to `engine` for `eject_seconds`."""
+        with self._lock:
+            self._ejected_until[engine] = time.monotonic() + self.eject_seconds
+        logger.warning(
+            "Replica ejected url=%s for %ss",
+            engine.url.render_as_string(hide_password=True),
+            self.eject_seconds,
+        )
+
+    def is_healthy(self, engine: Engine) -> bool:
+        """Whether `engine` currently receives reads."""
+        with self._lock:
+            return self._ejected_until.get(engine, 0) <= time.monotonic()
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        # No connection means the connect itself failed.
+        if context.is_disconnect or context.connection is None:
+            self.eject(context.engine)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica until it writes anything.
+
+    Only SELECT statements are routed, and only while `replicas` is set (the
+    request is read-only) and the session has not flushed or executed a
+    write. The replica is picked once per session, so a request reads one
+    consistent snapshot. From the first write on, the session is pinned to
+    the primary so the rest of the request reads its own writes. Reads passed
+    `bind_arguments=PRIMARY_READ` always go to the primary.
+    """
+
+    def __init__(self, bind: Engine, replicas: ReplicaSet | None = None, **kw):
+        super().__init__(bind=bind, **kw)
+        self.replicas = replicas
+        self.replica: Engine | None = None
+
+    def get_bind(self, mapper=None, *, clause=None, primary_read=False, **kw):
+        if self.replicas and not primary_read and not self.info.get(PRIMARY_PINNED_KEY):
+            if isinstance(clause, Select):
+                if self.replica is None or not self.replicas.is_healthy(self.replica):
+                    self.replica = self.replicas.choose()
+                if self.replica is not None:
+                    return self.replica
+            elif clause is not None:
+                self.info[PRIMARY_PINNED_KEY] = True
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_to_primary(session: Session, _flush_context) -> None:
+    """Keep the rest of the session on the primary once it wrote."""
+    session.info[PRIMARY_PINNED_KEY] = True
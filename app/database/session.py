@@ -1,14 +1,75 @@
 """Database session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+from functools import lru_cache
 
+from fastapi import Request
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session  # noqa: F401  (re-exported)
+
+from app.database.pool import (
+    create_instrumented_async_engine,
+    create_instrumented_engine,
+)
+from app.database.replicas import ReplicaSet, RoutingSession
 from app.utils.settings import get_settings
 
-engine = create_engine(get_settings().DB_URL)
+# Async driver used for each sync driver name found in DB_URL.
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+# Methods whose sessions may read from a replica.
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+engine = create_instrumented_engine(get_settings().DB_URL, "primary")
+replicas = ReplicaSet(
+    [
+        create_instrumented_engine(url, f"replica-{index}")
+        for index, url in enumerate(get_settings().DB_REPLICA_URLS)
+    ],
+    eject_seconds=get_settings().DB_REPLICA_EJECT_SECONDS,
+)
+
+
+def get_session(request: Request = None):
+    """
+    Provide a database session.
+
+    Sessions of GET requests read from the replicas (see RoutingSession);
+    every other session, and any session used outside a request, stays on
+    the primary.
+    """
+    read_only = request is not None and request.method in READ_ONLY_METHODS
+    with RoutingSession(engine, replicas if read_only else None) as session:
+        yield session
+
+
+def async_database_url(url: str) -> str:
+    """Swap the driver of a sync database URL for its async counterpart."""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Create the async engine on first use, so sync-only deploys never load it."""
+    settings = get_settings()
+    return create_instrumented_async_engine(
+        settings.DB_ASYNC_URL or async_database_url(settings.DB_URL), "async"
+    )
+
 
+async def get_async_session():
+    """
+    Provide an async database session.
 
-def get_session():
-    """Provide a database session."""
-    with Session(engine) as session:
+    Attributes stay loaded after commit: touching an expired attribute would
+    need an implicit query, which AsyncSession cannot run.
+    """
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
         yield session
@@ -0,0 +1,58 @@
+"""Session hooks that follow writes to a set of models until they are committed."""
+
+from collections.abc import Callable, Sequence
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Flushed objects of the tracked models, or the statement that wrote them.
+Written = Sequence[object] | ORMExecuteState
+
+
+def track_writes(
+    models: tuple[type, ...],
+    mark_dirty: Callable[[Session, Written], None],
+    on_commit: Callable[[Session], None],
+    on_rollback: Callable[[Session], None],
+) -> None:
+    """
+    Register session hooks for the writes to `models`.
+
+    `mark_dirty` runs for every flush that touched the models and for every
+    INSERT/UPDATE/DELETE statement on them, which bypasses the flush (bulk and
+    RETURNING writes); it usually flags `session.info`. `on_commit` and
+    `on_rollback` run when the outermost transaction ends, so they can act on
+    the flag and drop it.
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def _track_flushed_objects(session: Session, _flush_context) -> None:
+        written = [
+            obj
+            for obj in chain(session.new, session.dirty, session.deleted)
+            if isinstance(obj, models)
+        ]
+        if written:
+            mark_dirty(session, written)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _track_statements(orm_execute_state: ORMExecuteState) -> None:
+        state = orm_execute_state
+        if not (state.is_insert or state.is_update or state.is_delete):
+            return
+        mapper = state.bind_mapper
+        if mapper is not None and issubclass(mapper.class_, models):
+            mark_dirty(state.session, state)
+
+    @event.listens_for(Session, "after_commit")
+    def _after_commit(session: Session) -> None:
+        # Releasing a savepoint (e.g. a bulk chunk) commits nothing yet.
+        if not session.in_nested_transaction():
+            on_commit(session)
+
+    @event.listens_for(Session, "after_rollback")
+    def _after_rollback(session: Session) -> None:
+        # The writes of the enclosing transaction outlive a savepoint rollback.
+        if not session.in_nested_transaction():
+            on_rollback(session)
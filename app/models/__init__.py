@@ -7,8 +7,11 @@ na inicialização do módulo inteiro do Models.
 Ref: https://stackoverflow.com/questions/9088957/sqlalchemy-cannot-find-a-class-name
 """
 
+from app.models.api_key import ApiKey  # noqa F401
 from app.models.assignment import Assignment  # noqa F401
 from app.models.authorization import Authorization  # noqa F401
+from app.models.permission_version import PermissionVersion  # noqa F401
+from app.models.refresh_token import RefreshToken  # noqa F401
 from app.models.role import Role  # noqa F401
 from app.models.transaction import Transaction  # noqa F401
 from app.models.user import User  # noqa F401
@@ -0,0 +1,37 @@
+"""Model for the API keys of machine clients."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.utils.base_model import AbstractBaseModel
+
+
+class ApiKey(AbstractBaseModel):
+    """
+    Represents an API key that authenticates as its User.
+
+    The key is `fak_<prefix>_<secret>`: the prefix is stored in clear and
+    indexed for the lookup, while only a keyed hash of the secret is stored.
+    """
+
+    __tablename__ = "api_key"
+
+    id: Mapped[int] = mapped_column(primary_key=True, name="id")
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), name="user_id", nullable=False
+    )
+    name: Mapped[str] = mapped_column(name="str_name")
+    prefix: Mapped[str] = mapped_column(String(16), name="str_prefix")
+    secret_hash: Mapped[str] = mapped_column(
+        String(64), name="str_secret_hash", info={"filterable": False}
+    )
+    expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), name="dt_expires_at", nullable=True
+    )
+
+    __table_args__ = (
+        Index("idx_api_key_prefix", prefix, unique=True),
+        Index("idx_api_key_user", user_id),
+    )
@@ -28,7 +28,7 @@ class Assignment(AbstractBaseModel):
         ForeignKey("role.id"), name="role_id", nullable=False
     )
 
-    user: Mapped["User"] = relationship(back_populates="assignments", lazy="subquery")
-    role: Mapped["Role"] = relationship(back_populates="assignments", lazy="subquery")
+    user: Mapped["User"] = relationship(back_populates="assignments", lazy="select")
+    role: Mapped["Role"] = relationship(back_populates="assignments", lazy="select")
 
     __table_args__ = (Index("idx_user_role", user_id, role_id, unique=True),)
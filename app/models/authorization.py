@@ -26,11 +26,9 @@ class Authorization(AbstractBaseModel):
         ForeignKey("transaction.id"), nullable=False
     )
 
-    role: Mapped["Role"] = relationship(
-        back_populates="authorizations", lazy="subquery"
-    )
+    role: Mapped["Role"] = relationship(back_populates="authorizations", lazy="select")
     transaction: Mapped["Transaction"] = relationship(
-        back_populates="authorizations", lazy="subquery"
+        back_populates="authorizations", lazy="select"
     )
 
     __table_args__ = (
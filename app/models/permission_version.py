@@ -0,0 +1,31 @@
+"""Model for the global permissions version counter."""
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.utils.base_model import Base
+
+# The counter lives in a single row, seeded along with the table.
+PERMISSION_VERSION_ROW_ID = 1
+
+
+class PermissionVersion(Base):
+    """
+    Single-row counter bumped on every committed write to the RBAC tables.
+
+    Access tokens carrying permission claims record the version they were issued
+    with; a different current version means the claims may be stale.
+    """
+
+    __tablename__ = "permission_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True, name="id")
+    version: Mapped[int] = mapped_column(name="int_version", default=0)
+
+
+@event.listens_for(PermissionVersion.__table__, "after_create")
+def _seed_version_row(_table, connection, **_kw) -> None:
+    """`metadata.create_all` seeds the counter row, as migration 0001 does."""
+    connection.execute(
+        insert(PermissionVersion).values(id=PERMISSION_VERSION_ROW_ID, version=0)
+    )
@@ -0,0 +1,45 @@
+"""Model for the refresh tokens issued at login."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.utils.base_model import Base
+
+
+class RefreshToken(Base):
+    """
+    Represents a refresh token issued to a user.
+
+    Only a keyed hash of the token is stored. Each refresh rotates the token
+    inside its family; presenting a revoked token revokes the whole family.
+    """
+
+    __tablename__ = "refresh_token"
+
+    id: Mapped[int] = mapped_column(primary_key=True, name="id")
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), name="user_id", nullable=False
+    )
+    family_id: Mapped[str] = mapped_column(String(32), name="str_family_id")
+    token_hash: Mapped[str] = mapped_column(
+        String(64), name="str_token_hash", info={"filterable": False}
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), name="dt_expires_at"
+    )
+    revoked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), name="dt_revoked_at", nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        name="dt_created_at",
+    )
+
+    __table_args__ = (
+        Index("idx_refresh_token_hash", token_hash, unique=True),
+        Index("idx_refresh_token_family", family_id),
+        Index("idx_refresh_token_expires", expires_at),
+    )
@@ -6,6 +6,8 @@ from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.utils.base_model import AbstractBaseModel
+from app.utils.filters import prefix_index
+from app.utils.search import trigram_index
 
 if TYPE_CHECKING:
     from app.models.assignment import Assignment
@@ -20,14 +22,18 @@ class Role(AbstractBaseModel):
     __tablename__ = "role"
 
     id: Mapped[int] = mapped_column(primary_key=True, name="id")
-    name: Mapped[str] = mapped_column(name="str_name")
+    name: Mapped[str] = mapped_column(name="str_name", info={"searchable": True})
     description: Mapped[str] = mapped_column(name="str_description")
 
     assignments: Mapped[list["Assignment"]] = relationship(
-        back_populates="role", lazy="subquery"
+        back_populates="role", lazy="select"
     )
     authorizations: Mapped[list["Authorization"]] = relationship(
-        back_populates="role", lazy="subquery"
+        back_populates="role", lazy="select"
     )
 
-    __table_args__ = (Index("idx_role_name", name, unique=True),)
+    __table_args__ = (
+        Index("idx_role_name", name, unique=True),
+        prefix_index("idx_role_name_prefix", name),
+        trigram_index("idx_role_name_trgm", name),
+    )
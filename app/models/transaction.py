@@ -6,6 +6,8 @@ from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.utils.base_model import AbstractBaseModel
+from app.utils.filters import prefix_index
+from app.utils.search import trigram_index
 
 if TYPE_CHECKING:
     from app.models.authorization import Authorization
@@ -19,12 +21,16 @@ class Transaction(AbstractBaseModel):
     __tablename__ = "transaction"
 
     id: Mapped[int] = mapped_column(primary_key=True, name="id")
-    name: Mapped[str] = mapped_column(name="str_name")
+    name: Mapped[str] = mapped_column(name="str_name", info={"searchable": True})
     description: Mapped[str] = mapped_column(name="str_description")
     operation_code: Mapped[str] = mapped_column(String(7), name="str_operation_code")
 
     authorizations: Mapped[list["Authorization"]] = relationship(
-        back_populates="transaction", lazy="subquery"
+        back_populates="transaction", lazy="select"
     )
 
-    __table_args__ = (Index("idx_transaction_op_code", operation_code, unique=True),)
+    __table_args__ = (
+        Index("idx_transaction_op_code", operation_code, unique=True),
+        prefix_index("idx_transaction_op_code_prefix", operation_code),
+        trigram_index("idx_transaction_name_trgm", name),
+    )
@@ -6,6 +6,8 @@ from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.utils.base_model import AbstractBaseModel
+from app.utils.filters import prefix_index
+from app.utils.search import trigram_index
 
 if TYPE_CHECKING:
     from app.models.assignment import Assignment
@@ -20,14 +22,22 @@ class User(AbstractBaseModel):
 
     id: Mapped[int] = mapped_column(primary_key=True, name="id")
     display_name: Mapped[str] = mapped_column(name="str_display_name")
-    username: Mapped[str] = mapped_column(name="str_username")
-    password: Mapped[str] = mapped_column(name="str_password")
-    email: Mapped[str] = mapped_column(name="str_email")
+    username: Mapped[str] = mapped_column(
+        name="str_username", info={"searchable": True}
+    )
+    password: Mapped[str] = mapped_column(
+        name="str_password", info={"filterable": False}
+    )
+    email: Mapped[str] = mapped_column(name="str_email", info={"searchable": True})
 
     assignments: Mapped[list["Assignment"]] = relationship(
-        back_populates="user", lazy="subquery"
+        back_populates="user", lazy="select"
     )
     __table_args__ = (
         Index("idx_user_username", username, unique=True),
         Index("idx_user_email", email, unique=True),
+        prefix_index("idx_user_username_prefix", username),
+        prefix_index("idx_user_email_prefix", email),
+        trigram_index("idx_user_username_trgm", username),
+        trigram_index("idx_user_email_trgm", email),
     )
@@ -4,11 +4,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from utils.logging import setup_logging
 
+from app.api.api_key.router import router as api_key_router
 from app.api.assignment.router import router as assignment_router
 from app.api.authentication.router import router as auth_router
 from app.api.authorization.middleware import AuthorizationMiddleware
 from app.api.authorization.router import router as authorization_router
+from app.api.metrics.router import router as metrics_router
 from app.api.role.router import router as role_router
+from app.api.transaction.async_router import router as transaction_async_router
 from app.api.transaction.router import router as transaction_router
 from app.api.user.router import router as user_router
 from app.utils.settings import get_settings
@@ -47,6 +50,14 @@ app = FastAPI(
             "name": "Authorizations",
             "description": "Operations with authorizations",
         },
+        {
+            "name": "API Keys",
+            "description": "Operations with the current user's API keys",
+        },
+        {
+            "name": "Metrics",
+            "description": "Runtime metrics of the worker serving the call",
+        },
     ],
 )
 
@@ -75,12 +86,18 @@ app.add_middleware(AuthorizationMiddleware)
 # ----------------------------------
 app.include_router(user_router, prefix="/users", tags=["Users"])
 app.include_router(auth_router, prefix="/auth", tags=["Auth"])
-app.include_router(transaction_router, prefix="/transaction", tags=["Transactions"])
+app.include_router(
+    transaction_async_router if get_settings().DB_ASYNC else transaction_router,
+    prefix="/transaction",
+    tags=["Transactions"],
+)
 app.include_router(role_router, prefix="/role", tags=["Roles"])
 app.include_router(assignment_router, prefix="/assignment", tags=["Assignments"])
 app.include_router(
     authorization_router, prefix="/authorization", tags=["Authorizations"]
 )
+app.include_router(api_key_router, prefix="/api-keys", tags=["API Keys"])
+app.include_router(metrics_router, prefix="/metrics", tags=["Metrics"])
 # ----------------------------------
 
 
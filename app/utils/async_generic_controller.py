@@ -0,0 +1,323 @@
+"""Generic controller for CRUD operations on an AsyncSession."""
+
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import Generic
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.orm.util import identity_key
+
+from app.utils.bulk import BulkItemResult, chunked
+from app.utils.exceptions import (
+    IntegrityValidationException,
+    ObjectNotFoundException,
+)
+from app.utils.generic_controller import (
+    T,
+    bulk_summary,
+    filtered_select,
+    loaded_columns,
+    rejected_item,
+    select_filtered,
+    split_missing,
+    split_patch_values,
+    split_update_values,
+)
+from app.utils.logging import get_logger
+from app.utils.pagination import Page, build_page, keyset_select
+
+logger = get_logger("AsyncGenericController")
+
+
+class AsyncGenericController(Generic[T]):
+    """
+    Async counterpart of GenericController.
+
+    Same operations, queries and exceptions; every database round trip is
+    awaited so the event loop keeps serving other requests meanwhile.
+    """
+
+    def __init__(self, model: type[T]) -> None:
+        """Initialize the controller with a specific model."""
+        self.model: type[T] = model
+
+    async def get(
+        self,
+        db_session: AsyncSession,
+        obj_id: int,
+        *,
+        options: Sequence[ORMOption] = (),
+    ) -> T:
+        """
+        Get an object by its ID.
+
+        AsyncSession cannot lazy load: pass loader `options` (e.g.
+        `selectinload`) for every relationship the caller is going to read.
+        """
+        instance = await db_session.get(self.model, obj_id, options=options)
+        if not instance:
+            logger.warning(f"Object {self.model.__name__} with ID {obj_id} not found.")
+            raise ObjectNotFoundException(self.model.__name__, str(obj_id))
+        return instance
+
+    async def get_all(
+        self,
+        db_session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        *,
+        filters: Iterable[str] = (),
+        search: str | None = None,
+        options: Sequence[ORMOption] = (),
+        **kwargs,
+    ) -> list[T]:
+        """Get all objects with optional filtering, pagination and loader options."""
+        query = select_filtered(
+            self.model, skip, limit, filters, search, **kwargs
+        ).options(*options)
+        result = list((await db_session.scalars(query)).all())
+        logger.info(f"Returned {len(result)} objects of type {self.model.__name__}.")
+        return result
+
+    async def get_page(
+        self,
+        db_session: AsyncSession,
+        limit: int = 100,
+        cursor: str | None = None,
+        skip: int = 0,
+        order_by: str | None = None,
+        *,
+        filters: Iterable[str] = (),
+        search: str | None = None,
+        options: Sequence[ORMOption] = (),
+        **kwargs,
+    ) -> Page[T]:
+        """Get one page of objects and the cursor of the next page."""
+        query = keyset_select(
+            self.model,
+            filtered_select(self.model, filters, search, **kwargs),
+            limit,
+            cursor,
+            skip,
+            order_by,
+        )
+        rows = list((await db_session.scalars(query.options(*options))).all())
+        page = build_page(self.model, rows, limit, order_by)
+        logger.info(
+            f"Returned page of {len(page.items)} objects of type "
+            f"{self.model.__name__} more={page.next_cursor is not None}."
+        )
+        return page
+
+    async def delete(self, db_session: AsyncSession, obj_id: int) -> None:
+        """Delete an object by its ID."""
+        instance = await self.get(db_session, obj_id)
+
+        await db_session.delete(instance)
+        await db_session.commit()
+        logger.info(
+            f"Object {self.model.__name__} with ID {obj_id} deleted successfully."
+        )
+
+    async def save(self, db_session: AsyncSession, obj: T) -> T:
+        """
+        Save a new object to the database.
+
+        The INSERT returns the server defaults and the session does not expire
+        on commit, so the saved object is returned without selecting it again.
+        """
+        try:
+            db_session.add(obj)
+            await db_session.commit()
+            logger.info(f"Object {self.model.__name__} saved successfully.")
+        except IntegrityError as exc:
+            await db_session.rollback()
+            logger.error(f"Error saving object {self.model.__name__}: {exc.args[0]}")
+            raise IntegrityValidationException(exc.args[0]) from exc
+        return obj
+
+    async def update(self, db_session: AsyncSession, obj: T) -> T:
+        """
+        Update an existing object with a single UPDATE ... RETURNING.
+
+        Columns equal to those of the copy already in the session are not
+        written, and nothing is written when none changes; audit columns are
+        only written along with a change.
+        """
+        obj_id = getattr(obj, "id", None)
+        if obj_id is None:
+            raise ValueError("Object must have an 'id' attribute for update operations")
+
+        instance = db_session.identity_map.get(identity_key(self.model, obj_id))
+        loaded = loaded_columns(instance) if instance is not None else {}
+        changes, audit = split_update_values(obj, loaded)
+        if instance is not None and not changes:
+            logger.info(
+                f"Object {self.model.__name__} with ID {obj_id} has no changes."
+            )
+            return instance
+
+        statement = (
+            update(self.model)
+            .where(self.model.id == obj_id)
+            .values(**changes, **audit)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        try:
+            instance = (await db_session.scalars(statement)).one_or_none()
+        except IntegrityError as exc:
+            await db_session.rollback()
+            logger.error(
+                f"Error updating object {self.model.__name__} "
+                f"with ID {obj_id}: {exc.args[0]}"
+            )
+            raise IntegrityValidationException(exc.args[0]) from exc
+        if instance is None:
+            logger.warning(f"Object {self.model.__name__} with ID {obj_id} not found.")
+            raise ObjectNotFoundException(self.model.__name__, str(obj_id))
+
+        await self._commit(db_session, obj_id, "updating")
+        logger.info(
+            f"Object {self.model.__name__} with ID {obj_id} updated "
+            f"fields={sorted(changes)}."
+        )
+        return instance
+
+    async def partial_update(
+        self, db_session: AsyncSession, obj_id: int, values: dict
+    ) -> T:
+        """
+        Update only the given columns of an existing object.
+
+        Values equal to the stored ones are skipped, and nothing is written when
+        no column changes. Audit columns are only written along with a change.
+        """
+        instance = await self.get(db_session, obj_id)
+
+        changes, audit = split_patch_values(self.model, instance, values)
+        if not changes:
+            logger.info(
+                f"Object {self.model.__name__} with ID {obj_id} has no changes."
+            )
+            return instance
+
+        for key, value in {**changes, **audit}.items():
+            setattr(instance, key, value)
+
+        await self._commit(db_session, obj_id, "patching")
+        logger.info(
+            f"Object {self.model.__name__} with ID {obj_id} patched "
+            f"fields={sorted(changes)}."
+        )
+        await db_session.refresh(instance)
+        return instance
+
+    async def bulk_save(
+        self, db_session: AsyncSession, rows: Sequence[dict]
+    ) -> list[BulkItemResult]:
+        """Insert many rows, with one multi-row INSERT ... RETURNING per chunk."""
+        statement = insert(self.model).returning(
+            self.model.id, sort_by_parameter_order=True
+        )
+
+        async def run(indexes: list[int]) -> list[int]:
+            created = await db_session.scalars(statement, [rows[i] for i in indexes])
+            return list(created)
+
+        results = []
+        for indexes in chunked(rows):
+            results.extend(await self._bulk_chunk(db_session, list(indexes), run, None))
+        await db_session.commit()
+        return bulk_summary(self.model, results, "saved")
+
+    async def bulk_partial_update(
+        self, db_session: AsyncSession, rows: Sequence[dict]
+    ) -> list[BulkItemResult]:
+        """Update the given columns of many objects; every row carries its `id`."""
+        ids = [row["id"] for row in rows]
+
+        async def run(indexes: list[int]) -> list[int]:
+            await db_session.execute(update(self.model), [rows[i] for i in indexes])
+            return [ids[i] for i in indexes]
+
+        results = []
+        for indexes in chunked(rows):
+            existing, missing = await self._split_missing(db_session, ids, indexes)
+            results.extend(missing)
+            results.extend(await self._bulk_chunk(db_session, existing, run, ids))
+        await db_session.commit()
+        return bulk_summary(self.model, results, "updated")
+
+    async def bulk_delete(
+        self, db_session: AsyncSession, ids: Sequence[int]
+    ) -> list[BulkItemResult]:
+        """Delete many objects by ID, with one DELETE ... IN per chunk."""
+
+        async def run(indexes: list[int]) -> list[int]:
+            chunk = [ids[i] for i in indexes]
+            await db_session.execute(
+                delete(self.model)
+                .where(self.model.id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+            return chunk
+
+        results = []
+        for indexes in chunked(ids):
+            existing, missing = await self._split_missing(db_session, ids, indexes)
+            results.extend(missing)
+            results.extend(await self._bulk_chunk(db_session, existing, run, ids))
+        await db_session.commit()
+        return bulk_summary(self.model, results, "deleted")
+
+    async def _split_missing(
+        self, db_session: AsyncSession, ids: Sequence[int], indexes: range
+    ) -> tuple[list[int], list[BulkItemResult]]:
+        found = await db_session.scalars(
+            select(self.model.id).where(self.model.id.in_([ids[i] for i in indexes]))
+        )
+        return split_missing(self.model, ids, indexes, set(found))
+
+    async def _bulk_chunk(
+        self,
+        db_session: AsyncSession,
+        indexes: list[int],
+        run: Callable[[list[int]], Awaitable[list[int]]],
+        ids: Sequence[int] | None,
+    ) -> list[BulkItemResult]:
+        """Run a chunk in a savepoint, retrying item by item if it is rejected."""
+        if not indexes:
+            return []
+        try:
+            async with db_session.begin_nested():
+                created = await run(indexes)
+        except IntegrityError as exc:
+            if len(indexes) == 1:
+                obj_id = ids[indexes[0]] if ids is not None else None
+                return [rejected_item(self.model, indexes[0], obj_id, exc)]
+            logger.info(
+                f"Chunk of {len(indexes)} {self.model.__name__} rejected; "
+                "retrying row by row."
+            )
+            results = []
+            for index in indexes:
+                results.extend(await self._bulk_chunk(db_session, [index], run, ids))
+            return results
+        return [
+            BulkItemResult(index, obj_id)
+            for index, obj_id in zip(indexes, created, strict=True)
+        ]
+
+    async def _commit(self, db_session: AsyncSession, obj_id: int, action: str):
+        try:
+            await db_session.commit()
+        except IntegrityError as exc:
+            await db_session.rollback()
+            logger.error(
+                f"Error {action} object {self.model.__name__} "
+                f"with ID {obj_id}: {exc.args[0]}"
+            )
+            raise IntegrityValidationException(exc.args[0]) from exc
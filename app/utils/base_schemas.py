@@ -25,3 +25,26 @@ class BaseAuditModelSchema(BaseModel):
 
     audit_created_at: datetime
     audit_updated_on: datetime
+
+
+class CursorPageSchema(BaseModel):
+    """Base schema for lists paginated by cursor; None on the last page."""
+
+    next_cursor: str | None = None
+
+
+class BulkItemResultSchema(BaseModel):
+    """Outcome of one item of a bulk request, by its position in the body."""
+
+    index: int
+    status_code: int
+    id: int | None = None
+    detail: str | None = None
+
+
+class BulkResultSchema(BaseModel):
+    """Per-item outcome of a bulk request; failed items do not abort the rest."""
+
+    succeeded: int
+    failed: int
+    results: list[BulkItemResultSchema]
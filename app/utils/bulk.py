@@ -0,0 +1,73 @@
+"""Bulk request bodies, chunking and per-item results of the bulk routes."""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Annotated, Any, TypeVar
+
+from fastapi import Body
+from fastapi import status as HTTP_STATUS
+
+from app.utils.exceptions import ObjectNotFoundException
+from app.utils.settings import get_settings
+
+ItemT = TypeVar("ItemT")
+
+# List body of a bulk route, bounded by BULK_MAX_ITEMS.
+BulkBody = Annotated[
+    list[ItemT],
+    Body(min_length=1, max_length=get_settings().BULK_MAX_ITEMS),
+]
+
+
+@dataclass(frozen=True)
+class BulkItemResult:
+    """Outcome of one item of a bulk operation; `error` is None on success."""
+
+    index: int
+    id: int | None = None
+    error: Exception | None = None
+
+
+def chunked(items: Sequence[Any], size: int | None = None) -> Iterator[range]:
+    """Index ranges of consecutive chunks of at most BULK_CHUNK_SIZE items."""
+    size = size or get_settings().BULK_CHUNK_SIZE
+    for start in range(0, len(items), size):
+        yield range(start, min(start + size, len(items)))
+
+
+def bulk_response(
+    results: Sequence[BulkItemResult], object_name: str, success_status: int
+) -> dict:
+    """
+    Body of a BulkResultSchema.
+
+    Failed items carry the status and message the single-item route would
+    have answered: 404 when the object does not exist, 400 when the database
+    rejected it.
+    """
+    items = []
+    for result in results:
+        if result.error is None:
+            items.append(
+                {"index": result.index, "status_code": success_status, "id": result.id}
+            )
+        elif isinstance(result.error, ObjectNotFoundException):
+            items.append(
+                {
+                    "index": result.index,
+                    "status_code": HTTP_STATUS.HTTP_404_NOT_FOUND,
+                    "id": result.id,
+                    "detail": f"Object {object_name} was not found",
+                }
+            )
+        else:
+            items.append(
+                {
+                    "index": result.index,
+                    "status_code": HTTP_STATUS.HTTP_400_BAD_REQUEST,
+                    "id": result.id,
+                    "detail": f"Object {object_name} was not accepted",
+                }
+            )
+    failed = sum(1 for result in results if result.error is not None)
+    return {"succeeded": len(results) - failed, "failed": failed, "results": items}
@@ -1,5 +1,7 @@
 """Custom exceptions for the application."""
 
+import math
+
 from fastapi import HTTPException, status
 
 
@@ -16,6 +18,32 @@ class CredentialsValidationException(HTTPException):
         )
 
 
+class HashingCapacityException(HTTPException):
+    """
+    Represents the password hashing queue being full.
+    """
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, try again later",
+            headers={"Retry-After": "1"},
+        )
+
+
+class TooManyRequestsException(HTTPException):
+    """
+    Represents a caller exceeding a rate limit.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, try again later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
 class IncorrectCredentialException(Exception):
     """
     Represents the error of invalid email and password.
@@ -25,6 +53,12 @@ class IncorrectCredentialException(Exception):
         super().__init__("Incorrect email or password")
 
 
+class UnknownUsernameException(IncorrectCredentialException):
+    """
+    Represents invalid credentials for a username that matched no user.
+    """
+
+
 class ObjectAlreadyExistException(Exception):
     """
     Represents an error when trying to register a user with the same username.
@@ -98,3 +132,21 @@ class ObjectConflitException(Exception):
 
     def __init__(self, obj_type: str, obj_id: str):
         super().__init__(f"{obj_type} with ID [{obj_id}] conflict availability")
+
+
+class InvalidPaginationException(HTTPException):
+    """
+    Represents a malformed pagination cursor or an unsupported sort column.
+    """
+
+    def __init__(self, detail: str):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class InvalidFilterException(HTTPException):
+    """
+    Represents a malformed list filter or one a column does not support.
+    """
+
+    def __init__(self, detail: str):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
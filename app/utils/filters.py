@@ -0,0 +1,238 @@
+"""Query filter language, compiled once per model into index-friendly SQL."""
+
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from functools import cache
+from typing import Annotated, Any
+
+from fastapi import Query
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Boolean, ColumnElement, Index, and_, bindparam
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute, MappedColumn
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from app.utils.base_model import AbstractBaseModel
+from app.utils.exceptions import InvalidFilterException
+from app.utils.search import SearchMatch, searchable_columns
+
+# Values accepted by a single `in` filter; keeps the IN list bounded.
+MAX_IN_VALUES = 100
+
+# Python types whose columns can be filtered by range.
+_ORDERABLE_TYPES = (int, float, Decimal, str, date, datetime)
+
+FilterQuery = Annotated[
+    list[str] | None,
+    Query(
+        alias="filter",
+        description=(
+            "Repeatable `field:operator:value` filter. Operators: eq, in "
+            "(comma-separated), prefix, range (`min..max`, either side optional) "
+            "and contains (substring; indexed only on searchable columns)."
+        ),
+    ),
+]
+
+
+@dataclass(frozen=True)
+class FieldFilter:
+    """A filterable column, the operators it accepts and its value parser."""
+
+    column: InstrumentedAttribute
+    adapter: TypeAdapter
+    operators: frozenset[str]
+
+    def parse_value(self, field: str, raw: Any) -> Any:
+        """Coerce a raw value to the column's Python type."""
+        try:
+            return self.adapter.validate_python(raw)
+        except ValidationError as ex:
+            raise InvalidFilterException(
+                f"Invalid value {raw!r} for filter on {field}"
+            ) from ex
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with `prefix`."""
+    stripped = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped:
+        return None
+    last = ord(stripped[-1]) + 1
+    if 0xD800 <= last <= 0xDFFF:
+        last = 0xE000  # Skip the surrogates, which no database stores.
+    return stripped[:-1] + chr(last)
+
+
+def prefix_index(name: str, column: MappedColumn) -> Index:
+    """B-tree index on `column` in the "C" collation; only created on PostgreSQL."""
+    return Index(name, column.column.collate("C")).ddl_if(dialect="postgresql")
+
+
+class PrefixMatch(ColumnElement[bool]):
+    """
+    `column` starts with `prefix`, as `column >= :prefix AND column < :next`.
+
+    The range only holds when the comparison orders strings by code point:
+    under a linguistic collation (en_US.UTF-8, ICU) strings starting with the
+    prefix can sort outside it. SQLite compares with BINARY, which does; on
+    PostgreSQL the range is compared in the "C" collation and is served by
+    the `prefix_index` of the column.
+    """
+
+    inherit_cache = True
+    type = Boolean()
+    _is_implicitly_boolean = True
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("lower", InternalTraversal.dp_clauseelement),
+        ("upper", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column: ColumnElement[str], prefix: str) -> None:
+        self.column = column
+        self.lower = bindparam(None, prefix, unique=True)
+        upper = _prefix_upper_bound(prefix)
+        self.upper = None if upper is None else bindparam(None, upper, unique=True)
+
+
+def _prefix_range(
+    element: PrefixMatch, column: ColumnElement[str]
+) -> ColumnElement[bool]:
+    if element.upper is None:
+        return column >= element.lower
+    return and_(column >= element.lower, column < element.upper)
+
+
+@compiles(PrefixMatch)
+def _compile_prefix_match(element: PrefixMatch, compiler, **kw) -> str:
+    return compiler.process(_prefix_range(element, element.column), **kw)
+
+
+@compiles(PrefixMatch, "postgresql")
+def _compile_prefix_match_postgresql(element: PrefixMatch, compiler, **kw) -> str:
+    collated = element.column.collate("C")
+    return compiler.process(_prefix_range(element, collated), **kw)
+
+
+class FilterPlan:
+    """
+    Filterable columns of a model and how each operator compiles to SQL.
+
+    Built once per model by `filter_plan`. Every column is filterable unless
+    it sets `info={"filterable": False}`. `eq`, `in`, `range` and `prefix`
+    compile to comparisons a B-tree index can seek: `prefix` becomes
+    `column >= :prefix AND column < :next` (see `PrefixMatch`), never a LIKE.
+    `contains` scans unless the column is searchable (see
+    `app.utils.search`), in which case it uses the search index.
+    """
+
+    def __init__(self, model: type[AbstractBaseModel]) -> None:
+        self.model = model
+        self.searchable = searchable_columns(model.__table__)
+        self.fields: dict[str, FieldFilter] = {}
+        for attr in model.__mapper__.column_attrs:
+            column = attr.columns[0]
+            if not column.info.get("filterable", True):
+                continue
+            python_type = column.type.python_type
+            operators = {"eq", "in"}
+            if issubclass(python_type, _ORDERABLE_TYPES):
+                operators.add("range")
+            if issubclass(python_type, str):
+                operators.update(("prefix", "contains"))
+            self.fields[attr.key] = FieldFilter(
+                getattr(model, attr.key), TypeAdapter(python_type), frozenset(operators)
+            )
+
+    def field(self, name: str) -> FieldFilter:
+        """The filter of a column, by attribute name."""
+        field = self.fields.get(name)
+        if field is None:
+            raise InvalidFilterException(
+                f"Cannot filter {self.model.__name__} by {name}; "
+                f"use one of {sorted(self.fields)}"
+            )
+        return field
+
+    def criterion(self, name: str, operator: str, raw: Any) -> ColumnElement[bool]:
+        """Compile one filter into a SQL condition."""
+        field = self.field(name)
+        if operator not in field.operators:
+            raise InvalidFilterException(
+                f"Operator {operator} is not supported on {name}; "
+                f"use one of {sorted(field.operators)}"
+            )
+        column = field.column
+
+        if operator == "eq":
+            return column == field.parse_value(name, raw)
+
+        if operator == "in":
+            values = raw.split(",") if isinstance(raw, str) else list(raw)
+            if not values or len(values) > MAX_IN_VALUES:
+                raise InvalidFilterException(
+                    f"Filter {name}:in takes 1 to {MAX_IN_VALUES} values"
+                )
+            return column.in_([field.parse_value(name, value) for value in values])
+
+        if operator == "range":
+            low, separator, high = str(raw).partition("..")
+            if not separator or not (low or high):
+                raise InvalidFilterException(
+                    f"Filter {name}:range takes min..max, either side optional"
+                )
+            bounds = []
+            if low:
+                bounds.append(column >= field.parse_value(name, low))
+            if high:
+                bounds.append(column <= field.parse_value(name, high))
+            return and_(*bounds)
+
+        value = field.parse_value(name, raw)
+        if not value:
+            raise InvalidFilterException(f"Filter {name}:{operator} takes a value")
+        if operator == "contains":
+            table_column = column.property.columns[0]
+            if table_column.info.get("searchable"):
+                return SearchMatch([table_column], value)
+            return column.icontains(value, autoescape=True)
+
+        return PrefixMatch(column.property.columns[0], value)
+
+    def parse(self, expression: str) -> ColumnElement[bool]:
+        """Compile a `field:operator:value` query parameter."""
+        name, _, rest = expression.partition(":")
+        operator, separator, raw = rest.partition(":")
+        if not separator:
+            raise InvalidFilterException(
+                f"Invalid filter {expression!r}; expected field:operator:value"
+            )
+        return self.criterion(name, operator, raw)
+
+    def search(self, term: str) -> ColumnElement[bool]:
+        """Substring match of `term` in any searchable column."""
+        if not self.searchable:
+            raise InvalidFilterException(f"{self.model.__name__} is not searchable")
+        return SearchMatch(self.searchable, term)
+
+    def where(
+        self, expressions: Iterable[str] = (), search: str | None = None, **equals: Any
+    ) -> list[ColumnElement[bool]]:
+        """Conditions for filter expressions, a search term and equalities."""
+        criteria = [self.parse(expression) for expression in expressions]
+        if search:
+            criteria.append(self.search(search))
+        criteria.extend(
+            self.criterion(name, "eq", value) for name, value in equals.items()
+        )
+        return criteria
+
+
+@cache
+def filter_plan(model: type[AbstractBaseModel]) -> FilterPlan:
+    """The filter plan of `model`, compiled on first use."""
+    return FilterPlan(model)
@@ -1,23 +1,167 @@
 """Generic controller for CRUD operations."""
 
+from collections.abc import Callable, Iterable, Sequence
 from typing import Generic, TypeVar
 
-from sqlalchemy import String, and_, select
+from sqlalchemy import Select, delete, insert, inspect, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.orm.util import identity_key
 from utils.logging import get_logger
 
 from app.utils.base_model import AbstractBaseModel
+from app.utils.bulk import BulkItemResult, chunked
 from app.utils.exceptions import (
     IntegrityValidationException,
     ObjectNotFoundException,
 )
+from app.utils.filters import filter_plan
+from app.utils.pagination import Page, build_page, keyset_select
 
 logger = get_logger("GenericController")
 
 T = TypeVar("T", bound=AbstractBaseModel)
 
 
+def filtered_select(
+    model: type[AbstractBaseModel],
+    filters: Iterable[str] = (),
+    search: str | None = None,
+    **kwargs,
+) -> Select:
+    """
+    Select `model` rows matching the filters, without ordering or paging.
+
+    `filters` are `field:operator:value` expressions (see `FilterPlan`),
+    `search` a substring looked up in the searchable columns, and keyword
+    arguments are matched by equality.
+    """
+    return select(model).where(*filter_plan(model).where(filters, search, **kwargs))
+
+
+def loaded_columns(obj: AbstractBaseModel) -> dict:
+    """
+    Column values loaded on `obj`, including the server-generated ones (id,
+    audit timestamps) read back with INSERT/UPDATE ... RETURNING.
+    """
+    state = inspect(obj)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+
+
+def keep_columns(obj: AbstractBaseModel, values: dict) -> None:
+    """Load `values` back on `obj` after the commit expired them."""
+    for key, value in values.items():
+        set_committed_value(obj, key, value)
+
+
+def select_filtered(
+    model: type[AbstractBaseModel],
+    skip: int = 0,
+    limit: int = 100,
+    filters: Iterable[str] = (),
+    search: str | None = None,
+    **kwargs,
+) -> Select:
+    """
+    Build the paginated select used by get_all, ordered by primary key so
+    offset pages are stable.
+    """
+    return (
+        filtered_select(model, filters, search, **kwargs)
+        .order_by(*model.__mapper__.primary_key)
+        .offset(skip)
+        .limit(limit)
+    )
+
+
+def split_patch_values(
+    model: type[AbstractBaseModel], instance: AbstractBaseModel, values: dict
+) -> tuple[dict, dict]:
+    """
+    Split partial update values into changed columns and audit columns.
+
+    Raises ValueError for keys that are not columns of the model.
+    """
+    columns = {attr.key for attr in model.__mapper__.column_attrs}
+    unknown = set(values) - columns
+    if unknown:
+        raise ValueError(f"Unknown fields for {model.__name__}: {unknown}")
+
+    audit = {k: v for k, v in values.items() if k.startswith("audit_")}
+    changes = {
+        key: value
+        for key, value in values.items()
+        if key not in audit and getattr(instance, key) != value
+    }
+    return changes, audit
+
+
+def split_update_values(obj: AbstractBaseModel, loaded: dict) -> tuple[dict, dict]:
+    """
+    Split the columns of a full update into changed columns and audit columns.
+
+    `loaded` holds the stored values of the object when the session already
+    has it; columns equal to them are skipped. Otherwise every column is sent.
+    """
+    changes = {
+        key: value
+        for key, value in obj.as_dict().items()
+        if key != "id" and (key not in loaded or loaded[key] != value)
+    }
+    audit = {
+        key: value
+        for key, value in inspect(obj).dict.items()
+        if key.startswith("audit_") and value is not None
+    }
+    return changes, audit
+
+
+def split_missing(
+    model: type[AbstractBaseModel],
+    ids: Sequence[int],
+    indexes: Iterable[int],
+    found: set[int],
+) -> tuple[list[int], list[BulkItemResult]]:
+    """
+    Split bulk item indexes into those whose id exists and not-found results.
+    """
+    existing, missing = [], []
+    for index in indexes:
+        if ids[index] in found:
+            existing.append(index)
+        else:
+            error = ObjectNotFoundException(model.__name__, str(ids[index]))
+            missing.append(BulkItemResult(index, ids[index], error))
+    return existing, missing
+
+
+def rejected_item(
+    model: type[AbstractBaseModel], index: int, obj_id: int | None, exc: IntegrityError
+) -> BulkItemResult:
+    """Result of a bulk item the database refused."""
+    logger.warning(f"Bulk item {index} of {model.__name__} rejected: {exc.args[0]}")
+    return BulkItemResult(index, obj_id, IntegrityValidationException(exc.args[0]))
+
+
+def bulk_summary(
+    model: type[AbstractBaseModel], results: list[BulkItemResult], action: str
+) -> list[BulkItemResult]:
+    """Log the outcome of a bulk operation and order its results by index."""
+    results.sort(key=lambda result: result.index)
+    failed = sum(1 for result in results if result.error is not None)
+    logger.info(
+        f"Bulk {action} {len(results) - failed} objects of type "
+        f"{model.__name__}, {failed} failed."
+    )
+    return results
+
+
 class GenericController(Generic[T]):
     """Generic controller for CRUD operations."""
 
@@ -25,34 +169,77 @@ class GenericController(Generic[T]):
         """Initialize the controller with a specific model."""
         self.model: type[T] = model
 
-    def get(self, db_session: Session, obj_id: int) -> T:
-        """Get an object by its ID."""
-        instance = db_session.get(self.model, obj_id)
+    def get(
+        self, db_session: Session, obj_id: int, *, options: Sequence[ORMOption] = ()
+    ) -> T:
+        """
+        Get an object by its ID.
+
+        Relationships load lazily; pass loader `options` (e.g. `selectinload`)
+        for the ones the caller is going to read.
+        """
+        instance = db_session.get(self.model, obj_id, options=options)
         if not instance:
             logger.warning(f"Object {self.model.__name__} with ID {obj_id} not found.")
             raise ObjectNotFoundException(self.model.__name__, str(obj_id))
         return instance
 
     def get_all(
-        self, db_session: Session, skip: int = 0, limit: int = 100, **kwargs
+        self,
+        db_session: Session,
+        skip: int = 0,
+        limit: int = 100,
+        *,
+        filters: Iterable[str] = (),
+        search: str | None = None,
+        options: Sequence[ORMOption] = (),
+        **kwargs,
     ) -> list[T]:
-        """Get all objects with optional filtering and pagination."""
-        query = select(self.model)
-        if kwargs:
-            criteria_and = []
-            for key, value in kwargs.items():
-                field = getattr(self.model, key)
-                if isinstance(field.property.columns[0].type, String):
-                    criteria_and.append(field.ilike(f"%{value}%"))
-                else:
-                    criteria_and.append(field == value)
-
-            query = query.filter(and_(*criteria_and))
-
-        result = list(db_session.scalars(query.offset(skip).limit(limit)).all())
+        """Get all objects with optional filtering, pagination and loader options."""
+        query = select_filtered(
+            self.model, skip, limit, filters, search, **kwargs
+        ).options(*options)
+        result = list(db_session.scalars(query).all())
         logger.info(f"Returned {len(result)} objects of type {self.model.__name__}.")
         return result
 
+    def get_page(
+        self,
+        db_session: Session,
+        limit: int = 100,
+        cursor: str | None = None,
+        skip: int = 0,
+        order_by: str | None = None,
+        *,
+        filters: Iterable[str] = (),
+        search: str | None = None,
+        options: Sequence[ORMOption] = (),
+        **kwargs,
+    ) -> Page[T]:
+        """
+        Get one page of objects and the cursor of the next page.
+
+        Pages follow the primary key, or `order_by` when it names a column with
+        a single-column unique index. Passing the returned `next_cursor` back
+        continues right after the last row (keyset pagination), so every page
+        costs the same; `skip` is only used when no cursor is given.
+        """
+        query = keyset_select(
+            self.model,
+            filtered_select(self.model, filters, search, **kwargs),
+            limit,
+            cursor,
+            skip,
+            order_by,
+        )
+        rows = list(db_session.scalars(query.options(*options)).all())
+        page = build_page(self.model, rows, limit, order_by)
+        logger.info(
+            f"Returned page of {len(page.items)} objects of type "
+            f"{self.model.__name__} more={page.next_cursor is not None}."
+        )
+        return page
+
     def delete(self, db_session: Session, obj_id: int) -> None:
         """Delete an object by its ID."""
         instance = self.get(db_session, obj_id)
@@ -66,11 +253,18 @@ class GenericController(Generic[T]):
         )
 
     def save(self, db_session: Session, obj: T) -> T:
-        """Save a new object to the database."""
+        """
+        Save a new object to the database.
+
+        The INSERT returns the server defaults, which are kept loaded through
+        the commit instead of selecting the row again.
+        """
         try:
             db_session.add(obj)
+            db_session.flush()
+            values = loaded_columns(obj)
             db_session.commit()
-            db_session.refresh(obj)
+            keep_columns(obj, values)
             logger.info(f"Object {self.model.__name__} saved successfully.")
         except IntegrityError as exc:
             db_session.rollback()
@@ -79,30 +273,205 @@ class GenericController(Generic[T]):
         return obj
 
     def update(self, db_session: Session, obj: T) -> T:
-        """Update an existing object in the database."""
+        """
+        Update an existing object with a single UPDATE ... RETURNING.
+
+        Columns equal to those of the copy already in the session are not
+        written, and nothing is written when none changes; audit columns are
+        only written along with a change. The returned row is kept loaded
+        through the commit, so the object is not selected again.
+        """
         obj_id = getattr(obj, "id", None)
         if obj_id is None:
             raise ValueError("Object must have an 'id' attribute for update operations")
 
+        instance = db_session.identity_map.get(identity_key(self.model, obj_id))
+        loaded = loaded_columns(instance) if instance is not None else {}
+        changes, audit = split_update_values(obj, loaded)
+        if instance is not None and not changes:
+            logger.info(
+                f"Object {self.model.__name__} with ID {obj_id} has no changes."
+            )
+            return instance
+
+        statement = (
+            update(self.model)
+            .where(self.model.id == obj_id)
+            .values(**changes, **audit)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        try:
+            instance = db_session.scalars(statement).one_or_none()
+            if instance is None:
+                logger.warning(
+                    f"Object {self.model.__name__} with ID {obj_id} not found."
+                )
+                raise ObjectNotFoundException(self.model.__name__, str(obj_id))
+            values = loaded_columns(instance)
+            db_session.commit()
+            keep_columns(instance, values)
+            logger.info(
+                f"Object {self.model.__name__} with ID {obj_id} updated "
+                f"fields={sorted(changes)}."
+            )
+        except IntegrityError as exc:
+            db_session.rollback()
+            logger.error(
+                f"Error updating object {self.model.__name__} "
+                f"with ID {obj_id}: {exc.args[0]}"
+            )
+            raise IntegrityValidationException(exc.args[0]) from exc
+        return instance
+
+    def partial_update(self, db_session: Session, obj_id: int, values: dict) -> T:
+        """
+        Update only the given columns of an existing object.
+
+        Values equal to the stored ones are skipped, and nothing is written when
+        no column changes. Audit columns are only written along with a change.
+        """
         instance = self.get(db_session, obj_id)
-        if not instance:
-            raise ObjectNotFoundException(self.model.__name__, str(obj_id))
 
-        for key, value in obj.as_dict().items():
+        changes, audit = split_patch_values(self.model, instance, values)
+        if not changes:
+            logger.info(
+                f"Object {self.model.__name__} with ID {obj_id} has no changes."
+            )
+            return instance
+
+        for key, value in {**changes, **audit}.items():
             setattr(instance, key, value)
 
         try:
             db_session.commit()
             logger.info(
-                f"Object {self.model.__name__} with ID {obj_id} updated successfully."
+                f"Object {self.model.__name__} with ID {obj_id} patched "
+                f"fields={sorted(changes)}."
             )
         except IntegrityError as exc:
             db_session.rollback()
             logger.error(
-                f"Error updating object {self.model.__name__} "
+                f"Error patching object {self.model.__name__} "
                 f"with ID {obj_id}: {exc.args[0]}"
             )
             raise IntegrityValidationException(exc.args[0]) from exc
 
         db_session.refresh(instance)
         return instance
+
+    def bulk_save(
+        self, db_session: Session, rows: Sequence[dict]
+    ) -> list[BulkItemResult]:
+        """
+        Insert many rows, with one multi-row INSERT ... RETURNING per chunk.
+
+        `rows` hold attribute values, as passed to the model constructor. A
+        chunk the database rejects is retried row by row, so only the offending
+        rows fail; everything else is committed once, at the end.
+        """
+        statement = insert(self.model).returning(
+            self.model.id, sort_by_parameter_order=True
+        )
+
+        def run(indexes: list[int]) -> list[int]:
+            return list(db_session.scalars(statement, [rows[i] for i in indexes]))
+
+        results = []
+        for indexes in chunked(rows):
+            results.extend(self._bulk_chunk(db_session, list(indexes), run, None))
+        db_session.commit()
+        return bulk_summary(self.model, results, "saved")
+
+    def bulk_partial_update(
+        self, db_session: Session, rows: Sequence[dict]
+    ) -> list[BulkItemResult]:
+        """
+        Update the given columns of many objects; every row carries its `id`.
+
+        Each chunk is one executemany UPDATE by primary key. Ids that do not
+        exist fail with ObjectNotFoundException.
+        """
+        ids = [row["id"] for row in rows]
+
+        def run(indexes: list[int]) -> list[int]:
+            db_session.execute(update(self.model), [rows[i] for i in indexes])
+            return [ids[i] for i in indexes]
+
+        results = []
+        for indexes in chunked(rows):
+            existing, missing = self._split_missing(db_session, ids, indexes)
+            results.extend(missing)
+            results.extend(self._bulk_chunk(db_session, existing, run, ids))
+        db_session.commit()
+        return bulk_summary(self.model, results, "updated")
+
+    def bulk_delete(
+        self, db_session: Session, ids: Sequence[int]
+    ) -> list[BulkItemResult]:
+        """
+        Delete many objects by ID, with one DELETE ... IN per chunk.
+
+        Ids that do not exist fail with ObjectNotFoundException.
+        """
+
+        def run(indexes: list[int]) -> list[int]:
+            chunk = [ids[i] for i in indexes]
+            db_session.execute(
+                delete(self.model)
+                .where(self.model.id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+            return chunk
+
+        results = []
+        for indexes in chunked(ids):
+            existing, missing = self._split_missing(db_session, ids, indexes)
+            results.extend(missing)
+            results.extend(self._bulk_chunk(db_session, existing, run, ids))
+        db_session.commit()
+        return bulk_summary(self.model, results, "deleted")
+
+    def _split_missing(
+        self, db_session: Session, ids: Sequence[int], indexes: range
+    ) -> tuple[list[int], list[BulkItemResult]]:
+        found = db_session.scalars(
+            select(self.model.id).where(self.model.id.in_([ids[i] for i in indexes]))
+        )
+        return split_missing(self.model, ids, indexes, set(found))
+
+    def _bulk_chunk(
+        self,
+        db_session: Session,
+        indexes: list[int],
+        run: Callable[[list[int]], list[int]],
+        ids: Sequence[int] | None,
+    ) -> list[BulkItemResult]:
+        """
+        Run the statement of a chunk of bulk items inside a savepoint.
+
+        When the database rejects the chunk, every item is retried in a
+        savepoint of its own to find out which ones failed.
+        """
+        if not indexes:
+            return []
+        try:
+            with db_session.begin_nested():
+                created = run(indexes)
+        except IntegrityError as exc:
+            if len(indexes) == 1:
+                obj_id = ids[indexes[0]] if ids is not None else None
+                return [rejected_item(self.model, indexes[0], obj_id, exc)]
+            logger.info(
+                f"Chunk of {len(indexes)} {self.model.__name__} rejected; "
+                "retrying row by row."
+            )
+            return [
+                result
+                for index in indexes
+                for result in self._bulk_chunk(db_session, [index], run, ids)
+            ]
+        return [
+            BulkItemResult(index, obj_id)
+            for index, obj_id in zip(indexes, created, strict=True)
+        ]
@@ -0,0 +1,82 @@
+"""Bounded process pool for CPU-heavy password hashing."""
+
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from app.utils.exceptions import HashingCapacityException
+from app.utils.logging import get_logger
+
+logger = get_logger("HashingExecutor")
+
+
+class HashingExecutor:
+    """
+    Runs password hashing in a dedicated process pool with a bounded queue.
+
+    At most `max_pending` calls may be running or queued at once; further calls
+    fail fast with HashingCapacityException (HTTP 503) instead of piling up
+    behind a login storm. The pool starts lazily, with the `spawn` method so it
+    is safe to create from a multi-threaded server process. With `enabled`
+    off, calls run inline in the calling thread, still bounded.
+    """
+
+    def __init__(
+        self, max_workers: int | None, max_pending: int, enabled: bool = True
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.enabled = enabled
+        self._slots = threading.BoundedSemaphore(max_pending) if max_pending else None
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                logger.info("Starting hashing pool with %s workers", self.max_workers)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _acquire(self) -> None:
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            logger.warning("Hashing queue full max_pending=%s", self.max_pending)
+            raise HashingCapacityException()
+
+    def _release(self, _future: Future | None = None) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue `fn(*args)` in the pool, or raise if the queue is full."""
+        self._acquire()
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run `fn(*args)` through the pool and wait for its result."""
+        if not self.enabled:
+            self._acquire()
+            try:
+                return fn(*args)
+            finally:
+                self._release()
+        return self.submit(fn, *args).result()
+
+    def shutdown(self) -> None:
+        """Stop the pool; it is started again on the next call."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
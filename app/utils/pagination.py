@@ -0,0 +1,126 @@
+"""Keyset (cursor) pagination shared by the sync and async generic controllers."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from sqlalchemy import Column, Select
+
+from app.utils.base_model import AbstractBaseModel
+from app.utils.exceptions import InvalidPaginationException
+
+T = TypeVar("T", bound=AbstractBaseModel)
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of results and the cursor of the next one (None on the last)."""
+
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(order_by: str, value) -> str:
+    """Opaque cursor pointing just after `value` of the `order_by` column."""
+    payload = json.dumps([order_by, value], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, order_by: str, python_type: type | None = None):
+    """
+    Value stored in a cursor, which must have been built for `order_by`.
+
+    With `python_type` the value must also be of the keyset column's type, so
+    a tampered cursor is a 400 and not a database error.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, value = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as ex:
+        raise InvalidPaginationException("Invalid pagination cursor") from ex
+    if key != order_by:
+        raise InvalidPaginationException(
+            f"Cursor was issued for order_by={key}, not {order_by}"
+        )
+    if python_type is not None and not _is_of_type(value, python_type):
+        raise InvalidPaginationException("Invalid pagination cursor")
+    return value
+
+
+def _is_of_type(value, python_type: type) -> bool:
+    """JSON has no separate bool and int: True is not a valid id."""
+    if isinstance(value, bool) and python_type is not bool:
+        return False
+    return isinstance(value, python_type)
+
+
+def keyset_column(model: type[AbstractBaseModel], order_by: str | None) -> Column:
+    """
+    Column a keyset page is ordered by: the primary key by default.
+
+    Any other column must be non-nullable and have a single-column unique
+    index, so it orders rows totally and `column > :last` walks that index.
+    """
+    primary_key = model.__mapper__.primary_key[0]
+    if order_by is None:
+        return primary_key
+
+    allowed = {primary_key.key: primary_key}
+    for index in model.__table__.indexes:
+        if index.unique and len(index.columns) == 1:
+            column = next(iter(index.columns))
+            if not column.nullable:
+                allowed[model.__mapper__.get_property_by_column(column).key] = column
+
+    if order_by not in allowed:
+        raise InvalidPaginationException(
+            f"Cannot paginate {model.__name__} by {order_by}; "
+            f"use one of {sorted(allowed)}"
+        )
+    return allowed[order_by]
+
+
+def keyset_select(
+    model: type[AbstractBaseModel],
+    query: Select,
+    limit: int,
+    cursor: str | None = None,
+    skip: int = 0,
+    order_by: str | None = None,
+) -> Select:
+    """
+    Order `query` for keyset pagination and fetch one row past `limit`.
+
+    With a cursor the page starts right after it, at constant cost however
+    deep the page is; without one it starts at `skip`.
+    """
+    column = keyset_column(model, order_by)
+    query = query.order_by(column)
+    if cursor is not None:
+        value = decode_cursor(cursor, order_key(model, column), column.type.python_type)
+        query = query.where(column > value)
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit + 1)
+
+
+def order_key(model: type[AbstractBaseModel], column: Column) -> str:
+    """Attribute name of a mapped column."""
+    return model.__mapper__.get_property_by_column(column).key
+
+
+def build_page(
+    model: type[AbstractBaseModel],
+    rows: list,
+    limit: int,
+    order_by: str | None = None,
+) -> Page:
+    """Trim the look-ahead row and point the cursor at the last returned row."""
+    if limit < 1 or len(rows) <= limit:
+        return Page(rows[: max(limit, 0)], None)
+
+    items = rows[:limit]
+    key = order_key(model, keyset_column(model, order_by))
+    return Page(items, encode_cursor(key, getattr(items[-1], key)))
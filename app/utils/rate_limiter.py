@@ -0,0 +1,68 @@
+"""In-process token-bucket rate limiter with a bounded number of keys."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket per key: ``limit`` attempts per ``window`` seconds.
+
+    Buckets refill continuously, so a client that stops retrying regains its
+    full burst after one window. Only the ``maxsize`` most recently used keys
+    are tracked; evicting a key forgets its history, which errs towards
+    allowing. Each uvicorn worker keeps its own buckets. A ``limit`` of zero
+    disables the limiter.
+    """
+
+    def __init__(self, limit: int, window: float, maxsize: int) -> None:
+        self.limit = limit
+        self.window = window
+        self.maxsize = maxsize
+        self.rejected = 0
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the limiter rejects anything at all."""
+        return self.limit > 0 and self.window > 0 and self.maxsize > 0
+
+    def hit(self, key: Hashable) -> float:
+        """
+        Spend one attempt for ``key``.
+
+        Returns 0 when the attempt is allowed, otherwise the seconds until the
+        next attempt would be.
+        """
+        if not self.enabled:
+            return 0.0
+
+        rate = self.limit / self.window
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (self.limit, now))
+            tokens = min(self.limit, tokens + (now - updated_at) * rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                retry_after = 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                self.rejected += 1
+                retry_after = (1 - tokens) / rate
+
+            if len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+            return retry_after
+
+    def reset(self, key: Hashable) -> None:
+        """Forget the attempts spent by ``key``."""
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._buckets.clear()
@@ -0,0 +1,191 @@
+"""
+Indexed substring search: pg_trgm on PostgreSQL, FTS5 trigram tables on SQLite.
+
+Columns opt in with `info={"searchable": True}`. On PostgreSQL each one also
+declares a `trigram_index`, which serves `ILIKE '%term%'`. On SQLite every
+table with searchable columns gets an external-content FTS5 table named
+`<table>_search`, kept in sync by triggers, which `SearchMatch` queries
+instead of scanning the table.
+"""
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ColumnElement,
+    Index,
+    MetaData,
+    Table,
+    bindparam,
+    event,
+    or_,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import MappedColumn
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from app.utils.base_model import Base
+
+# Trigram indexes cannot narrow shorter terms; those fall back to a scan.
+SEARCH_MIN_LENGTH = 3
+
+
+def trigram_index(name: str, column: MappedColumn) -> Index:
+    """GIN pg_trgm index on `column`; only created on PostgreSQL."""
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column.column.name: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
+def searchable_columns(table: Table) -> list[Column]:
+    """Columns of `table` marked `info={"searchable": True}`."""
+    return [column for column in table.columns if column.info.get("searchable")]
+
+
+def search_table_name(table: Table) -> str:
+    """Name of the FTS5 table shadowing `table` on SQLite."""
+    return f"{table.name}_search"
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+class SearchMatch(ColumnElement[bool]):
+    """
+    Case-insensitive substring match of a term in any of `columns`.
+
+    Compiles to ILIKE (served by the trigram indexes on PostgreSQL) and, on
+    SQLite, to a lookup in the table's FTS5 shadow table. Terms shorter
+    than SEARCH_MIN_LENGTH always compile to ILIKE.
+    """
+
+    inherit_cache = True
+    type = Boolean()
+    _is_implicitly_boolean = True
+    _traverse_internals = [
+        ("columns", InternalTraversal.dp_clauseelement_tuple),
+        ("pattern", InternalTraversal.dp_clauseelement),
+        ("phrase", InternalTraversal.dp_clauseelement),
+        ("indexed", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, columns: list[Column], term: str) -> None:
+        self.columns = tuple(columns)
+        self.pattern = bindparam(None, f"%{_escape_like(term)}%", unique=True)
+        names = " ".join(column.name for column in self.columns)
+        quoted = term.replace('"', '""')
+        self.phrase = bindparam(None, f'{{{names}}} : "{quoted}"', unique=True)
+        self.indexed = len(term) >= SEARCH_MIN_LENGTH
+
+
+def _ilike(element: SearchMatch) -> ColumnElement[bool]:
+    return or_(
+        *(column.ilike(element.pattern, escape="/") for column in element.columns)
+    )
+
+
+@compiles(SearchMatch)
+def _compile_search_match(element: SearchMatch, compiler, **kw) -> str:
+    return compiler.process(_ilike(element), **kw)
+
+
+@compiles(SearchMatch, "sqlite")
+def _compile_search_match_sqlite(element: SearchMatch, compiler, **kw) -> str:
+    if not element.indexed:
+        return compiler.process(_ilike(element), **kw)
+    table = element.columns[0].table
+    primary_key = compiler.process(table.primary_key.columns[0], **kw)
+    fts = compiler.preparer.quote(search_table_name(table))
+    phrase = compiler.process(element.phrase, **kw)
+    return f"{primary_key} IN (SELECT rowid FROM {fts} WHERE {fts} MATCH {phrase})"
+
+
+def sqlite_search_ddl(table: Table) -> list[str]:
+    """Statements creating and filling the FTS5 shadow table of `table`."""
+    fts = search_table_name(table)
+    source = f'"{table.name}"'
+    key = table.primary_key.columns[0].name
+    names = [column.name for column in searchable_columns(table)]
+    columns = ", ".join(names)
+    new = ", ".join(f"new.{name}" for name in names)
+    old = ", ".join(f"old.{name}" for name in names)
+    insert = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{key}, {new});"
+    delete = (
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) "
+        f"VALUES ('delete', old.{key}, {old});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, "
+        f"content='{table.name}', content_rowid='{key}', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} "
+        f"BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} "
+        f"BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} "
+        f"ON {source} BEGIN {delete} {insert} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def sqlite_search_drop_ddl(table: Table) -> list[str]:
+    """Statements dropping the FTS5 shadow table of `table` and its triggers."""
+    fts = search_table_name(table)
+    return [
+        *(f"DROP TRIGGER IF EXISTS {fts}_{suffix}" for suffix in ("ai", "ad", "au")),
+        f"DROP TABLE IF EXISTS {fts}",
+    ]
+
+
+def _searchable_tables(metadata: MetaData) -> list[Table]:
+    return [table for table in metadata.sorted_tables if searchable_columns(table)]
+
+
+def autogenerate_filter(dialect_name: str):
+    """
+    Alembic `include_object` hook that leaves the search objects alone.
+
+    Autogenerate would otherwise drop the FTS5 tables (and their shadow
+    tables) it finds on SQLite, and add the PostgreSQL-only trigram and
+    prefix (`app.utils.filters.prefix_index`) indexes on every other database.
+    """
+    fts_tables = {
+        search_table_name(table) for table in _searchable_tables(Base.metadata)
+    }
+
+    def include_object(_obj, name, type_, reflected, _compare_to) -> bool:
+        if type_ == "table" and reflected:
+            return not any(
+                name == fts or name.startswith(f"{fts}_") for fts in fts_tables
+            )
+        if type_ == "index" and name.endswith(("_trgm", "_prefix")):
+            return dialect_name == "postgresql"
+        return True
+
+    return include_object
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _create_pg_trgm(_metadata: MetaData, connection, **_kw) -> None:
+    """The trigram indexes need the pg_trgm extension."""
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_sqlite_search_tables(metadata: MetaData, connection, **_kw) -> None:
+    """`metadata.create_all` builds the FTS5 tables along with the schema."""
+    if connection.dialect.name == "sqlite":
+        for table in _searchable_tables(metadata):
+            for statement in sqlite_search_ddl(table):
+                connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_sqlite_search_tables(metadata: MetaData, connection, **_kw) -> None:
+    if connection.dialect.name == "sqlite":
+        for table in _searchable_tables(metadata):
+            for statement in sqlite_search_drop_ddl(table):
+                connection.exec_driver_sql(statement)
@@ -1,11 +1,62 @@
 """Security utilities for password hashing and JWT token management."""
 
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
+import anyio
 import jwt
 from bcrypt import checkpw, gensalt, hashpw
 
+from app.utils.hashing_executor import HashingExecutor
 from app.utils.settings import get_settings
+from app.utils.signing_keys import get_signing_keys
+from app.utils.ttl_cache import TTLCache
+
+API_KEY_MARKER = "fak_"
+
+password_hashing_executor = HashingExecutor(
+    max_workers=get_settings().SECURITY_HASHING_WORKERS,
+    max_pending=get_settings().SECURITY_HASHING_MAX_PENDING,
+    enabled=get_settings().SECURITY_HASHING_POOL_ENABLED,
+)
+
+# Verified JWT payloads keyed by token digest; entries never outlive `exp`.
+verified_token_cache = TTLCache(
+    maxsize=get_settings().SECURITY_TOKEN_CACHE_MAX_ENTRIES,
+    ttl=get_settings().SECURITY_TOKEN_CACHE_TTL_SECONDS,
+)
+
+
+class PasswordVerifyDuration:
+    """Exponentially weighted average of recent password verify durations."""
+
+    def __init__(self, weight: float = 0.1) -> None:
+        self.weight = weight
+        self.seconds: float | None = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Fold a measured verify duration into the average."""
+        with self._lock:
+            if self.seconds is None:
+                self.seconds = seconds
+            else:
+                self.seconds += self.weight * (seconds - self.seconds)
+
+    def reset(self) -> None:
+        """Forget the measurements, e.g. after a bcrypt cost change."""
+        with self._lock:
+            self.seconds = None
+
+
+password_verify_duration = PasswordVerifyDuration()
 
 
 def create_access_token(data: dict) -> str:
@@ -21,39 +72,222 @@ def create_access_token(data: dict) -> str:
     to_encode.update({"iat": current_time})
     to_encode.update({"iss": "FA-Backend"})
 
+    keys = get_signing_keys()
     encoded_jwt = jwt.encode(
         to_encode,
-        get_settings().SECURITY_API_SECRET_KEY,
-        algorithm=get_settings().SECURITY_ALGORITHM,
+        keys.signing_key,
+        algorithm=keys.algorithm,
+        headers=keys.headers,
     )
 
     return encoded_jwt
 
 
-def get_password_hash(password: str) -> str:
-    """Generate a hashed password."""
-    salt = gensalt()
+def _hash_password(password: str, rounds: int) -> str:
+    """Hash a password with bcrypt; runs inside the hashing pool."""
+    salt = gensalt(rounds=rounds)
     return hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
+def _check_password(plain_password: str, hashed_password: str) -> tuple[bool, float]:
+    """
+    Compare a password with a bcrypt hash; runs inside the hashing pool.
+
+    Also returns how long bcrypt took, without the time spent in the queue.
+    """
     plain_password_encoded = plain_password.encode("utf-8")
 
     # Esta converção é necessária para que o bcrypt consiga comparar
     # as senhas quando a string vem do BD.
     hashed_password_bytes = hashed_password.encode("utf-8")
 
-    return checkpw(plain_password_encoded, hashed_password_bytes)
+    start = time.perf_counter()
+    verified = checkpw(plain_password_encoded, hashed_password_bytes)
+    return verified, time.perf_counter() - start
 
 
-def extract_username(jwt_token: str) -> str:
+def get_password_hash(password: str) -> str:
+    """Generate a hashed password in the hashing pool."""
+    return password_hashing_executor.call(
+        _hash_password, password, get_settings().SECURITY_BCRYPT_ROUNDS
+    )
+
+
+# Passwords per hashing pool call of a bulk request; a login queued behind a
+# batch waits for a few hashes, not for the whole request.
+BULK_HASH_BATCH_SIZE = 4
+
+
+def _hash_passwords(passwords: list[str], rounds: int) -> list[str]:
+    """Hash a batch of passwords; runs inside the hashing pool."""
+    return [_hash_password(password, rounds) for password in passwords]
+
+
+def get_password_hashes(passwords: list[str]) -> list[str]:
     """
-    docstring
+    Hash many passwords in small batches, leaving a hashing pool worker free.
+
+    At most `max_workers - 1` batches (and at least one) are in the pool at
+    once, so logins and sign-ups keep a worker, and a bulk request holds a
+    few of the pool's pending slots instead of all of them.
+    """
+    if not passwords:
+        return []
+    rounds = get_settings().SECURITY_BCRYPT_ROUNDS
+    executor = password_hashing_executor
+    if not executor.enabled:
+        return executor.call(_hash_passwords, passwords, rounds)
+    in_flight = max(executor.max_workers - 1, 1)
+    hashes: list[str] = []
+    pending: deque[Future] = deque()
+    for start in range(0, len(passwords), BULK_HASH_BATCH_SIZE):
+        if len(pending) == in_flight:
+            hashes.extend(pending.popleft().result())
+        batch = passwords[start : start + BULK_HASH_BATCH_SIZE]
+        pending.append(executor.submit(_hash_passwords, batch, rounds))
+    while pending:
+        hashes.extend(pending.popleft().result())
+    return hashes
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against a hashed password in the hashing pool."""
+    verified, seconds = password_hashing_executor.call(
+        _check_password, plain_password, hashed_password
+    )
+    # Only hashes at the configured cost measure what a failed login costs.
+    if password_hash_rounds(hashed_password) == get_settings().SECURITY_BCRYPT_ROUNDS:
+        password_verify_duration.record(seconds)
+    return verified
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash(rounds: int) -> str:
+    return password_hashing_executor.call(_hash_password, "dummy-password", rounds)
+
+
+def _verify_dummy_password() -> None:
+    """Hash (once) and verify a dummy password; blocks on the hashing pool."""
+    dummy_hash = _dummy_password_hash(get_settings().SECURITY_BCRYPT_ROUNDS)
+    verify_password("", dummy_hash)
+
+
+async def spend_password_verify_time() -> None:
     """
+    Take as long as a failed password verify, for logins of unknown users.
+
+    Sleeps on the event loop for the average bcrypt time of verifies at the
+    configured cost, which leaves out the hashing queue wait, so the response
+    time does not reveal whether the user exists and no thread is held. Until
+    a verify has been measured, a real one against a dummy hash is run in a
+    thread, like every other hashing pool call. A full pool answers 503, as it
+    does for a known user.
+    """
+    if password_verify_duration.seconds is None:
+        await anyio.to_thread.run_sync(_verify_dummy_password)
+        return
+    await anyio.sleep(password_verify_duration.seconds)
+
+
+def password_hash_rounds(hashed_password: str) -> int | None:
+    """Return the cost factor of a bcrypt hash ("$2b$<rounds>$...")."""
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a bcrypt hash uses a cost other than the configured one."""
+    rounds = get_settings().SECURITY_BCRYPT_ROUNDS
+    return password_hash_rounds(hashed_password) != rounds
+
+
+def token_digest(jwt_token: str) -> bytes:
+    """Digest used to key caches by token without keeping the token itself."""
+    return hashlib.sha256(jwt_token.encode("utf-8")).digest()
+
+
+def generate_refresh_token() -> str:
+    """Generate an opaque, URL-safe refresh token."""
+    return secrets.token_urlsafe(32)
+
+
+def _keyed_digest(value: str) -> str:
+    return hmac.new(
+        get_settings().SECURITY_API_SECRET_KEY.encode("utf-8"),
+        value.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def refresh_token_digest(refresh_token: str) -> str:
+    """
+    Keyed hash of a refresh token, as stored in the database.
+
+    Refresh tokens are random and high-entropy, so a fast HMAC-SHA256 is
+    enough; bcrypt would cost a login on every refresh.
+    """
+    return _keyed_digest(refresh_token)
+
+
+def generate_api_key() -> tuple[str, str, str]:
+    """Generate an API key; returns the prefix, the secret and the full key."""
+    prefix = secrets.token_hex(8)
+    secret = secrets.token_urlsafe(32)
+    return prefix, secret, f"{API_KEY_MARKER}{prefix}_{secret}"
+
+
+def split_api_key(api_key: str) -> tuple[str, str] | None:
+    """Split an API key into prefix and secret, or None if it is not one."""
+    if not api_key.startswith(API_KEY_MARKER):
+        return None
+    prefix, _, secret = api_key[len(API_KEY_MARKER) :].partition("_")
+    if len(prefix) != 16 or not secret:
+        return None
+    return prefix, secret
+
+
+def api_key_digest(secret: str) -> str:
+    """Keyed hash of an API key secret, as stored in the database."""
+    return _keyed_digest(secret)
+
+
+def api_key_matches(secret: str, secret_hash: str) -> bool:
+    """Compare an API key secret with its stored hash in constant time."""
+    return hmac.compare_digest(api_key_digest(secret), secret_hash)
+
+
+def decode_access_token(jwt_token: str) -> dict:
+    """
+    Verify a JWT access token and return its claims.
+
+    Verified payloads are cached by token digest until `exp`, so repeated
+    requests with the same token skip the signature and claims validation.
+    """
+    digest = token_digest(jwt_token)
+    payload = verified_token_cache.get(digest)
+    if payload is not None and payload.get("nbf", 0) <= time.time():
+        return dict(payload)
+
+    kid = jwt.get_unverified_header(jwt_token).get("kid")
+    verification_key = get_signing_keys().verification_key(kid)
+    if verification_key is None:
+        raise jwt.InvalidTokenError(f"Unknown signing key id {kid!r}")
+
     payload = jwt.decode(
         jwt_token,
-        get_settings().SECURITY_API_SECRET_KEY,
-        algorithms=[get_settings().SECURITY_ALGORITHM],
+        verification_key.key,
+        algorithms=[verification_key.algorithm],
     )
+    expires_in = payload["exp"] - time.time() if "exp" in payload else None
+    verified_token_cache.set(digest, dict(payload), ttl=expires_in)
+    return payload
+
+
+def extract_username(jwt_token: str) -> str:
+    """
+    Verify a JWT access token and return its subject (username).
+    """
+    payload = decode_access_token(jwt_token)
     return payload.get("sub") or None
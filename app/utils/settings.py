@@ -19,12 +19,65 @@ class Settings(BaseSettings):
     )
 
     DB_URL: str
+    # Modo assíncrono (asyncpg/aiosqlite); a URL padrão é derivada de DB_URL
+    DB_ASYNC: bool = False
+    DB_ASYNC_URL: str | None = None
+    # Pool de conexões por engine e por worker (size/overflow valem p/ QueuePool)
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    # -1 nunca recicla; use um valor menor que o idle timeout do servidor/proxy
+    DB_POOL_RECYCLE_SECONDS: int = -1
+    DB_POOL_PRE_PING: bool = False
+    # Réplicas de leitura para rotas GET (lista JSON de URLs)
+    DB_REPLICA_URLS: list[str] = []
+    # Tempo que uma réplica com falha fica fora do round-robin
+    DB_REPLICA_EJECT_SECONDS: float = 30
     SECURITY_ALGORITHM: str = "HS256"
+    # Chaves para EdDSA/RS256 (PEM); o kid padrão é o thumbprint RFC 7638
+    SECURITY_JWT_PRIVATE_KEY: str | None = None
+    SECURITY_JWT_KEY_ID: str | None = None
+    # Chave pública anterior, aceita na verificação durante a rotação
+    SECURITY_JWT_PREVIOUS_PUBLIC_KEY: str | None = None
+    SECURITY_JWT_PREVIOUS_KEY_ID: str | None = None
     SECURITY_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    SECURITY_REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Intervalo entre limpezas de refresh tokens mortos, por worker (0 desliga)
+    SECURITY_REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = 3600
+    # Embute as permissões do usuário no access token (opt-in)
+    SECURITY_TOKEN_PERMISSION_CLAIMS: bool = False
+    # Cache de tokens verificados e usuários autenticados (0 desliga o cache)
+    SECURITY_TOKEN_CACHE_TTL_SECONDS: int = 60
+    SECURITY_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    # Cache negativo de usernames inexistentes no login (0 desliga o cache)
+    SECURITY_UNKNOWN_USERNAME_CACHE_TTL_SECONDS: int = 30
+    SECURITY_UNKNOWN_USERNAME_CACHE_MAX_ENTRIES: int = 100000
+
+    # Limite de tentativas de login por IP e por username (0 desliga o limite)
+    SECURITY_LOGIN_RATE_LIMIT_PER_IP: int = 20
+    SECURITY_LOGIN_RATE_LIMIT_PER_USERNAME: int = 5
+    SECURITY_LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    SECURITY_LOGIN_RATE_LIMIT_MAX_KEYS: int = 100000
+
+    # Custo do BCrypt (calibre com `task calibrate_bcrypt`)
+    SECURITY_BCRYPT_ROUNDS: int = 12
+
+    # Pool de processos para hash de senhas (0 workers = número de CPUs)
+    SECURITY_HASHING_POOL_ENABLED: bool = True
+    SECURITY_HASHING_WORKERS: int = 0
+    SECURITY_HASHING_MAX_PENDING: int = 64
 
     # SECRETS
     SECURITY_API_SECRET_KEY: str
 
+    # Cache de permissões por worker (0 desliga o cache)
+    PERMISSION_CACHE_TTL_SECONDS: int = 60
+    PERMISSION_CACHE_MAX_ENTRIES: int = 10000
+
+    # Rotas em lote: itens por requisição e linhas por INSERT/UPDATE/DELETE
+    BULK_MAX_ITEMS: int = 1000
+    BULK_CHUNK_SIZE: int = 500
+
     # Swagger
     SWAGGER_DOCS_ROUTE: str = "/api/v1/docs"
     SWAGGER_REDOCS_ROUTE: str = "/api/v1/redocs"
@@ -0,0 +1,141 @@
+"""JWT signing and verification keys, parsed once per process."""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+from app.utils.settings import get_settings
+
+ASYMMETRIC_ALGORITHMS = {"EdDSA": Ed25519PrivateKey, "RS256": RSAPrivateKey}
+
+# Members of each key type used by the RFC 7638 thumbprint.
+_THUMBPRINT_MEMBERS = {"OKP": ("crv", "kty", "x"), "RSA": ("e", "kty", "n")}
+
+
+@dataclass(frozen=True)
+class VerificationKey:
+    """A public (or shared) key with the algorithm it verifies."""
+
+    algorithm: str
+    key: Any
+
+
+@dataclass(frozen=True)
+class SigningKeys:
+    """
+    The active signing key and every key accepted for verification.
+
+    For HS256 the shared secret signs and verifies and no kid is emitted.
+    For EdDSA/RS256 tokens carry the key id in the header, and the public
+    keys are published as a JWKS document.
+    """
+
+    algorithm: str
+    signing_key: Any
+    kid: str | None
+    verification_keys: dict[str | None, VerificationKey]
+    jwks: dict = field(default_factory=lambda: {"keys": []})
+
+    @property
+    def headers(self) -> dict | None:
+        """JWT headers for newly signed tokens."""
+        return {"kid": self.kid} if self.kid else None
+
+    def verification_key(self, kid: str | None) -> VerificationKey | None:
+        """Key matching a token's kid header, if it is still accepted."""
+        return self.verification_keys.get(kid)
+
+
+def _public_jwk(public_key: Ed25519PublicKey | RSAPublicKey) -> dict:
+    if isinstance(public_key, Ed25519PublicKey):
+        return OKPAlgorithm.to_jwk(public_key, as_dict=True)
+    return RSAAlgorithm.to_jwk(public_key, as_dict=True)
+
+
+def _algorithm_for(public_key: Ed25519PublicKey | RSAPublicKey) -> str:
+    return "EdDSA" if isinstance(public_key, Ed25519PublicKey) else "RS256"
+
+
+def jwk_thumbprint(jwk: dict) -> str:
+    """RFC 7638 SHA-256 thumbprint of a public JWK, base64url encoded."""
+    members = {name: jwk[name] for name in _THUMBPRINT_MEMBERS[jwk["kty"]]}
+    canonical = json.dumps(members, separators=(",", ":"), sort_keys=True)
+    digest = hashlib.sha256(canonical.encode("utf-8")).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def _published_key(public_key: Ed25519PublicKey | RSAPublicKey, kid: str | None):
+    jwk = _public_jwk(public_key)
+    jwk.update(
+        kid=kid or jwk_thumbprint(jwk), alg=_algorithm_for(public_key), use="sig"
+    )
+    return jwk
+
+
+def load_signing_keys() -> SigningKeys:
+    """Parse the configured keys; raises ValueError on a misconfiguration."""
+    settings = get_settings()
+    algorithm = settings.SECURITY_ALGORITHM
+
+    if algorithm not in ASYMMETRIC_ALGORITHMS:
+        secret = settings.SECURITY_API_SECRET_KEY
+        return SigningKeys(
+            algorithm=algorithm,
+            signing_key=secret,
+            kid=None,
+            verification_keys={None: VerificationKey(algorithm, secret)},
+        )
+
+    if not settings.SECURITY_JWT_PRIVATE_KEY:
+        raise ValueError(f"SECURITY_JWT_PRIVATE_KEY is required for {algorithm}")
+
+    private_key = load_pem_private_key(
+        settings.SECURITY_JWT_PRIVATE_KEY.encode("utf-8"), password=None
+    )
+    if not isinstance(private_key, ASYMMETRIC_ALGORITHMS[algorithm]):
+        raise ValueError(f"SECURITY_JWT_PRIVATE_KEY is not a {algorithm} key")
+
+    active = _published_key(private_key.public_key(), settings.SECURITY_JWT_KEY_ID)
+    published = [active]
+    verification_keys = {
+        active["kid"]: VerificationKey(algorithm, private_key.public_key())
+    }
+
+    if settings.SECURITY_JWT_PREVIOUS_PUBLIC_KEY:
+        # Keeps tokens signed before a key rotation valid until they expire.
+        previous_key = load_pem_public_key(
+            settings.SECURITY_JWT_PREVIOUS_PUBLIC_KEY.encode("utf-8")
+        )
+        previous = _published_key(previous_key, settings.SECURITY_JWT_PREVIOUS_KEY_ID)
+        published.append(previous)
+        verification_keys[previous["kid"]] = VerificationKey(
+            _algorithm_for(previous_key), previous_key
+        )
+
+    return SigningKeys(
+        algorithm=algorithm,
+        signing_key=private_key,
+        kid=active["kid"],
+        verification_keys=verification_keys,
+        jwks={"keys": published},
+    )
+
+
+@lru_cache
+def get_signing_keys() -> SigningKeys:
+    """Get the signing keys, parsed once per process."""
+    return load_signing_keys()
@@ -0,0 +1,8 @@
+"""Timestamp utility functions."""
+
+from datetime import UTC, datetime
+
+
+def as_utc(value: datetime) -> datetime:
+    """SQLite returns naive datetimes; every stored value is UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
@@ -0,0 +1,60 @@
+"""Calibrate the bcrypt cost factor for a target hashing latency on this host."""
+
+import argparse
+import statistics
+import time
+
+from bcrypt import gensalt, hashpw
+
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+SAMPLES = 3
+PASSWORD = b"calibration-password"
+
+
+def measure(rounds: int, samples: int = SAMPLES) -> float:
+    """Return the median hashing time in milliseconds for a cost factor."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hashpw(PASSWORD, gensalt(rounds=rounds))
+        timings.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, min_rounds: int, max_rounds: int) -> int:
+    """
+    Pick the highest cost whose hashing time stays within the target.
+
+    Each extra round doubles the work, so the search stops at the first cost
+    above the target. Never returns less than `min_rounds`.
+    """
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        elapsed = measure(rounds)
+        print(f"rounds={rounds:<3} {elapsed:>10.1f} ms")
+        if elapsed > target_ms:
+            break
+        chosen = rounds
+    return chosen
+
+
+def main() -> None:
+    """Print the timings and the recommended SECURITY_BCRYPT_ROUNDS."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250.0,
+        help="maximum acceptable time per hash, in milliseconds",
+    )
+    parser.add_argument("--min-rounds", type=int, default=MIN_ROUNDS)
+    parser.add_argument("--max-rounds", type=int, default=MAX_ROUNDS)
+    args = parser.parse_args()
+
+    rounds = calibrate(args.target_ms, args.min_rounds, args.max_rounds)
+    print(f"\nSECURITY_BCRYPT_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Microbenchmark: permission check via query path vs. permission mask."""
+
+import timeit
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api.authorization.controller import (
+    get_user_authorized_transactions,
+    get_user_permission_mask,
+)
+from app.api.transaction.enum_operation_code import EnumOperationCode, mask_grants
+from app.models.assignment import Assignment
+from app.models.authorization import Authorization
+from app.models.role import Role
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.utils.base_model import Base
+
+ITERATIONS = 2000
+AUDIT = {"audit_user_ip": "127.0.0.1", "audit_user_login": "benchmark"}
+
+
+def seed(db_session: Session) -> User:
+    """Create a user whose role is authorized for every op code."""
+    user = User(
+        username="bench",
+        display_name="Benchmark",
+        email="bench@bench.com",
+        password="-",
+        **AUDIT,
+    )
+    role = Role(name="BENCH", description="Benchmark role", **AUDIT)
+    db_session.add_all([user, role])
+    db_session.flush()
+    db_session.add(Assignment(user_id=user.id, role_id=role.id, **AUDIT))
+    for op_code in EnumOperationCode:
+        transaction = Transaction(
+            name=op_code.name,
+            description=op_code.name,
+            operation_code=op_code.value,
+            **AUDIT,
+        )
+        db_session.add(transaction)
+        db_session.flush()
+        db_session.add(
+            Authorization(role_id=role.id, transaction_id=transaction.id, **AUDIT)
+        )
+    db_session.commit()
+    return user
+
+
+def report(label: str, seconds: float) -> None:
+    """Print the mean time per call in microseconds."""
+    print(f"{label:<32} {seconds / ITERATIONS * 1e6:>10.2f} us/check")
+
+
+def main() -> None:
+    """Run both permission check strategies against an in-memory database."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    op_code = EnumOperationCode.OP_1040003.value
+
+    with Session(engine) as db_session:
+        user_id = seed(db_session).id
+
+        def query_path():
+            return bool(get_user_authorized_transactions(db_session, user_id, op_code))
+
+        user_mask = get_user_permission_mask(db_session, user_id)
+
+        def mask_path():
+            return mask_grants(user_mask, op_code)
+
+        assert query_path() and mask_path()
+        report("query (5-table join)", timeit.timeit(query_path, number=ITERATIONS))
+        report(
+            "mask resolve (once per user)",
+            timeit.timeit(
+                lambda: get_user_permission_mask(db_session, user_id),
+                number=ITERATIONS,
+            ),
+        )
+        report("mask check (AND)", timeit.timeit(mask_path, number=ITERATIONS))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import importlib
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
+from sqlalchemy import make_url
 from sqlalchemy import pool
 
 from alembic import context
@@ -24,6 +25,7 @@ if config.config_file_name is not None:
 # LOADIND MODELS -----------
 
 from app.utils.base_model import Base
+from app.utils.search import autogenerate_filter
 
 app_models = [
     "app.models.user",
@@ -31,6 +33,9 @@ app_models = [
     "app.models.transaction",
     "app.models.assignment",
     "app.models.authorization",
+    "app.models.permission_version",
+    "app.models.refresh_token",
+    "app.models.api_key",
 ]
 
 for module in app_models:
@@ -64,6 +69,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=autogenerate_filter(make_url(url).get_dialect().name),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -86,7 +92,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=autogenerate_filter(connection.dialect.name),
+        )
 
         with context.begin_transaction():
             context.run_migrations()
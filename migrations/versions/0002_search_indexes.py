@@ -0,0 +1,73 @@
+"""search indexes
+
+Trigram (pg_trgm) GIN indexes on PostgreSQL and FTS5 trigram shadow tables
+on SQLite for the searchable columns of user, role and transaction.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 03:40:12.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.base_model import Base
+from app.utils.search import sqlite_search_ddl, sqlite_search_drop_ddl
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The FTS5 tables follow the searchable columns of these models (see
+# app.utils.search), which env.py loads into Base.metadata.
+SEARCH_TABLES = ("user", "role", "transaction")
+
+TRIGRAM_INDEXES = {
+    "idx_user_username_trgm": ("user", "str_username"),
+    "idx_user_email_trgm": ("user", "str_email"),
+    "idx_role_name_trgm": ("role", "str_name"),
+    "idx_transaction_name_trgm": ("transaction", "str_name"),
+}
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # CONCURRENTLY keeps large tables writable while the index builds.
+        with op.get_context().autocommit_block():
+            for name, (table, column) in TRIGRAM_INDEXES.items():
+                op.create_index(
+                    name,
+                    table,
+                    [column],
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    elif dialect == "sqlite":
+        for name in SEARCH_TABLES:
+            for statement in sqlite_search_ddl(Base.metadata.tables[name]):
+                op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, (table, _column) in TRIGRAM_INDEXES.items():
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+    elif dialect == "sqlite":
+        for name in SEARCH_TABLES:
+            for statement in sqlite_search_drop_ddl(Base.metadata.tables[name]):
+                op.execute(statement)
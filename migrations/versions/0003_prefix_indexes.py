@@ -0,0 +1,57 @@
+"""prefix indexes
+
+B-tree indexes in the "C" collation on PostgreSQL for the `prefix` filters,
+which compare by code point; the default indexes follow the database
+collation and cannot serve them.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 11:02:47.530114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREFIX_INDEXES = {
+    "idx_user_username_prefix": ("user", "str_username"),
+    "idx_user_email_prefix": ("user", "str_email"),
+    "idx_role_name_prefix": ("role", "str_name"),
+    "idx_transaction_op_code_prefix": ("transaction", "str_operation_code"),
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # CONCURRENTLY keeps large tables writable while the index builds.
+    with op.get_context().autocommit_block():
+        for name, (table, column) in PREFIX_INDEXES.items():
+            op.create_index(
+                name,
+                table,
+                [sa.text(f'{column} COLLATE "C"')],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name, (table, _column) in PREFIX_INDEXES.items():
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,30 @@
+"""refresh token expiry index
+
+Index on the expiry of the refresh tokens, which the purge of dead tokens
+deletes by.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 13:21:05.274961
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_refresh_token_expires", "refresh_token", ["dt_expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_refresh_token_expires", table_name="refresh_token")
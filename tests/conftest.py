@@ -4,10 +4,20 @@ import os
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import Engine, create_engine, event
+from sqlalchemy import Engine, create_engine, event, select
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.api.authentication.login_throttle import (
+    login_ip_limiter,
+    login_username_limiter,
+)
+from app.api.authentication.user_cache import (
+    current_user_cache,
+    unknown_username_cache,
+)
+from app.api.authorization.permission_cache import permission_cache
+from app.database.pool import use_sqlite_savepoints
 from app.database.session import get_session
 from app.models.assignment import Assignment
 from app.models.authorization import Authorization
@@ -16,7 +26,8 @@ from app.models.transaction import Transaction
 from app.models.user import User
 from app.startup import app
 from app.utils.base_model import Base
-from app.utils.security import get_password_hash
+from app.utils.security import get_password_hash, verified_token_cache
+from app.utils.signing_keys import get_signing_keys
 from tests.factory.assignment_factory import (
     AssignmentFactory,
     create_assignment,
@@ -34,6 +45,27 @@ os.environ.setdefault("LOG_LEVEL", "CRITICAL")
 os.environ.setdefault("LOG_CONSOLE_LEVEL", "CRITICAL")
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Per-worker caches outlive a test's in-memory database; start every test cold.
+    """
+    caches = (
+        permission_cache,
+        verified_token_cache,
+        current_user_cache,
+        unknown_username_cache,
+        login_ip_limiter,
+        login_username_limiter,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+    get_signing_keys.cache_clear()
+
+
 @pytest.fixture
 def client(session):
     """
@@ -69,6 +101,7 @@ def session():
         poolclass=StaticPool,
         # echo=True,
     )
+    use_sqlite_savepoints(engine)
 
     Session = sessionmaker(bind=engine)
     Base.metadata.create_all(engine)
@@ -168,6 +201,24 @@ def token(client, user):
     return response.json()["access_token"]
 
 
+@pytest.fixture
+def statements(session):
+    """
+    Collects the SQL statements executed through the test session.
+
+    Returns:
+        list[str]: The statements, in execution order.
+    """
+    executed: list[str] = []
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args):
+        executed.append(statement)
+
+    event.listen(session.bind, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(session.bind, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture
 def trasaction(session) -> Transaction:
     """
@@ -286,3 +337,52 @@ def authorization_10_plus_one(session, role, transaction_10_plus_one):
     session.add_all(authorizations)
     session.commit()
     return authorizations
+
+
+@pytest.fixture
+def grant_op_codes(session, user, role):
+    """
+    Grants operation codes to the `user` fixture through the `role` fixture.
+
+    Returns:
+        Callable: Receives op codes, creating the missing Transactions, the
+            Authorizations and the user's Assignment to the role.
+    """
+
+    def grant(*op_codes: str) -> None:
+        if not session.scalar(
+            select(Assignment).filter_by(user_id=user.id, role_id=role.id)
+        ):
+            session.add(
+                Assignment(
+                    user_id=user.id,
+                    role_id=role.id,
+                    audit_user_ip="localhost",
+                    audit_user_login="tester",
+                )
+            )
+        for op_code in op_codes:
+            transaction = session.scalar(
+                select(Transaction).filter_by(operation_code=op_code)
+            )
+            if not transaction:
+                transaction = Transaction(
+                    name=f"Transaction {op_code}",
+                    description=f"Transaction {op_code}",
+                    operation_code=op_code,
+                    audit_user_ip="localhost",
+                    audit_user_login="tester",
+                )
+                session.add(transaction)
+                session.flush()
+            session.add(
+                Authorization(
+                    role_id=role.id,
+                    transaction_id=transaction.id,
+                    audit_user_ip="localhost",
+                    audit_user_login="tester",
+                )
+            )
+        session.commit()
+
+    return grant
@@ -0,0 +1,130 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.api.api_key.controller import ApiKeyController
+from app.api.transaction.enum_operation_code import EnumOperationCode as op
+from app.models.api_key import ApiKey
+from app.utils.security import api_key_digest, split_api_key
+
+
+def _create_key(client, token, **payload) -> dict:
+    response = client.post(
+        "/api-keys/",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"name": "integração", **payload},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_create_api_key_stores_only_hash(client, session, user, token):
+    created = _create_key(client, token)
+
+    prefix, secret = split_api_key(created["api_key"])
+    stored = session.scalar(select(ApiKey))
+    assert created["prefix"] == prefix == stored.prefix
+    assert stored.user_id == user.id
+    assert stored.secret_hash == api_key_digest(secret)
+    assert secret not in stored.secret_hash
+    assert stored.audit_user_login == user.username
+
+
+def test_api_key_authenticates_as_user(client, user, token, grant_op_codes):
+    api_key = _create_key(client, token)["api_key"]
+    grant_op_codes(op.OP_1050003.value)
+
+    response = client.get("/role/", headers={"Authorization": f"Bearer {api_key}"})
+
+    assert response.status_code == 200
+
+
+def test_api_key_single_lookup(session, user, client, token, statements):
+    api_key = _create_key(client, token)["api_key"]
+    expected = (user.id, user.username)
+    statements.clear()
+
+    identity = ApiKeyController().authenticate(session, api_key)
+
+    assert len(statements) == 1
+    assert identity == expected
+
+
+@pytest.mark.parametrize(
+    "mangle",
+    [
+        lambda key: key[:-1] + ("A" if key[-1] != "A" else "B"),
+        lambda key: "fak_0000000000000000_" + key.rsplit("_", 1)[-1],
+        lambda key: key.replace("fak_", "fak"),
+    ],
+)
+def test_api_key_rejected(client, user, token, mangle):
+    api_key = _create_key(client, token)["api_key"]
+
+    response = client.get(
+        "/auth/cache-stats", headers={"Authorization": f"Bearer {mangle(api_key)}"}
+    )
+
+    assert response.status_code == 401
+
+
+def test_api_key_expired(client, session, user, token):
+    api_key = _create_key(client, token, expires_in_days=1)["api_key"]
+    session.execute(
+        update(ApiKey).values(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+    )
+    session.commit()
+
+    response = client.get(
+        "/auth/cache-stats", headers={"Authorization": f"Bearer {api_key}"}
+    )
+
+    assert response.status_code == 401
+
+
+def test_list_and_delete_api_keys(client, user, token):
+    created = _create_key(client, token)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    listed = client.get("/api-keys/", headers=headers).json()["api_keys"]
+    assert [key["id"] for key in listed] == [created["id"]]
+    assert "api_key" not in listed[0]
+
+    response = client.delete(f"/api-keys/{created['id']}", headers=headers)
+    assert response.status_code == 200
+
+    response = client.get(
+        "/auth/cache-stats",
+        headers={"Authorization": f"Bearer {created['api_key']}"},
+    )
+    assert response.status_code == 401
+
+
+def test_delete_api_key_of_other_user(client, other_user, token):
+    other_token = client.post(
+        "/auth/token",
+        data={"username": other_user.username, "password": other_user.clear_password},
+    ).json()["access_token"]
+    created = _create_key(client, other_token)
+
+    response = client.delete(
+        f"/api-keys/{created['id']}", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 404
+
+
+def test_require_op_accepts_api_key(client, user, token, grant_op_codes):
+    api_key = _create_key(client, token)["api_key"]
+    grant_op_codes(op.OP_1030003.value)
+
+    response = client.get(
+        "/transaction/", headers={"Authorization": f"Bearer {api_key}"}
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        "/transaction/", headers={"Authorization": f"Bearer {api_key}x"}
+    )
+    assert response.status_code == 401
@@ -0,0 +1,280 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.api.authentication.user_cache import current_user_cache
+from app.api.authorization.async_controller import (
+    get_user_permission_mask_async,
+    validate_transaction_access_async,
+)
+from app.api.authorization.permission_cache import permission_cache
+from app.api.transaction.async_router import router as transaction_async_router
+from app.api.transaction.enum_operation_code import EnumOperationCode as op
+from app.database.pool import use_sqlite_savepoints
+from app.database.session import async_database_url, get_async_session, get_session
+from app.models.transaction import Transaction
+from app.utils.async_generic_controller import AsyncGenericController
+from app.utils.base_model import Base
+from app.utils.exceptions import (
+    IllegalAccessException,
+    IntegrityValidationException,
+    ObjectNotFoundException,
+)
+
+
+@pytest.fixture
+def database_file(tmp_path):
+    """SQLite file shared by the sync and the async engine."""
+    return tmp_path / "async.db"
+
+
+@pytest.fixture
+def session(database_file):
+    """
+    File-backed sync session, so the async engine sees the same data.
+    Overrides the in-memory session of conftest for this module.
+    """
+    engine = create_engine(
+        f"sqlite:///{database_file}", connect_args={"check_same_thread": False}
+    )
+    use_sqlite_savepoints(engine)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)()
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def async_session_maker(session, database_file):
+    """Builds AsyncSessions over aiosqlite on the same database file."""
+    engine = create_async_engine(
+        async_database_url(f"sqlite:///{database_file}"), poolclass=NullPool
+    )
+    use_sqlite_savepoints(engine.sync_engine)
+
+    def make_session() -> AsyncSession:
+        return AsyncSession(engine, expire_on_commit=False)
+
+    yield make_session
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def async_client(session, async_session_maker):
+    """Webclient for the async transaction router."""
+
+    async def get_async_session_override():
+        async with async_session_maker() as async_session:
+            yield async_session
+
+    app = FastAPI()
+    app.include_router(transaction_async_router, prefix="/transaction")
+    app.dependency_overrides[get_session] = lambda: session
+    app.dependency_overrides[get_async_session] = get_async_session_override
+
+    with TestClient(app) as client:
+        yield client
+
+
+def new_transaction(operation_code: str = "TST0001") -> Transaction:
+    return Transaction(
+        name=f"Transaction {operation_code}",
+        description="Async transaction",
+        operation_code=operation_code,
+        audit_user_ip="localhost",
+        audit_user_login="tester",
+    )
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("sqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+        (
+            "postgresql://app:secret@db:5432/app",
+            "postgresql+asyncpg://app:secret@db:5432/app",
+        ),
+        (
+            "postgresql+psycopg2://app:secret@db/app",
+            "postgresql+asyncpg://app:secret@db/app",
+        ),
+        ("postgresql+asyncpg://app@db/app", "postgresql+asyncpg://app@db/app"),
+    ],
+)
+def test_async_database_url_swaps_the_driver(url, expected):
+    assert async_database_url(url) == expected
+
+
+def test_async_generic_controller_crud(async_session_maker):
+    controller = AsyncGenericController(Transaction)
+
+    async def scenario():
+        async with async_session_maker() as db_session:
+            saved = await controller.save(db_session, new_transaction())
+            saved_id = saved.id
+            assert saved_id == 1
+            assert saved.audit_created_at
+
+            other = await controller.save(db_session, new_transaction("TST0002"))
+            filtered = await controller.get_all(
+                db_session, filters=["operation_code:contains:0002"]
+            )
+            assert [t.id for t in filtered] == [other.id]
+
+            patched = await controller.partial_update(
+                db_session, saved.id, {"name": "Patched", "audit_user_ip": "1.1.1.1"}
+            )
+            assert patched.name == "Patched"
+            assert patched.audit_user_ip == "1.1.1.1"
+
+            # The rollback expires every instance; only saved_id is used after it.
+            with pytest.raises(IntegrityValidationException):
+                await controller.partial_update(
+                    db_session, saved_id, {"operation_code": "TST0002"}
+                )
+
+            await controller.delete(db_session, saved_id)
+            with pytest.raises(ObjectNotFoundException):
+                await controller.get(db_session, saved_id)
+
+    asyncio.run(scenario())
+
+
+def test_async_generic_controller_update_missing_object(async_session_maker):
+    controller = AsyncGenericController(Transaction)
+    missing = new_transaction()
+    missing.id = 999
+
+    async def scenario():
+        async with async_session_maker() as db_session:
+            await controller.update(db_session, missing)
+
+    with pytest.raises(ObjectNotFoundException):
+        asyncio.run(scenario())
+
+
+def test_async_generic_controller_bulk(async_session_maker):
+    controller = AsyncGenericController(Transaction)
+    rows = [
+        {
+            "name": f"Transaction {code}",
+            "description": "Bulk transaction",
+            "operation_code": code,
+            "audit_user_ip": "localhost",
+            "audit_user_login": "tester",
+        }
+        for code in ("TST0001", "TST0002", "TST0001")
+    ]
+
+    async def scenario():
+        async with async_session_maker() as db_session:
+            saved = await controller.bulk_save(db_session, rows)
+            patched = await controller.bulk_partial_update(
+                db_session, [{"id": saved[0].id, "name": "Bulk"}, {"id": 999}]
+            )
+            deleted = await controller.bulk_delete(db_session, [saved[1].id])
+            remaining = await controller.get_all(db_session)
+            return saved, patched, deleted, remaining
+
+    saved, patched, deleted, remaining = asyncio.run(scenario())
+
+    assert [result.error for result in saved[:2]] == [None, None]
+    assert isinstance(saved[2].error, IntegrityValidationException)
+    assert patched[0].error is None
+    assert isinstance(patched[1].error, ObjectNotFoundException)
+    assert deleted[0].error is None
+    assert [(t.id, t.name) for t in remaining] == [(saved[0].id, "Bulk")]
+
+
+def test_validate_transaction_access_async(user, grant_op_codes, async_session_maker):
+    grant_op_codes(op.OP_1030003.value)
+
+    async def scenario():
+        async with async_session_maker() as db_session:
+            await validate_transaction_access_async(
+                db_session, user, op.OP_1030003.value
+            )
+            with pytest.raises(IllegalAccessException):
+                await validate_transaction_access_async(
+                    db_session, user, op.OP_1030001.value
+                )
+            return await get_user_permission_mask_async(db_session, user.id)
+
+    mask = asyncio.run(scenario())
+
+    assert permission_cache.get((user.id, op.OP_1030003.value)) == 1
+    assert permission_cache.get((user.id, op.OP_1030001.value)) == 0
+    assert mask == op.OP_1030003.bit
+
+
+def test_async_router_transaction_lifecycle(async_client, token, grant_op_codes):
+    grant_op_codes(
+        op.OP_1030001.value,
+        op.OP_1030002.value,
+        op.OP_1030003.value,
+        op.OP_1030004.value,
+        op.OP_1030005.value,
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {
+        "name": "Async",
+        "description": "Created through the async router",
+        "operation_code": "ASY0001",
+    }
+
+    created = async_client.post("/transaction/", headers=headers, json=payload)
+    assert created.status_code == 201
+    transaction_id = created.json()["id"]
+
+    listed = async_client.get(
+        "/transaction/", headers=headers, params={"op_code": "ASY0001"}
+    )
+    assert [t["id"] for t in listed.json()["transactions"]] == [transaction_id]
+
+    patched = async_client.patch(
+        f"/transaction/{transaction_id}", headers=headers, json={"name": "Renamed"}
+    )
+    assert patched.status_code == 200
+    assert patched.json()["name"] == "Renamed"
+
+    deleted = async_client.delete(f"/transaction/{transaction_id}", headers=headers)
+    assert deleted.json() == {"detail": "Transaction deleted"}
+
+    missing = async_client.delete(f"/transaction/{transaction_id}", headers=headers)
+    assert missing.status_code == 404
+
+
+def test_async_router_denies_without_grant(async_client, token):
+    response = async_client.get(
+        "/transaction/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 401
+
+
+def test_async_router_resolves_the_principal_on_the_async_session(
+    async_client, session, user, token, grant_op_codes
+):
+    grant_op_codes(op.OP_1030003.value)
+    current_user_cache.clear()
+    permission_cache.clear()
+    statements = []
+    event.listen(
+        session.bind,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+
+    response = async_client.get(
+        "/transaction/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    assert statements == []
+    assert current_user_cache.get(user.username) == user.id
@@ -1,9 +1,63 @@
+import asyncio
 import os
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+from sqlalchemy import delete, func, select, text, update
 
-from app.utils.security import create_access_token
+from app.api.authentication import refresh_token as refresh_token_module
+from app.api.authentication.controller import (
+    get_current_user,
+    get_current_user_model,
+    user_controller,
+)
+from app.api.authentication.login_throttle import (
+    login_ip_limiter,
+    login_username_limiter,
+)
+from app.api.authentication.principal import Principal
+from app.api.authentication.refresh_token import purge_refresh_tokens
+from app.api.transaction.enum_operation_code import EnumOperationCode as op
+from app.models.assignment import Assignment
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.utils.exceptions import (
+    CredentialsValidationException,
+    HashingCapacityException,
+)
+from app.utils.hashing_executor import HashingExecutor
+from app.utils.rate_limiter import RateLimiter
+from app.utils.security import (
+    BULK_HASH_BATCH_SIZE,
+    _check_password,
+    _dummy_password_hash,
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    get_password_hashes,
+    password_hash_rounds,
+    password_hashing_executor,
+    password_needs_rehash,
+    password_verify_duration,
+    refresh_token_digest,
+    spend_password_verify_time,
+    verified_token_cache,
+    verify_password,
+)
 from app.utils.settings import get_settings
+from app.utils.signing_keys import get_signing_keys
 
 os.environ.setdefault(
     "SECURITY_API_SECRET_KEY",
@@ -89,3 +143,653 @@ def test_get_current_user_with_empty_username(client, user):
     )
     assert response.status_code == 401
     assert response.json() == {"detail": "Could not validate credentials"}
+
+
+def test_token_permission_claims(
+    client, session, user, other_user, role, grant_op_codes, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "SECURITY_TOKEN_PERMISSION_CLAIMS", True)
+    grant_op_codes(op.OP_1040003.value)
+    response = client.post(
+        "/auth/token",
+        data={"username": user.username, "password": user.clear_password},
+    )
+    token = response.json()["access_token"]
+
+    claims = decode_access_token(token)
+    assert int(claims["perms"], 16) == op.OP_1040003.bit
+    assert claims["pv"] >= 1
+
+    with (
+        patch(
+            "app.api.authentication.controller.get_user_permission_mask"
+        ) as mocked_mask,
+        patch(
+            "app.api.authorization.controller._count_authorized_transactions",
+            return_value=0,
+        ) as mocked_query,
+    ):
+        response = client.get("/users/", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        mocked_mask.assert_not_called()
+        mocked_query.assert_not_called()
+
+        response = client.get(
+            f"/users/{user.id}", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 401
+        mocked_mask.assert_not_called()
+
+    # Any RBAC write bumps the version and the claims are no longer trusted.
+    session.add(
+        Assignment(
+            user_id=other_user.id,
+            role_id=role.id,
+            audit_user_ip="localhost",
+            audit_user_login="tester",
+        )
+    )
+    session.commit()
+
+    with patch(
+        "app.api.authentication.controller.get_user_permission_mask",
+        return_value=op.OP_1040003.bit,
+    ) as mocked_mask:
+        response = client.get("/users/", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        mocked_mask.assert_called_once()
+
+
+def test_get_current_user_cached(client, user, token, statements):
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get("/auth/cache-stats", headers=headers)
+    statements.clear()
+
+    with patch("app.utils.security.jwt.decode") as mocked_decode:
+        response = client.get("/auth/cache-stats", headers=headers)
+        mocked_decode.assert_not_called()
+
+    assert response.status_code == 200
+    assert statements == []
+    assert response.json()["verified_tokens"]["hits"] >= 1
+    assert response.json()["current_users"]["hits"] >= 1
+
+
+def test_get_current_user_cache_invalidated_by_user_write(client, session, user, token):
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/auth/cache-stats", headers=headers).status_code == 200
+
+    session.delete(user)
+    session.commit()
+
+    response = client.get("/auth/cache-stats", headers=headers)
+    assert response.status_code == 401
+
+
+def test_get_current_user_cache_invalidated_by_user_rename(
+    client, user, token, grant_op_codes
+):
+    grant_op_codes(op.OP_1040002.value)
+    headers = {"Authorization": f"Bearer {token}"}
+    credentials = {"username": "renomeado", "password": user.clear_password}
+    assert client.get("/auth/cache-stats", headers=headers).status_code == 200
+    with patch("app.api.authentication.router.spend_password_verify_time"):
+        assert client.post("/auth/token", data=credentials).status_code == 400
+
+    # PUT writes with UPDATE ... RETURNING, which bypasses the flush.
+    response = client.put(
+        f"/users/{user.id}",
+        headers=headers,
+        json={
+            "username": "renomeado",
+            "display_name": user.display_name,
+            "email": user.email,
+            "password": user.clear_password,
+        },
+    )
+    assert response.status_code == 200
+
+    assert client.get("/auth/cache-stats", headers=headers).status_code == 401
+    assert client.post("/auth/token", data=credentials).status_code == 200
+
+
+def test_get_current_user_returns_principal(
+    session, user, token, grant_op_codes, statements
+):
+    grant_op_codes(op.OP_1050003.value)
+    user_id, username = user.id, user.username
+    session.expunge_all()
+    statements.clear()
+    # Keep a reference: the identity map only holds loaded objects weakly.
+    loaded_user = user_controller.get_user_by_username(session, username)
+    orm_statements = len(statements)
+    statements.clear()
+
+    principal = get_current_user(session, token)
+
+    assert isinstance(principal, Principal)
+    assert principal.id == user_id
+    assert principal.username == username
+    assert principal.op_codes == [op.OP_1050003.value]
+    # Only the permission mask: the user id claim resolves the user from the
+    # identity map, and loading the ORM User no longer cascades into its
+    # relationships.
+    assert len(statements) == 1
+    assert orm_statements == 1
+    assert loaded_user.id == principal.id
+    with pytest.raises(AttributeError):
+        principal.username = "other"
+
+
+def test_get_current_user_model(session, user, token):
+    principal = get_current_user(session, token)
+
+    db_user = get_current_user_model(session, principal)
+
+    assert db_user.id == user.id
+
+
+def test_hashing_executor_backpressure():
+    executor = HashingExecutor(max_workers=1, max_pending=1)
+    try:
+        running = executor.submit(time.sleep, 0.5)
+
+        with pytest.raises(HashingCapacityException):
+            executor.call(abs, -1)
+
+        running.result()
+        time.sleep(0.1)  # the slot is released by a done-callback
+        assert executor.call(abs, -1) == 1
+    finally:
+        executor.shutdown()
+
+
+def test_password_hashes_leave_a_hashing_worker_free(monkeypatch):
+    in_flight, peak, batches = 0, 0, []
+
+    class DoneFuture:
+        def __init__(self, value):
+            self.value = value
+
+        def result(self):
+            nonlocal in_flight
+            in_flight -= 1
+            return self.value
+
+    def submit(fn, passwords, rounds):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        batches.append(len(passwords))
+        return DoneFuture(fn(passwords, rounds))
+
+    monkeypatch.setattr(password_hashing_executor, "enabled", True)
+    monkeypatch.setattr(password_hashing_executor, "max_workers", 3)
+    monkeypatch.setattr(password_hashing_executor, "submit", submit)
+    monkeypatch.setattr(
+        "app.utils.security._hash_passwords",
+        lambda passwords, _rounds: [f"hash-{p}" for p in passwords],
+    )
+
+    hashes = get_password_hashes([str(i) for i in range(10)])
+
+    assert hashes == [f"hash-{i}" for i in range(10)]
+    assert batches == [BULK_HASH_BATCH_SIZE, BULK_HASH_BATCH_SIZE, 2]
+    assert peak == 2
+
+
+def test_login_hashing_queue_full(client, user, monkeypatch):
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    monkeypatch.setattr(password_hashing_executor, "_slots", slots)
+
+    response = client.post(
+        "/auth/token",
+        data={"username": user.username, "password": user.clear_password},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_password_hash_rounds():
+    hashed = get_password_hash("secret")
+
+    assert password_hash_rounds(hashed) == get_settings().SECURITY_BCRYPT_ROUNDS
+    assert not password_needs_rehash(hashed)
+    assert password_hash_rounds("not-a-bcrypt-hash") is None
+
+
+def test_login_rehashes_outdated_cost(client, session, user, monkeypatch):
+    monkeypatch.setattr(get_settings(), "SECURITY_BCRYPT_ROUNDS", 4)
+    assert password_needs_rehash(user.password)
+
+    response = client.post(
+        "/auth/token",
+        data={"username": user.username, "password": user.clear_password},
+    )
+
+    assert response.status_code == 200
+    session.refresh(user)
+    assert password_hash_rounds(user.password) == 4
+    assert verify_password(user.clear_password, user.password)
+
+
+def test_login_keeps_current_cost(client, session, user):
+    stored = user.password
+
+    response = client.post(
+        "/auth/token",
+        data={"username": user.username, "password": user.clear_password},
+    )
+
+    assert response.status_code == 200
+    session.refresh(user)
+    assert user.password == stored
+
+
+def _login(client, user) -> dict:
+    response = client.post(
+        "/auth/token",
+        data={"username": user.username, "password": user.clear_password},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_login_returns_hashed_refresh_token(client, session, user):
+    refresh_token = _login(client, user)["refresh_token"]
+
+    stored = session.scalar(select(RefreshToken))
+    assert stored.user_id == user.id
+    assert stored.token_hash == refresh_token_digest(refresh_token)
+    assert refresh_token not in stored.token_hash
+
+
+def test_refresh_rotates_without_password_check(client, user):
+    refresh_token = _login(client, user)["refresh_token"]
+
+    with patch("app.api.authentication.controller.verify_password") as mocked_verify:
+        response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+
+    assert response.status_code == 200
+    mocked_verify.assert_not_called()
+    body = response.json()
+    assert body["refresh_token"] != refresh_token
+    assert decode_access_token(body["access_token"])["sub"] == user.username
+
+
+def test_refresh_token_reuse_revokes_family(client, user):
+    first = _login(client, user)["refresh_token"]
+    second = client.post("/auth/refresh", json={"refresh_token": first}).json()[
+        "refresh_token"
+    ]
+
+    reused = client.post("/auth/refresh", json={"refresh_token": first})
+    assert reused.status_code == 401
+
+    response = client.post("/auth/refresh", json={"refresh_token": second})
+    assert response.status_code == 401
+
+
+def test_refresh_token_expired(client, session, user):
+    refresh_token = _login(client, user)["refresh_token"]
+    session.execute(
+        update(RefreshToken).values(expires_at=datetime.now(UTC) - timedelta(days=1))
+    )
+    session.commit()
+
+    response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+
+    assert response.status_code == 401
+
+
+def test_refresh_token_of_deleted_user(client, session, user):
+    refresh_token = _login(client, user)["refresh_token"]
+    # Without foreign key enforcement SQLite leaves the token behind.
+    session.execute(text("PRAGMA foreign_keys=OFF"))
+    session.execute(delete(User).where(User.id == user.id))
+    session.commit()
+    session.execute(text("PRAGMA foreign_keys=ON"))
+
+    response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+
+    assert response.status_code == 401
+    assert session.scalar(select(RefreshToken.revoked_at)) is not None
+
+
+def test_refresh_token_unknown(client):
+    response = client.post("/auth/refresh", json={"refresh_token": "unknown"})
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Could not validate credentials"}
+
+
+def test_revoke_refresh_token(client, user):
+    refresh_token = _login(client, user)["refresh_token"]
+
+    response = client.post("/auth/revoke", json={"refresh_token": refresh_token})
+    assert response.status_code == 200
+
+    response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 401
+
+
+def test_purge_refresh_tokens_keeps_what_reuse_detection_needs(session, user):
+    now = datetime.now(UTC)
+    later, earlier = now + timedelta(days=1), now - timedelta(days=1)
+
+    def token(name, family, expires_at, revoked_at=None):
+        session.add(
+            RefreshToken(
+                user_id=user.id,
+                family_id=family,
+                token_hash=name,
+                expires_at=expires_at,
+                revoked_at=revoked_at,
+            )
+        )
+
+    token("rotated", "live", later, revoked_at=earlier)
+    token("current", "live", later)
+    token("expired", "live", earlier, revoked_at=earlier)
+    token("logged-out", "revoked", later, revoked_at=earlier)
+    token("stale", "stale", earlier)
+    session.commit()
+
+    assert purge_refresh_tokens(session, now) == 3
+    session.commit()
+
+    kept = session.scalars(select(RefreshToken.token_hash)).all()
+    assert sorted(kept) == ["current", "rotated"]
+
+
+def test_refresh_purges_dead_tokens_once_per_interval(
+    client, session, user, monkeypatch
+):
+    monkeypatch.setattr(refresh_token_module, "_next_purge_at", 0.0)
+    logged_out = _login(client, user)["refresh_token"]
+    client.post("/auth/revoke", json={"refresh_token": logged_out})
+    first = _login(client, user)["refresh_token"]
+
+    second = client.post("/auth/refresh", json={"refresh_token": first}).json()
+    assert session.scalar(select(func.count()).select_from(RefreshToken)) == 2
+
+    _login(client, user)
+    client.post("/auth/revoke", json={"refresh_token": second["refresh_token"]})
+    # Within the interval, a refresh does not purge again.
+    client.post(
+        "/auth/refresh", json={"refresh_token": _login(client, user)["refresh_token"]}
+    )
+    assert session.scalar(select(func.count()).select_from(RefreshToken)) == 5
+
+
+def _use_signing_key(monkeypatch, algorithm: str, private_key) -> None:
+    pem = private_key.private_bytes(
+        Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+    ).decode("utf-8")
+    monkeypatch.setattr(get_settings(), "SECURITY_ALGORITHM", algorithm)
+    monkeypatch.setattr(get_settings(), "SECURITY_JWT_PRIVATE_KEY", pem)
+    get_signing_keys.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "private_key"),
+    [
+        ("EdDSA", Ed25519PrivateKey.generate()),
+        ("RS256", rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+    ],
+)
+def test_asymmetric_token_verifies_with_jwks(
+    client, monkeypatch, algorithm, private_key
+):
+    _use_signing_key(monkeypatch, algorithm, private_key)
+    token = create_access_token(data={"sub": "Teste"})
+
+    response = client.get("/auth/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    [jwk] = response.json()["keys"]
+    header = jwt.get_unverified_header(token)
+    assert header["alg"] == algorithm
+    assert header["kid"] == jwk["kid"]
+    assert "d" not in jwk
+    public_key = jwt.PyJWK(jwk).key
+    payload = jwt.decode(token, public_key, algorithms=[jwk["alg"]])
+    assert payload["sub"] == "Teste"
+    assert decode_access_token(token)["sub"] == "Teste"
+
+
+def test_asymmetric_token_accepted_by_api(client, user, monkeypatch):
+    _use_signing_key(monkeypatch, "EdDSA", Ed25519PrivateKey.generate())
+    token = _login(client, user)["access_token"]
+
+    response = client.get(
+        "/auth/cache-stats", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+
+
+def test_previous_key_still_verifies(monkeypatch):
+    previous = Ed25519PrivateKey.generate()
+    _use_signing_key(monkeypatch, "EdDSA", previous)
+    old_token = create_access_token(data={"sub": "Teste"})
+
+    public_pem = previous.public_key().public_bytes(
+        Encoding.PEM, PublicFormat.SubjectPublicKeyInfo
+    )
+    monkeypatch.setattr(
+        get_settings(), "SECURITY_JWT_PREVIOUS_PUBLIC_KEY", public_pem.decode("utf-8")
+    )
+    _use_signing_key(monkeypatch, "EdDSA", Ed25519PrivateKey.generate())
+    verified_token_cache.clear()
+
+    assert len(get_signing_keys().jwks["keys"]) == 2
+    assert decode_access_token(old_token)["sub"] == "Teste"
+
+
+def test_unknown_key_id_rejected(monkeypatch):
+    _use_signing_key(monkeypatch, "EdDSA", Ed25519PrivateKey.generate())
+    token = create_access_token(data={"sub": "Teste"})
+    _use_signing_key(monkeypatch, "EdDSA", Ed25519PrivateKey.generate())
+    verified_token_cache.clear()
+
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_access_token(token)
+
+
+def test_hs256_publishes_no_keys(client):
+    response = client.get("/auth/.well-known/jwks.json")
+
+    assert response.json() == {"keys": []}
+    assert "kid" not in jwt.get_unverified_header(
+        create_access_token(data={"sub": "Teste"})
+    )
+
+
+def test_rate_limiter_token_bucket():
+    limiter = RateLimiter(limit=2, window=60, maxsize=10)
+
+    assert limiter.hit("a") == 0
+    assert limiter.hit("a") == 0
+    assert 0 < limiter.hit("a") <= 30
+    assert limiter.hit("b") == 0
+    assert limiter.rejected == 1
+
+    limiter.reset("a")
+    assert limiter.hit("a") == 0
+
+
+def test_login_throttled_per_username(client, user, monkeypatch):
+    monkeypatch.setattr(login_username_limiter, "limit", 2)
+    credentials = {"username": user.username, "password": "wrong"}
+
+    for _ in range(2):
+        assert client.post("/auth/token", data=credentials).status_code == 400
+
+    with patch("app.api.authentication.controller.verify_password") as mocked_verify:
+        response = client.post("/auth/token", data=credentials)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    mocked_verify.assert_not_called()
+
+
+def test_login_throttled_per_ip(client, user, monkeypatch):
+    monkeypatch.setattr(login_ip_limiter, "limit", 1)
+
+    first = client.post(
+        "/auth/token", data={"username": "someone", "password": "wrong"}
+    )
+    second = client.post(
+        "/auth/token",
+        data={"username": user.username, "password": user.clear_password},
+    )
+
+    assert first.status_code == 400
+    assert second.status_code == 429
+    assert second.json() == {"detail": "Too many attempts, try again later"}
+
+
+def test_unknown_username_skips_database(client, statements):
+    credentials = {"username": "ninguem", "password": "wrong"}
+
+    with patch(
+        "app.api.authentication.router.spend_password_verify_time"
+    ) as mocked_spend:
+        assert client.post("/auth/token", data=credentials).status_code == 400
+        statements.clear()
+        response = client.post("/auth/token", data=credentials)
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Incorrect email or password"}
+    assert statements == []
+    assert mocked_spend.call_count == 2
+
+
+def test_unknown_username_cache_invalidated_on_create(client):
+    credentials = {"username": "novo", "password": "Qwert123"}
+    with patch("app.api.authentication.router.spend_password_verify_time"):
+        assert client.post("/auth/token", data=credentials).status_code == 400
+
+    response = client.post(
+        "/users/",
+        json={
+            "username": "novo",
+            "display_name": "Novo Usuário",
+            "email": "novo@test.com",
+            "password": "Qwert123",
+        },
+    )
+    assert response.status_code == 201
+
+    assert client.post("/auth/token", data=credentials).status_code == 200
+
+
+def test_spend_password_verify_time(monkeypatch):
+    monkeypatch.setattr(password_verify_duration, "seconds", 0.05)
+
+    with (
+        patch("app.utils.security.anyio.sleep") as mocked_sleep,
+        patch("app.utils.security.verify_password") as mocked_verify,
+    ):
+        asyncio.run(spend_password_verify_time())
+
+    mocked_sleep.assert_awaited_once_with(0.05)
+    mocked_verify.assert_not_called()
+
+
+def test_spend_password_verify_time_measures_first(monkeypatch):
+    monkeypatch.setattr(password_verify_duration, "seconds", None)
+
+    with patch("app.utils.security.anyio.sleep") as mocked_sleep:
+        asyncio.run(spend_password_verify_time())
+
+    mocked_sleep.assert_not_called()
+    assert password_verify_duration.seconds > 0
+
+
+def test_spend_password_verify_time_does_not_block_the_event_loop(monkeypatch):
+    monkeypatch.setattr(password_verify_duration, "seconds", None)
+    fake_hash = "$2b$99$" + "x" * 53
+
+    def slow_call(fn, *_args):
+        time.sleep(0.3)
+        return (False, 0.0) if fn is _check_password else fake_hash
+
+    async def scenario():
+        gaps, last = [], time.monotonic()
+
+        async def tick():
+            nonlocal last
+            while True:
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        await spend_password_verify_time()
+        ticker.cancel()
+        return gaps
+
+    _dummy_password_hash.cache_clear()
+    try:
+        with patch("app.utils.security.password_hashing_executor.call", slow_call):
+            gaps = asyncio.run(scenario())
+    finally:
+        _dummy_password_hash.cache_clear()
+
+    # Hashing and verifying the dummy (0.3 s each) never hold the loop.
+    assert max(gaps) < 0.2
+
+
+def test_verify_duration_leaves_out_queue_wait_and_other_costs(monkeypatch):
+    monkeypatch.setattr(password_verify_duration, "seconds", None)
+    rounds = get_settings().SECURITY_BCRYPT_ROUNDS
+    with patch(
+        "app.utils.security.password_hashing_executor.call",
+        return_value=(False, 0.01),
+    ):
+        verify_password("wrong", f"$2b${rounds + 1:02d}$" + "x" * 53)
+        assert password_verify_duration.seconds is None
+
+        verify_password("wrong", f"$2b${rounds:02d}$" + "x" * 53)
+
+    # The measured bcrypt time, not the wall time around the queued call.
+    assert password_verify_duration.seconds == 0.01
+
+
+def test_token_carries_user_id(user, token):
+    assert decode_access_token(token)["uid"] == user.id
+
+
+def test_get_current_user_by_primary_key(session, user, token, statements):
+    user_id = user.id
+    session.expire_all()
+    statements.clear()
+
+    principal = get_current_user(session, token)
+
+    assert principal.id == user_id
+    user_lookups = [sql for sql in statements if "\nFROM user" in sql]
+    assert len(user_lookups) == 1
+    assert "user.id = ?" in user_lookups[0]
+    assert not [sql for sql in statements if "str_username = ?" in sql]
+
+
+def test_get_current_user_legacy_token_without_user_id(session, user):
+    legacy_token = create_access_token(data={"sub": user.username})
+
+    principal = get_current_user(session, legacy_token)
+
+    assert principal.id == user.id
+
+
+def test_get_current_user_rejects_mismatched_user_id(session, user, other_user):
+    token = create_access_token(data={"sub": user.username, "uid": other_user.id})
+
+    with pytest.raises(CredentialsValidationException):
+        get_current_user(session, token)
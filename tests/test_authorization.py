@@ -1,8 +1,30 @@
+from typing import Annotated
 from unittest.mock import patch
 
+import pytest
+from fastapi import APIRouter, Depends
 from sqlalchemy import select
 
+from app.api.authentication.controller import get_current_user
+from app.api.authentication.principal import Principal
+from app.api.authorization.controller import (
+    get_user_permission_mask,
+    validate_transaction_access,
+)
+from app.api.authorization.dependencies import RequireOp
+from app.api.authorization.permission_cache import current_permissions_version
+from app.api.transaction.enum_operation_code import EnumOperationCode as op
+from app.models.assignment import Assignment
 from app.models.authorization import Authorization
+from app.models.role import Role
+from app.models.transaction import Transaction
+from app.startup import app
+from app.utils.exceptions import (
+    AmbiguousAuthorizationException,
+    IllegalAccessException,
+)
+from app.utils.security import create_access_token
+from app.utils.settings import get_settings
 
 
 def test_authorization_db_structure(session, role, trasaction):
@@ -228,3 +250,183 @@ def test_update_authorization_not_found(client, token):
         assert response.status_code == 404
         assert "Authorization with ID" in response.json()["detail"]
         assert mocked_access_validation.assert_called_once
+
+
+def _grant(session, user, role, transaction):
+    session.add_all(
+        [
+            Assignment(
+                user_id=user.id,
+                role_id=role.id,
+                audit_user_ip="localhost",
+                audit_user_login="tester",
+            ),
+            Authorization(
+                role_id=role.id,
+                transaction_id=transaction.id,
+                audit_user_ip="localhost",
+                audit_user_login="tester",
+            ),
+        ]
+    )
+    session.commit()
+
+
+def test_validate_transaction_access_is_cached(
+    session, user, role, trasaction, statements
+):
+    _grant(session, user, role, trasaction)
+
+    validate_transaction_access(session, user, trasaction.operation_code)
+    statements.clear()
+    validate_transaction_access(session, user, trasaction.operation_code)
+
+    assert statements == []
+
+
+def test_validate_transaction_access_invalidated_by_rbac_write(
+    session, user, role, trasaction
+):
+    with pytest.raises(IllegalAccessException):
+        validate_transaction_access(session, user, trasaction.operation_code)
+
+    _grant(session, user, role, trasaction)
+
+    validate_transaction_access(session, user, trasaction.operation_code)
+
+
+def test_rbac_write_skips_permission_version_without_token_claims(
+    session, user, role, trasaction, statements
+):
+    _grant(session, user, role, trasaction)
+
+    assert not any("permission_version" in statement for statement in statements)
+    validate_transaction_access(session, user, trasaction.operation_code)
+
+
+def test_rbac_write_bumps_the_seeded_permission_version(
+    session, user, role, trasaction, statements, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "SECURITY_TOKEN_PERMISSION_CLAIMS", True)
+    assert current_permissions_version(session, use_cache=False) == 0
+    statements.clear()
+
+    _grant(session, user, role, trasaction)
+
+    version_writes = [s for s in statements if "permission_version" in s]
+    assert version_writes and all(s.startswith("UPDATE") for s in version_writes)
+    assert current_permissions_version(session, use_cache=False) > 0
+
+
+def test_get_user_permission_mask(session, user, role):
+    granted = Transaction(
+        name="Role - List",
+        description="Role - List",
+        operation_code=op.OP_1050003.value,
+        audit_user_ip="localhost",
+        audit_user_login="tester",
+    )
+    session.add(granted)
+    session.commit()
+    _grant(session, user, role, granted)
+
+    mask = get_user_permission_mask(session, user.id)
+
+    assert mask == op.OP_1050003.bit
+
+
+def test_validate_transaction_access_with_mask(session, user, statements):
+    validate_transaction_access(
+        session, user, op.OP_1050003.value, user_permission_mask=op.OP_1050003.bit
+    )
+    assert statements == []
+
+    # Op codes outside the mask are denied by the authoritative query.
+    with pytest.raises(IllegalAccessException):
+        validate_transaction_access(
+            session, user, op.OP_1050001.value, user_permission_mask=op.OP_1050003.bit
+        )
+    assert len(statements) == 1
+
+
+def test_validate_transaction_access_with_principal(session, user, statements):
+    principal = Principal(user.id, user.username, op.OP_1050003.bit)
+
+    validate_transaction_access(session, principal, op.OP_1050003.value)
+
+    assert statements == []
+
+
+def test_get_user_permission_mask_skips_ambiguous_grants(
+    session, user, role, grant_op_codes
+):
+    grant_op_codes(op.OP_1050003.value, op.OP_1050005.value)
+    other_role = Role(
+        name="OTHER_ROLE",
+        description="OTHER_ROLE",
+        audit_user_ip="localhost",
+        audit_user_login="tester",
+    )
+    session.add(other_role)
+    session.commit()
+    listing = session.scalar(
+        select(Transaction).filter_by(operation_code=op.OP_1050003.value)
+    )
+    _grant(session, user, other_role, listing)
+
+    mask = get_user_permission_mask(session, user.id)
+
+    assert mask == op.OP_1050005.bit
+    with pytest.raises(AmbiguousAuthorizationException):
+        validate_transaction_access(
+            session, Principal(user.id, user.username, mask), op.OP_1050003.value
+        )
+
+
+def test_require_op_returns_the_principal_with_its_mask(
+    session, user, token, grant_op_codes, statements
+):
+    grant_op_codes(op.OP_1030003.value, op.OP_1030005.value)
+    current_user = get_current_user(session, token)
+    statements.clear()
+
+    principal = RequireOp(op.OP_1030003)(session, current_user)
+
+    assert principal is current_user
+    assert principal.has_permission(op.OP_1030003.value)
+    assert principal.has_permission(op.OP_1030005.value)
+    # Granted by the mask, without another query.
+    assert statements == []
+
+
+def test_require_op_denied(session, user, token):
+    with pytest.raises(IllegalAccessException):
+        RequireOp(op.OP_1030004)(session, get_current_user(session, token))
+
+
+def test_require_op_as_route_dependency(client, token, grant_op_codes):
+    router = APIRouter()
+
+    @router.get("/require-op-probe")
+    def probe(current_user: Annotated[Principal, Depends(RequireOp(op.OP_1030003))]):
+        return {"username": current_user.username}
+
+    app.include_router(router)
+    try:
+        ghost = create_access_token(data={"sub": "ghost"})
+        headers = {"Authorization": f"Bearer {ghost}"}
+        assert client.get("/require-op-probe", headers=headers).status_code == 401
+
+        headers = {"Authorization": f"Bearer {token}"}
+        assert client.get("/require-op-probe", headers=headers).status_code == 401
+
+        grant_op_codes(op.OP_1030003.value)
+        response = client.get("/require-op-probe", headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"username": "Teste"}
+    finally:
+        app.router.routes[:] = [
+            route
+            for route in app.router.routes
+            if getattr(route, "path", None) != "/require-op-probe"
+        ]
@@ -0,0 +1,251 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, select
+
+from app.api.authorization import permission_cache as permission_cache_module
+from app.api.authorization.controller import validate_transaction_access
+from app.api.transaction.enum_operation_code import EnumOperationCode as op
+from app.models.authorization import Authorization
+from app.models.role import Role
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.utils.exceptions import (
+    IllegalAccessException,
+    IntegrityValidationException,
+    ObjectNotFoundException,
+)
+from app.utils.generic_controller import GenericController
+from app.utils.security import verify_password
+from app.utils.settings import get_settings
+
+transaction_controller = GenericController(Transaction)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(get_settings(), "BULK_CHUNK_SIZE", 2)
+
+
+@pytest.fixture
+def headers(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def transaction_row(operation_code: str) -> dict:
+    return {
+        "name": f"Transaction {operation_code}",
+        "description": "Bulk transaction",
+        "operation_code": operation_code,
+        "audit_user_ip": "localhost",
+        "audit_user_login": "tester",
+    }
+
+
+def test_bulk_save_executes_one_insert_per_chunk(session, small_chunks):
+    executions = []
+
+    def before_execute(_conn, statement, multiparams, _params, _options):
+        if statement.is_insert and statement.table.name == "transaction":
+            executions.append(len(multiparams) or 1)
+
+    rows = [transaction_row(f"BLK{i}") for i in range(5)]
+    event.listen(session.bind, "before_execute", before_execute)
+    try:
+        results = transaction_controller.bulk_save(session, rows)
+    finally:
+        event.remove(session.bind, "before_execute", before_execute)
+
+    # SQLite sends ordered INSERT ... RETURNING rows one by one within each
+    # executemany; PostgreSQL sends each chunk as one multi-row statement.
+    assert executions == [2, 2, 1]
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert all(r.error is None for r in results)
+    assert session.scalars(select(Transaction.id)).all() == [r.id for r in results]
+
+
+def test_bulk_save_reports_rejected_rows_and_keeps_the_others(session, small_chunks):
+    rows = [transaction_row(code) for code in ("A1", "A2", "A1", "A3", "A2")]
+
+    results = transaction_controller.bulk_save(session, rows)
+
+    assert [r.error is None for r in results] == [True, True, False, True, False]
+    assert isinstance(results[2].error, IntegrityValidationException)
+    assert results[2].id is None
+    codes = session.scalars(select(Transaction.operation_code)).all()
+    assert sorted(codes) == ["A1", "A2", "A3"]
+
+
+def test_bulk_partial_update_and_delete_report_missing_ids(
+    session, transaction_10_plus_one
+):
+    first, second = (t.id for t in transaction_10_plus_one[:2])
+
+    updated = transaction_controller.bulk_partial_update(
+        session,
+        [
+            {"id": first, "name": "Renamed"},
+            {"id": 999, "name": "Nope"},
+            {"id": second, "operation_code": "TEST666"},
+        ],
+    )
+    deleted = transaction_controller.bulk_delete(session, [999, first])
+
+    assert updated[0].error is None
+    assert isinstance(updated[1].error, ObjectNotFoundException)
+    assert isinstance(updated[2].error, IntegrityValidationException)
+    assert isinstance(deleted[0].error, ObjectNotFoundException)
+    assert deleted[1].error is None
+    assert session.get(Transaction, first) is None
+    assert session.get(Transaction, second).operation_code != "TEST666"
+
+
+def test_bulk_create_route_returns_per_item_results(
+    client, headers, grant_op_codes, trasaction
+):
+    grant_op_codes(op.OP_1030001.value)
+    payload = [
+        {"name": "One", "description": "One", "operation_code": "BLK1"},
+        {
+            "name": "Dup",
+            "description": "Dup",
+            "operation_code": trasaction.operation_code,
+        },
+    ]
+
+    response = client.post("/transaction/bulk", headers=headers, json=payload)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (1, 1)
+    assert body["results"][0]["status_code"] == 201
+    assert body["results"][1] == {
+        "index": 1,
+        "status_code": 400,
+        "id": None,
+        "detail": "Object TRANSACTION was not accepted",
+    }
+
+
+def test_bulk_patch_route_is_not_taken_for_an_id(
+    client, session, role, headers, grant_op_codes
+):
+    grant_op_codes(op.OP_1050002.value)
+    payload = [{"id": role.id, "description": "Bulk"}, {"id": 999}]
+
+    response = client.patch("/role/bulk", headers=headers, json=payload)
+
+    assert [r["status_code"] for r in response.json()["results"]] == [200, 404]
+    session.expire_all()
+    assert session.get(Role, role.id).description == "Bulk"
+
+
+def test_bulk_user_create_hashes_passwords(client, session, headers, grant_op_codes):
+    grant_op_codes(op.OP_1040001.value)
+    payload = [
+        {
+            "username": f"bulk{i}",
+            "display_name": f"Bulk {i}",
+            "email": f"bulk{i}@test.com",
+            "password": f"secret{i}",
+        }
+        for i in range(2)
+    ]
+    payload.append({**payload[0], "email": "other@test.com"})
+
+    response = client.post("/users/bulk", headers=headers, json=payload)
+
+    statuses = [r["status_code"] for r in response.json()["results"]]
+    assert statuses == [201, 201, 400]
+    created = session.scalar(select(User).where(User.username == "bulk1"))
+    assert verify_password("secret1", created.password)
+
+
+def test_bulk_user_create_clears_unknown_username(client, headers, grant_op_codes):
+    grant_op_codes(op.OP_1040001.value)
+    credentials = {"username": "bulknovo", "password": "Qwert123"}
+    with patch("app.api.authentication.router.spend_password_verify_time"):
+        assert client.post("/auth/token", data=credentials).status_code == 400
+    payload = [
+        {
+            "username": "bulknovo",
+            "display_name": "Bulk Novo",
+            "email": "bulknovo@test.com",
+            "password": "Qwert123",
+        }
+    ]
+
+    response = client.post("/users/bulk", headers=headers, json=payload)
+
+    assert response.json()["succeeded"] == 1
+    assert client.post("/auth/token", data=credentials).status_code == 200
+
+
+def test_bulk_user_rename_invalidates_current_user(
+    client, user, headers, grant_op_codes
+):
+    grant_op_codes(op.OP_1040002.value)
+    assert client.get("/auth/cache-stats", headers=headers).status_code == 200
+
+    response = client.patch(
+        "/users/bulk", headers=headers, json=[{"id": user.id, "username": "outro"}]
+    )
+
+    assert response.json()["succeeded"] == 1
+    assert client.get("/auth/cache-stats", headers=headers).status_code == 401
+
+
+def test_bulk_delete_invalidates_cached_permissions(
+    client, session, user, headers, grant_op_codes
+):
+    grant_op_codes(op.OP_1020004.value, op.OP_1030003.value)
+    validate_transaction_access(session, user, op.OP_1030003.value)
+    ids = session.scalars(select(Authorization.id)).all()
+
+    response = client.post("/authorization/bulk/delete", headers=headers, json=ids)
+
+    assert response.json()["succeeded"] == len(ids)
+    with pytest.raises(IllegalAccessException):
+        validate_transaction_access(session, user, op.OP_1030003.value)
+
+
+def test_partially_failing_bulk_invalidates_permissions_at_commit(
+    session, user, role, grant_op_codes, small_chunks, monkeypatch
+):
+    grant_op_codes(op.OP_1030003.value)
+    granted = session.scalar(select(Authorization))
+    transaction = Transaction(**transaction_row(op.OP_1030001.value))
+    session.add(transaction)
+    session.commit()
+    with pytest.raises(IllegalAccessException):
+        validate_transaction_access(session, user, op.OP_1030001.value)
+    nested = []
+    invalidate = permission_cache_module.invalidate_permissions
+
+    def record_invalidation():
+        nested.append(session.in_nested_transaction())
+        invalidate()
+
+    monkeypatch.setattr(
+        permission_cache_module, "invalidate_permissions", record_invalidation
+    )
+    audit = {"audit_user_ip": "localhost", "audit_user_login": "tester"}
+    rows = [
+        {"role_id": role.id, "transaction_id": transaction.id, **audit},
+        {"role_id": role.id, "transaction_id": granted.transaction_id, **audit},
+    ]
+
+    results = GenericController(Authorization).bulk_save(session, rows)
+
+    assert [r.error is None for r in results] == [True, False]
+    # Once, for the outer commit; not when the savepoint of row 0 is released.
+    assert nested == [False]
+    validate_transaction_access(session, user, op.OP_1030001.value)
+
+
+def test_bulk_body_is_bounded(client, headers):
+    too_many = list(range(get_settings().BULK_MAX_ITEMS + 1))
+
+    for ids in (too_many, []):
+        response = client.post("/role/bulk/delete", headers=headers, json=ids)
+        assert response.status_code == 422
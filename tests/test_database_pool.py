@@ -0,0 +1,121 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, SingletonThreadPool
+
+from app.database.pool import (
+    PoolMetrics,
+    create_instrumented_engine,
+    engine_options,
+    pool_metrics,
+)
+from app.utils.settings import get_settings
+
+
+@pytest.fixture
+def pool_settings():
+    return get_settings().model_copy(
+        update={
+            "DB_POOL_SIZE": 1,
+            "DB_POOL_MAX_OVERFLOW": 1,
+            "DB_POOL_TIMEOUT_SECONDS": 0.05,
+            "DB_POOL_RECYCLE_SECONDS": 600,
+            "DB_POOL_PRE_PING": True,
+        }
+    )
+
+
+@pytest.fixture
+def pool_engine(tmp_path, pool_settings):
+    engine = create_instrumented_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", "test-pool", pool_settings
+    )
+    yield engine
+    engine.dispose()
+    pool_metrics.pop("test-pool")
+
+
+def test_engine_options_apply_pool_settings(pool_settings):
+    options = engine_options(
+        "postgresql://app@db/app", PoolMetrics("pg"), pool_settings
+    )
+
+    assert issubclass(options["poolclass"], QueuePool)
+    assert options["pool_size"] == 1
+    assert options["max_overflow"] == 1
+    assert options["pool_timeout"] == 0.05
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+
+
+def test_engine_options_keep_sqlite_memory_pool(pool_settings):
+    options = engine_options("sqlite:///:memory:", PoolMetrics("mem"), pool_settings)
+
+    assert issubclass(options["poolclass"], SingletonThreadPool)
+    assert "pool_size" not in options
+    assert "max_overflow" not in options
+
+
+def test_pool_metrics_track_checkouts_and_overflow(pool_engine):
+    metrics = pool_metrics["test-pool"]
+
+    with pool_engine.connect() as first, pool_engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        during = metrics.snapshot()
+
+    after = metrics.snapshot()
+
+    assert during["checked_out"] == 2
+    assert during["overflow"] == 1
+    assert during["size"] == 1
+    assert after["checked_out"] == 0
+    assert after["peak_checked_out"] == 2
+    assert after["checkouts"] == 2
+    assert after["connects"] == 2
+    assert sum(after["wait_ms"].values()) == 2
+
+
+def test_pool_metrics_count_checkout_timeouts(pool_engine):
+    metrics = pool_metrics["test-pool"]
+
+    with (
+        pool_engine.connect(),
+        pool_engine.connect(),
+        pytest.raises(PoolTimeoutError),
+    ):
+        pool_engine.connect()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["timeouts"] == 1
+    # The timed-out caller waited at least pool_timeout (50 ms).
+    assert sum(snapshot["wait_ms"].values()) == 3
+    assert snapshot["wait_ms_total"] >= 50
+
+
+def test_db_pool_metrics_route(client, token):
+    response = client.get(
+        "/metrics/db-pool", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    names = [pool["name"] for pool in response.json()["pools"]]
+    assert "primary" in names
+
+
+def test_db_pool_metrics_route_requires_authentication(client):
+    response = client.get("/metrics/db-pool")
+
+    assert response.status_code == 401
+
+
+def test_sqlite_savepoints_stay_inside_the_outer_transaction(pool_engine):
+    with pool_engine.connect() as connection:
+        connection.exec_driver_sql("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+        connection.commit()
+
+        with connection.begin_nested():
+            connection.exec_driver_sql("INSERT INTO item VALUES (1)")
+        connection.rollback()
+
+        assert connection.scalar(text("SELECT count(*) FROM item")) == 0
@@ -0,0 +1,166 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import OperationalError
+from starlette.requests import Request
+
+from app.api.authorization.permission_cache import current_permissions_version
+from app.database import session as database_session
+from app.database.replicas import (
+    PRIMARY_PINNED_KEY,
+    PRIMARY_READ,
+    ReplicaSet,
+    RoutingSession,
+)
+from app.models.permission_version import PermissionVersion
+from app.models.transaction import Transaction
+from app.utils.base_model import Base
+
+
+def database(path, *names):
+    """File database holding one transaction per name."""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with RoutingSession(engine) as db_session:
+        for index, name in enumerate(names):
+            db_session.add(
+                Transaction(
+                    name=name,
+                    description=name,
+                    operation_code=f"RPL{index:04d}",
+                    audit_user_ip="localhost",
+                    audit_user_login="tester",
+                )
+            )
+        db_session.commit()
+    return engine
+
+
+@pytest.fixture
+def primary(tmp_path):
+    engine = database(tmp_path / "primary.db", "primary")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replica_engines(tmp_path):
+    engines = [
+        database(tmp_path / "replica0.db", "replica-0"),
+        database(tmp_path / "replica1.db", "replica-1"),
+    ]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def transaction_names(db_session) -> list[str]:
+    return list(db_session.scalars(select(Transaction.name)))
+
+
+def make_request(method: str) -> Request:
+    return Request({"type": "http", "method": method, "headers": []})
+
+
+def test_replica_set_round_robin_skips_ejected(replica_engines):
+    first, second = replica_engines
+    replicas = ReplicaSet(replica_engines, eject_seconds=60)
+
+    assert [replicas.choose() for _ in range(3)] == [first, second, first]
+
+    replicas.eject(second)
+
+    assert [replicas.choose() for _ in range(2)] == [first, first]
+    assert not replicas.is_healthy(second)
+
+    replicas.eject(first)
+
+    assert replicas.choose() is None
+
+
+def test_replica_set_returns_ejected_replica_after_timeout(replica_engines):
+    first, second = replica_engines
+    replicas = ReplicaSet(replica_engines, eject_seconds=0)
+
+    replicas.eject(first)
+
+    assert replicas.is_healthy(first)
+    assert {replicas.choose(), replicas.choose()} == {first, second}
+
+
+def test_unreachable_replica_is_ejected(tmp_path, primary, replica_engines):
+    unreachable = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    replicas = ReplicaSet([unreachable, replica_engines[1]], eject_seconds=60)
+
+    with (
+        RoutingSession(primary, replicas) as db_session,
+        pytest.raises(OperationalError),
+    ):
+        transaction_names(db_session)
+
+    assert not replicas.is_healthy(unreachable)
+    with RoutingSession(primary, replicas) as db_session:
+        assert transaction_names(db_session) == ["replica-1"]
+
+
+def test_routing_session_reads_replica_until_it_writes(primary, replica_engines):
+    replicas = ReplicaSet(replica_engines, eject_seconds=60)
+
+    with RoutingSession(primary, replicas) as db_session:
+        # One replica per session: repeated reads see the same database.
+        assert transaction_names(db_session) == ["replica-0"]
+        assert transaction_names(db_session) == ["replica-0"]
+
+        db_session.add(
+            Transaction(
+                name="written",
+                description="written",
+                operation_code="RPLNEW0",
+                audit_user_ip="localhost",
+                audit_user_login="tester",
+            )
+        )
+        db_session.flush()
+
+        assert db_session.info[PRIMARY_PINNED_KEY]
+        assert transaction_names(db_session) == ["primary", "written"]
+
+
+def test_routing_session_without_replicas_uses_primary(primary):
+    with RoutingSession(primary) as db_session:
+        assert transaction_names(db_session) == ["primary"]
+
+
+def test_get_session_routes_only_read_only_requests(
+    monkeypatch, primary, replica_engines
+):
+    monkeypatch.setattr(database_session, "engine", primary)
+    monkeypatch.setattr(
+        database_session, "replicas", ReplicaSet(replica_engines, eject_seconds=60)
+    )
+
+    read = next(database_session.get_session(make_request("GET")))
+    write = next(database_session.get_session(make_request("POST")))
+    script = next(database_session.get_session())
+
+    assert transaction_names(read) == ["replica-0"]
+    assert transaction_names(write) == ["primary"]
+    assert transaction_names(script) == ["primary"]
+
+
+def test_primary_reads_skip_the_replica(primary, replica_engines):
+    with RoutingSession(primary) as db_session:
+        db_session.get(PermissionVersion, 1).version = 5
+        db_session.commit()
+    replicas = ReplicaSet(replica_engines, eject_seconds=60)
+
+    with RoutingSession(primary, replicas) as db_session:
+        primary_names = db_session.scalars(
+            select(Transaction.name), bind_arguments=PRIMARY_READ
+        ).all()
+        # Cached authorization lookups never see a lagging replica.
+        version = current_permissions_version(db_session, use_cache=False)
+
+        assert primary_names == ["primary"]
+        assert version == 5
+        assert not db_session.info.get(PRIMARY_PINNED_KEY)
+        assert transaction_names(db_session) == ["replica-0"]
@@ -0,0 +1,184 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.utils.exceptions import InvalidFilterException
+from app.utils.filters import MAX_IN_VALUES, filter_plan
+from app.utils.generic_controller import filtered_select
+
+
+@pytest.fixture
+def list_transactions(client, token):
+    """GET /transaction/ with access validation patched out."""
+
+    def fetch(**params):
+        with patch("app.api.authorization.dependencies.validate_transaction_access"):
+            return client.get(
+                "/transaction/",
+                headers={"Authorization": f"Bearer {token}"},
+                params={"limit": 200, **params},
+            )
+
+    return fetch
+
+
+def codes(response) -> list[str]:
+    return [t["operation_code"] for t in response.json()["transactions"]]
+
+
+def query_plan(session, model, *filters: str) -> str:
+    query = filtered_select(model, filters)
+    sql = query.compile(session.bind, compile_kwargs={"literal_binds": True})
+    rows = session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return " ".join(row[-1] for row in rows)
+
+
+def test_filter_plan_is_compiled_once_per_model():
+    assert filter_plan(Transaction) is filter_plan(Transaction)
+
+
+def test_filter_plan_operators_follow_column_types():
+    plan = filter_plan(Transaction)
+
+    assert plan.fields["id"].operators == {"eq", "in", "range"}
+    assert plan.fields["operation_code"].operators == {
+        "eq",
+        "in",
+        "range",
+        "prefix",
+        "contains",
+    }
+    assert "password" not in filter_plan(User).fields
+
+
+def test_filter_by_prefix(list_transactions, transaction_200):
+    expected = sorted(
+        t.operation_code
+        for t in transaction_200
+        if t.operation_code.startswith("TEST1")
+    )
+
+    response = list_transactions(filter="operation_code:prefix:TEST1")
+
+    assert sorted(codes(response)) == expected
+
+
+def test_prefix_escapes_like_wildcards(list_transactions, transaction_10_plus_one):
+    response = list_transactions(filter="operation_code:prefix:TEST_")
+
+    assert codes(response) == []
+
+
+def test_filters_are_combined(list_transactions, transaction_200):
+    ids = sorted(t.id for t in transaction_200)
+
+    response = list_transactions(
+        filter=[f"id:range:{ids[10]}..{ids[19]}", "operation_code:prefix:TEST1"]
+    )
+
+    assert [t["id"] for t in response.json()["transactions"]] == [
+        t.id
+        for t in sorted(transaction_200, key=lambda t: t.id)[10:20]
+        if t.operation_code.startswith("TEST1")
+    ]
+
+
+def test_filter_by_eq_and_in(list_transactions, transaction_10_plus_one):
+    exact = list_transactions(filter="operation_code:eq:TEST666")
+    listed = list_transactions(filter="operation_code:in:TEST1,TEST666,NOPE")
+
+    assert codes(exact) == ["TEST666"]
+    assert sorted(codes(listed)) == ["TEST1", "TEST666"]
+
+
+def test_filter_by_contains(list_transactions, transaction_10_plus_one):
+    response = list_transactions(filter="operation_code:contains:t66")
+
+    assert codes(response) == ["TEST666"]
+
+
+def test_op_code_matches_a_prefix(list_transactions, transaction_10_plus_one):
+    response = list_transactions(op_code="TEST66")
+
+    assert codes(response) == ["TEST666"]
+
+
+@pytest.mark.parametrize(
+    ("model", "filters", "index"),
+    [
+        (Transaction, ["operation_code:prefix:TEST1"], "idx_transaction_op_code"),
+        (Transaction, ["operation_code:eq:TEST1"], "idx_transaction_op_code"),
+        (User, ["username:prefix:adm"], "idx_user_username"),
+        (User, ["email:in:a@b.c,d@e.f"], "idx_user_email"),
+    ],
+)
+def test_exact_and_prefix_filters_seek_an_index(session, model, filters, index):
+    plan = query_plan(session, model, *filters)
+
+    assert f"INDEX {index}" in plan
+    assert "SCAN" not in plan
+
+
+def test_prefix_compares_in_the_c_collation_on_postgresql():
+    query = select(User.id).where(filter_plan(User).parse("username:prefix:adm"))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    index = next(
+        index
+        for index in User.__table__.indexes
+        if index.name == "idx_user_username_prefix"
+    )
+
+    assert sql.count('("user".str_username COLLATE "C")') == 2
+    assert "LIKE" not in sql
+    assert 'ON "user" ((str_username COLLATE "C"))' in str(
+        CreateIndex(index).compile(dialect=postgresql.dialect())
+    )
+
+
+def test_prefix_of_the_last_code_point_has_no_upper_bound(
+    list_transactions, transaction_10_plus_one
+):
+    response = list_transactions(filter=f"operation_code:prefix:{chr(0x10FFFF)}")
+
+    assert response.status_code == 200
+    assert codes(response) == []
+
+
+def test_contains_filter_scans(session):
+    assert "SCAN" in query_plan(session, Transaction, "operation_code:contains:T1")
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "operation_code",
+        "operation_code:eq",
+        "unknown:eq:1",
+        "id:prefix:1",
+        "id:eq:abc",
+        "id:range:..",
+        "id:range:5",
+        "operation_code:prefix:",
+        "id:in:" + ",".join(["1"] * (MAX_IN_VALUES + 1)),
+    ],
+)
+def test_invalid_filters_are_rejected(expression):
+    with pytest.raises(InvalidFilterException):
+        filter_plan(Transaction).parse(expression)
+
+
+def test_unfilterable_column_returns_400(client, token):
+    with patch("app.api.user.router.validate_transaction_access"):
+        response = client.get(
+            "/users/",
+            headers={"Authorization": f"Bearer {token}"},
+            params={"filter": "password:prefix:$2b$"},
+        )
+
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
@@ -0,0 +1,167 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.models.transaction import Transaction
+from app.utils.exceptions import InvalidPaginationException
+from app.utils.generic_controller import GenericController
+from app.utils.pagination import decode_cursor, encode_cursor
+
+transaction_controller = GenericController(Transaction)
+
+
+@pytest.fixture
+def list_transactions(client, token):
+    """GET /transaction/ with access validation patched out."""
+
+    def fetch(**params):
+        with patch("app.api.authorization.dependencies.validate_transaction_access"):
+            return client.get(
+                "/transaction/",
+                headers={"Authorization": f"Bearer {token}"},
+                params=params,
+            )
+
+    return fetch
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("operation_code", "OP1 é/+")
+
+    assert decode_cursor(cursor, "operation_code") == "OP1 é/+"
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-base64!", "bm90IGpzb24", encode_cursor("id", 1)]
+)
+def test_decode_cursor_rejects_invalid_cursors(cursor):
+    with pytest.raises(InvalidPaginationException):
+        decode_cursor(cursor, "operation_code")
+
+
+@pytest.mark.parametrize("value", ["abc", 1.5, True, None, [1]])
+def test_decode_cursor_rejects_values_of_another_type(value):
+    with pytest.raises(InvalidPaginationException):
+        decode_cursor(encode_cursor("id", value), "id", int)
+
+
+def test_cursor_with_a_value_of_another_type_is_rejected(list_transactions):
+    response = list_transactions(cursor=encode_cursor("id", "abc"))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+def test_walk_every_page_by_cursor(list_transactions, transaction_200):
+    ids, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 50} | ({"cursor": cursor} if cursor else {})
+        body = list_transactions(**params).json()
+        ids += [transaction["id"] for transaction in body["transactions"]]
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 4
+    assert ids == sorted(t.id for t in transaction_200)
+
+
+def test_last_page_has_no_cursor(list_transactions, transaction_10_plus_one):
+    body = list_transactions(limit=11).json()
+
+    assert len(body["transactions"]) == 11
+    assert body["next_cursor"] is None
+
+
+def test_cursor_pages_do_not_shift_when_rows_are_deleted(
+    session, list_transactions, transaction_200
+):
+    ids = sorted(t.id for t in transaction_200)
+    first = list_transactions(limit=10).json()
+    session.delete(session.get(Transaction, first["transactions"][0]["id"]))
+    session.commit()
+
+    second = list_transactions(limit=10, cursor=first["next_cursor"]).json()
+    by_offset = list_transactions(limit=10, skip=10).json()
+
+    assert [t["id"] for t in second["transactions"]] == ids[10:20]
+    # Offset paging silently skips a row once a row of the first page is gone.
+    assert by_offset["transactions"][0]["id"] == ids[11]
+
+
+def test_cursor_page_seeks_instead_of_offset(session, transaction_200, statements):
+    ids = sorted(t.id for t in transaction_200)
+    first = transaction_controller.get_page(session, limit=10, skip=150)
+    statements.clear()
+
+    page = transaction_controller.get_page(session, limit=10, cursor=first.next_cursor)
+
+    assert [t.id for t in page.items] == ids[160:170]
+    # SQLite always renders OFFSET (0) after LIMIT; the page seeks by key.
+    assert len(statements) == 1
+    assert '"transaction".id > ?' in statements[0]
+
+
+def test_paginate_by_unique_column(list_transactions, transaction_10_plus_one):
+    codes = sorted(t.operation_code for t in transaction_10_plus_one)
+
+    first = list_transactions(limit=6, order_by="operation_code").json()
+    second = list_transactions(
+        limit=6, order_by="operation_code", cursor=first["next_cursor"]
+    ).json()
+
+    assert [t["operation_code"] for t in first["transactions"]] == codes[:6]
+    assert [t["operation_code"] for t in second["transactions"]] == codes[6:]
+    assert second["next_cursor"] is None
+
+
+def test_paginate_with_filter(list_transactions, transaction_10_plus_one):
+    body = list_transactions(limit=5, op_code="TEST666").json()
+
+    assert [t["operation_code"] for t in body["transactions"]] == ["TEST666"]
+    assert body["next_cursor"] is None
+
+
+def test_order_by_column_without_unique_index_is_rejected(list_transactions):
+    response = list_transactions(order_by="name")
+
+    assert response.status_code == 400
+    assert "operation_code" in response.json()["detail"]
+
+
+def test_cursor_from_another_order_is_rejected(
+    list_transactions, transaction_10_plus_one
+):
+    cursor = list_transactions(limit=2).json()["next_cursor"]
+
+    response = list_transactions(order_by="operation_code", cursor=cursor)
+
+    assert response.status_code == 400
+
+
+def test_every_list_route_returns_a_cursor(client, token, other_user, role_10):
+    headers = {"Authorization": f"Bearer {token}"}
+    with (
+        patch("app.api.user.router.validate_transaction_access"),
+        patch("app.api.role.router.validate_transaction_access"),
+    ):
+        users = client.get(
+            "/users/", headers=headers, params={"limit": 1, "order_by": "username"}
+        ).json()
+        next_users = client.get(
+            "/users/",
+            headers=headers,
+            params={"order_by": "username", "cursor": users["next_cursor"]},
+        ).json()
+        roles = client.get(
+            "/role/", headers=headers, params={"limit": 5, "order_by": "name"}
+        ).json()
+
+    assert [u["username"] for u in users["users"] + next_users["users"]] == [
+        "Teste",
+        "TesteOutro",
+    ]
+    assert next_users["next_cursor"] is None
+    assert len(roles["roles"]) == 5
+    assert roles["next_cursor"]
@@ -0,0 +1,275 @@
+import pytest
+
+from app.api.authentication import refresh_token as refresh_token_module
+from app.api.transaction.enum_operation_code import EnumOperationCode as op
+from app.models.assignment import Assignment
+from app.models.authorization import Authorization
+from app.models.role import Role
+from app.models.transaction import Transaction
+from app.models.user import User
+
+# Statements each endpoint runs once the caller's principal is cached. Inserts
+# and PUT updates read the row back with RETURNING; PATCH loads the row first
+# and refreshes it. The permissions version is only bumped with token claims.
+# Bulk routes write each chunk in a savepoint (one item here) and check the ids
+# they update or delete with one SELECT. The /auth routes do not take a cached
+# principal and are covered by test_auth_query_counts.
+USER = {
+    "username": "novo",
+    "display_name": "Novo",
+    "email": "novo@test.com",
+    "password": "secret",
+}
+ENDPOINT_QUERY_COUNTS = [
+    ("GET", "/users/{user_id}", None, 1),
+    ("GET", "/users/", None, 1),
+    ("GET", "/users/{user_id}/transactions", None, 1),
+    ("POST", "/users/", USER, 1),
+    ("PUT", "/users/{spare_user_id}", {**USER, "username": "spare"}, 1),
+    ("PATCH", "/users/{user_id}", {"display_name": "Renamed"}, 3),
+    # Deleting a parent loads its child collections to unlink them.
+    ("DELETE", "/users/{spare_user_id}", None, 3),
+    ("POST", "/users/bulk", [USER], 4),
+    ("PATCH", "/users/bulk", [{"id": "{spare_user_id}", "display_name": "New"}], 5),
+    ("POST", "/users/bulk/delete", ["{spare_user_id}"], 5),
+    ("GET", "/role/{role_id}", None, 1),
+    ("GET", "/role/", None, 1),
+    ("POST", "/role/", {"name": "NEW_ROLE", "description": "New role"}, 1),
+    ("PUT", "/role/{role_id}", {"name": "ROLE", "description": "Renamed"}, 1),
+    ("PATCH", "/role/{role_id}", {"description": "Renamed"}, 3),
+    ("DELETE", "/role/{spare_role_id}", None, 4),
+    ("POST", "/role/bulk", [{"name": "NEW_ROLE", "description": "New role"}], 4),
+    ("PATCH", "/role/bulk", [{"id": "{spare_role_id}", "description": "New"}], 5),
+    ("POST", "/role/bulk/delete", ["{spare_role_id}"], 5),
+    ("GET", "/transaction/{transaction_id}", None, 1),
+    ("GET", "/transaction/", None, 1),
+    (
+        "POST",
+        "/transaction/",
+        {"name": "New", "description": "New", "operation_code": "NEW0001"},
+        1,
+    ),
+    (
+        "PUT",
+        "/transaction/{spare_transaction_id}",
+        {"name": "Spare", "description": "Renamed", "operation_code": "SPARE01"},
+        1,
+    ),
+    ("PATCH", "/transaction/{transaction_id}", {"description": "Renamed"}, 3),
+    ("DELETE", "/transaction/{spare_transaction_id}", None, 3),
+    (
+        "POST",
+        "/transaction/bulk",
+        [{"name": "New", "description": "New", "operation_code": "NEW0001"}],
+        4,
+    ),
+    (
+        "PATCH",
+        "/transaction/bulk",
+        [{"id": "{spare_transaction_id}", "description": "New"}],
+        5,
+    ),
+    ("POST", "/transaction/bulk/delete", ["{spare_transaction_id}"], 5),
+    ("GET", "/assignment/{assignment_id}", None, 1),
+    ("GET", "/assignment/", None, 1),
+    (
+        "POST",
+        "/assignment/",
+        {"user_id": "{spare_user_id}", "role_id": "{spare_role_id}"},
+        1,
+    ),
+    (
+        "PUT",
+        "/assignment/{spare_assignment_id}",
+        {"user_id": "{spare_user_id}", "role_id": "{spare_role_id}"},
+        1,
+    ),
+    ("PATCH", "/assignment/{spare_assignment_id}", {"role_id": "{spare_role_id}"}, 3),
+    ("DELETE", "/assignment/{spare_assignment_id}", None, 2),
+    (
+        "POST",
+        "/assignment/bulk",
+        [{"user_id": "{spare_user_id}", "role_id": "{spare_role_id}"}],
+        4,
+    ),
+    (
+        "PATCH",
+        "/assignment/bulk",
+        [{"id": "{spare_assignment_id}", "role_id": "{spare_role_id}"}],
+        5,
+    ),
+    ("POST", "/assignment/bulk/delete", ["{spare_assignment_id}"], 5),
+    ("GET", "/authorization/{authorization_id}", None, 1),
+    ("GET", "/authorization/", None, 1),
+    (
+        "POST",
+        "/authorization/",
+        {"role_id": "{spare_role_id}", "transaction_id": "{spare_transaction_id}"},
+        1,
+    ),
+    (
+        "PUT",
+        "/authorization/{spare_authorization_id}",
+        {"role_id": "{spare_role_id}", "transaction_id": "{spare_transaction_id}"},
+        1,
+    ),
+    (
+        "PATCH",
+        "/authorization/{spare_authorization_id}",
+        {"role_id": "{spare_role_id}"},
+        3,
+    ),
+    ("DELETE", "/authorization/{spare_authorization_id}", None, 2),
+    (
+        "POST",
+        "/authorization/bulk",
+        [{"role_id": "{spare_role_id}", "transaction_id": "{spare_transaction_id}"}],
+        4,
+    ),
+    (
+        "PATCH",
+        "/authorization/bulk",
+        [{"id": "{spare_authorization_id}", "role_id": "{spare_role_id}"}],
+        5,
+    ),
+    ("POST", "/authorization/bulk/delete", ["{spare_authorization_id}"], 5),
+]
+
+
+ALL_OP_CODES = [member.value for member in op]
+
+
+@pytest.fixture
+def rbac_graph(session, user, role, grant_op_codes):
+    """The user holds every op code through `role`, plus unrelated rows."""
+    grant_op_codes(*ALL_OP_CODES)
+    audit = {"audit_user_ip": "localhost", "audit_user_login": "tester"}
+    spare_user = User(
+        username="spare",
+        display_name="Spare user",
+        email="spare@test.com",
+        password="not-a-hash",
+        **audit,
+    )
+    spare_role = Role(name="SPARE", description="Spare role", **audit)
+    spare_transaction = Transaction(
+        name="Spare",
+        description="Spare transaction",
+        operation_code="SPARE01",
+        **audit,
+    )
+    # Linked to other rows, so the spare user, role and transaction stay deletable.
+    spare_authorization = Authorization(
+        role=role,
+        transaction=Transaction(
+            name="Spare 2",
+            description="Spare transaction",
+            operation_code="SPARE02",
+            **audit,
+        ),
+        **audit,
+    )
+    spare_assignment = Assignment(
+        user=user, role=Role(name="SPARE_2", description="Spare role", **audit), **audit
+    )
+    session.add_all(
+        [
+            spare_user,
+            spare_role,
+            spare_transaction,
+            spare_authorization,
+            spare_assignment,
+        ]
+    )
+    session.commit()
+    return {
+        "user_id": user.id,
+        "role_id": role.id,
+        "transaction_id": role.authorizations[0].transaction_id,
+        "assignment_id": role.assignments[0].id,
+        "authorization_id": role.authorizations[0].id,
+        "spare_user_id": spare_user.id,
+        "spare_role_id": spare_role.id,
+        "spare_transaction_id": spare_transaction.id,
+        "spare_assignment_id": spare_assignment.id,
+        "spare_authorization_id": spare_authorization.id,
+    }
+
+
+def _fill(body, ids: dict):
+    """Replace the `"{name}"` placeholders of a request body with those ids."""
+    if isinstance(body, list):
+        return [_fill(item, ids) for item in body]
+    if isinstance(body, dict):
+        return {key: _fill(value, ids) for key, value in body.items()}
+    if isinstance(body, str) and body.startswith("{") and body.endswith("}"):
+        return ids[body[1:-1]]
+    return body
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body", "expected"),
+    ENDPOINT_QUERY_COUNTS,
+    ids=[f"{method} {path}" for method, path, _, _ in ENDPOINT_QUERY_COUNTS],
+)
+def test_endpoint_query_count(
+    client, session, token, rbac_graph, statements, method, path, body, expected
+):
+    headers = {"Authorization": f"Bearer {token}"}
+    # Warm the principal and permission caches, then start from a clean session.
+    assert client.get("/users/", headers=headers).status_code == 200
+    session.expunge_all()
+    statements.clear()
+
+    response = client.request(
+        method,
+        path.format(**rbac_graph),
+        headers=headers,
+        json=_fill(body, rbac_graph),
+    )
+
+    assert response.status_code < 300, response.text
+    assert len(statements) == expected, statements
+
+
+def test_require_op_route_cold_query_count(
+    client, session, token, rbac_graph, statements
+):
+    """A cold RequireOp route loads the user and its mask, then runs the handler."""
+    session.expunge_all()
+    statements.clear()
+
+    response = client.get(
+        "/transaction/{transaction_id}".format(**rbac_graph),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200, response.text
+    assert len(statements) == 3, statements
+
+
+def test_auth_query_counts(client, session, user, statements, monkeypatch):
+    """Login, refresh and revoke, with the refresh-token purge not yet due."""
+    monkeypatch.setattr(refresh_token_module, "_next_purge_at", float("inf"))
+    credentials = {"username": user.username, "password": user.clear_password}
+    session.expunge_all()
+    statements.clear()
+
+    # The user by username, then the new refresh token.
+    response = client.post("/auth/token", data=credentials)
+    assert response.status_code == 200, response.text
+    assert len(statements) == 2, statements
+
+    # The token, its conditional revocation, the user and the rotated token.
+    statements.clear()
+    body = {"refresh_token": response.json()["refresh_token"]}
+    response = client.post("/auth/refresh", json=body)
+    assert response.status_code == 200, response.text
+    assert len(statements) == 4, statements
+
+    # The token's family, then revoking it.
+    statements.clear()
+    body = {"refresh_token": response.json()["refresh_token"]}
+    response = client.post("/auth/revoke", json=body)
+    assert response.status_code == 200, response.text
+    assert len(statements) == 2, statements
@@ -0,0 +1,114 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.models.assignment import Assignment
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.utils.exceptions import InvalidFilterException
+from app.utils.filters import filter_plan
+from app.utils.generic_controller import GenericController, filtered_select
+from app.utils.search import SearchMatch, autogenerate_filter
+
+user_controller = GenericController(User)
+
+
+@pytest.fixture
+def search_users(client, token):
+    """GET /users/?search= with access validation patched out."""
+
+    def fetch(term: str, **params):
+        with patch("app.api.user.router.validate_transaction_access"):
+            response = client.get(
+                "/users/",
+                headers={"Authorization": f"Bearer {token}"},
+                params={"search": term, **params},
+            )
+        return sorted(u["username"] for u in response.json()["users"])
+
+    return fetch
+
+
+def usernames(session, term: str) -> list[str]:
+    return sorted(u.username for u in user_controller.get_all(session, search=term))
+
+
+def test_search_matches_a_substring_of_any_searchable_column(search_users, other_user):
+    assert search_users("OUTRO") == ["TesteOutro"]
+    assert search_users("test.com") == ["Teste", "TesteOutro"]
+    assert search_users("missing") == []
+
+
+def test_search_combines_with_filters(search_users, other_user):
+    assert search_users("teste", filter="username:eq:Teste") == ["Teste"]
+
+
+def test_search_follows_inserts_updates_and_deletes(session, user, other_user):
+    other_user.username = "Renomeado"
+    session.commit()
+    session.delete(user)
+    session.commit()
+
+    assert usernames(session, "TesteOutro") == []
+    assert usernames(session, "nomead") == ["Renomeado"]
+    assert usernames(session, "teste@") == []
+
+
+def test_short_terms_fall_back_to_ilike(session, user, other_user):
+    assert usernames(session, "ou") == ["TesteOutro"]
+
+
+@pytest.mark.parametrize("term", ['te"st', "100%", "te_st", "a b OR c"])
+def test_search_terms_are_not_fts_syntax(session, user, term):
+    assert usernames(session, term) == []
+
+
+def test_contains_filter_uses_the_search_index_on_searchable_columns(session):
+    plan = filter_plan(Transaction)
+
+    assert isinstance(plan.parse("name:contains:abc"), SearchMatch)
+    assert not isinstance(plan.parse("description:contains:abc"), SearchMatch)
+
+
+def test_search_reads_the_fts_table_instead_of_scanning(session):
+    query = filtered_select(User, search="teste")
+    sql = query.compile(session.bind, compile_kwargs={"literal_binds": True})
+    plan = session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    details = [row[-1] for row in plan]
+
+    assert "SEARCH user USING INTEGER PRIMARY KEY (rowid=?)" in details
+    assert any("user_search VIRTUAL TABLE" in detail for detail in details)
+
+
+def test_search_without_searchable_columns_is_rejected(session):
+    with pytest.raises(InvalidFilterException):
+        GenericController(Assignment).get_all(session, search="abc")
+
+
+def test_search_compiles_to_ilike_on_postgres():
+    column = Transaction.__table__.c.str_name
+    query = select(Transaction.id).where(SearchMatch([column], "abc"))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "ILIKE" in sql
+
+
+def test_trigram_indexes_are_postgres_only():
+    (index,) = (i for i in User.__table__.indexes if i.name == "idx_user_email_trgm")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert "USING gin (str_email gin_trgm_ops)" in ddl
+    assert autogenerate_filter("sqlite")(index, index.name, "index", False, None) is (
+        False
+    )
+
+
+def test_autogenerate_ignores_the_fts_tables():
+    include = autogenerate_filter("sqlite")
+
+    assert not include(None, "user_search", "table", True, None)
+    assert not include(None, "user_search_data", "table", True, None)
+    assert include(None, "user", "table", True, None)
@@ -2,7 +2,14 @@ from unittest.mock import patch
 
 from sqlalchemy import select
 
+from app.api.transaction.enum_operation_code import EnumOperationCode as op
+from app.api.transaction.enum_operation_code import (
+    mask_grants,
+    op_codes_from_mask,
+    permission_mask,
+)
 from app.models.transaction import Transaction
+from app.utils.generic_controller import GenericController
 
 
 def test_db_structure_trasaction_entity(session):
@@ -29,7 +36,7 @@ def test_db_structure_trasaction_entity(session):
 
 def test_create_transaction_success(client, token):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.post(
             "/transaction/",
@@ -59,7 +66,7 @@ def test_create_transaction_IntegrityValidationException(
     client, token, transaction_10_plus_one
 ):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.post(
             "/transaction/",
@@ -79,7 +86,7 @@ def test_create_transaction_IntegrityValidationException(
 
 def test_update_transaction_sucess(client, token, transaction_10_plus_one):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.get(
             "/transaction/?op_code=TEST666",
@@ -88,7 +95,7 @@ def test_update_transaction_sucess(client, token, transaction_10_plus_one):
         trans_id = response.json()["transactions"][0]["id"]
         assert mocked_access_validation.assert_called_once
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.put(
             f"/transaction/{trans_id}",
@@ -115,7 +122,7 @@ def test_update_transaction_sucess(client, token, transaction_10_plus_one):
 
 def test_update_transaction_not_found(client, token):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         non_existent_transaction_id = 9999
         response = client.put(
@@ -135,7 +142,7 @@ def test_update_transaction_not_found(client, token):
 
 def test_get_transaction_by_op_code(client, transaction_10_plus_one, token):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.get(
             "/transaction/?op_code=TEST666",
@@ -151,7 +158,7 @@ def test_get_transaction_by_op_code(client, transaction_10_plus_one, token):
 
 def test_list_transactions(client, transaction_200, token):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.get(
             "/transaction/?limit=300",
@@ -167,7 +174,7 @@ def test_list_transactions(client, transaction_200, token):
 
 def test_get_transaction_by_id(client, transaction_10_plus_one, token):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.get(
             "/transaction/10",
@@ -185,7 +192,7 @@ def test_get_transaction_by_id(client, transaction_10_plus_one, token):
 
 def test_delete_transection_success(client, token, transaction_10_plus_one):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.get(
             "/transaction/?op_code=TEST666",
@@ -194,7 +201,7 @@ def test_delete_transection_success(client, token, transaction_10_plus_one):
         trans_id = response.json()["transactions"][0]["id"]
         assert mocked_access_validation.assert_called_once
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         response = client.delete(
             f"/transaction/{trans_id}",
@@ -208,7 +215,7 @@ def test_delete_transection_success(client, token, transaction_10_plus_one):
 
 def test_delete_none_existent_transaction(client, token):
     with patch(
-        "app.api.transaction.router.validate_transaction_access"
+        "app.api.authorization.dependencies.validate_transaction_access"
     ) as mocked_access_validation:
         non_existent_transaction_id = 9999
         response = client.delete(
@@ -219,3 +226,71 @@ def test_delete_none_existent_transaction(client, token):
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
         assert mocked_access_validation.assert_called_once
+
+
+def test_permission_mask_round_trip():
+    op_codes = [op.OP_1010001.value, op.OP_1050005.value]
+
+    mask = permission_mask([*op_codes, "TEST666"])
+
+    assert mask == op.OP_1010001.bit | op.OP_1050005.bit
+    assert op_codes_from_mask(mask) == op_codes
+    assert mask_grants(mask, op.OP_1050005.value)
+    assert not mask_grants(mask, op.OP_1050004.value)
+    assert not mask_grants(mask, "TEST666")
+
+
+def test_patch_transaction_only_sent_fields(client, token, trasaction):
+    with patch(
+        "app.api.authorization.dependencies.validate_transaction_access"
+    ) as mocked_access_validation:
+        response = client.patch(
+            f"/transaction/{trasaction.id}",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"description": "Descrição PARCIAL"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["description"] == "Descrição PARCIAL"
+    assert response.json()["name"] == trasaction.name
+    assert response.json()["operation_code"] == trasaction.operation_code
+    assert mocked_access_validation.assert_called_once
+
+
+def test_patch_transaction_not_found(client, token):
+    with patch("app.api.authorization.dependencies.validate_transaction_access"):
+        response = client.patch(
+            "/transaction/999",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"name": "Inexistente"},
+        )
+
+    assert response.status_code == 404
+
+
+def test_update_transaction_writes_only_changed_columns(
+    session, statements, trasaction
+):
+    controller = GenericController(Transaction)
+    changed = Transaction(
+        id=trasaction.id,
+        name=trasaction.name,
+        description="Descrição ALTERADA",
+        operation_code=trasaction.operation_code,
+        audit_user_ip="localhost",
+        audit_user_login="tester",
+    )
+    statements.clear()
+
+    updated = controller.update(session, changed)
+
+    updates = [s for s in statements if s.startswith('UPDATE "transaction"')]
+    assert len(updates) == 1
+    assert "RETURNING" in updates[0]
+    assert "description=" in updates[0]
+    assert "name=" not in updates[0]
+    assert updated.description == "Descrição ALTERADA"
+
+    statements.clear()
+    assert controller.update(session, changed) is updated
+    assert not any(s.startswith('UPDATE "transaction"') for s in statements)
@@ -4,6 +4,7 @@ from sqlalchemy import select
 
 from app.api.user.schemas import UserPublic
 from app.models.user import User
+from app.utils.security import verify_password
 from tests.factory.user_factory import UserFactory
 
 
@@ -110,7 +111,7 @@ def test_read_users_with_users(client, user, token):
     ) as mocked_access_validation:
         user_schema = UserPublic.model_validate(user).model_dump()
         response = client.get("/users/", headers={"Authorization": f"Bearer {token}"})
-    assert response.json() == {"users": [user_schema]}
+    assert response.json() == {"users": [user_schema], "next_cursor": None}
     assert mocked_access_validation.assert_called_once
 
 
@@ -230,3 +231,76 @@ def test_get_user_transactions(client, user, token, role, transaction_10_plus_on
         assert len(response.json()["transactions"]) == len(transactions_ids)
         for transaction in response.json()["transactions"]:
             assert transaction["id"] in transactions_ids
+
+
+def test_patch_user_without_password_skips_hashing(client, session, user, token):
+    stored_password = user.password
+    with (
+        patch(
+            "app.api.user.router.validate_transaction_access"
+        ) as mocked_access_validation,
+        patch("app.api.user.controller.get_password_hash") as mocked_hash,
+    ):
+        response = client.patch(
+            f"/users/{user.id}",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"display_name": "Nome Alterado"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["display_name"] == "Nome Alterado"
+    assert response.json()["username"] == user.username
+    assert response.json()["email"] == user.email
+    mocked_hash.assert_not_called()
+    session.refresh(user)
+    assert user.password == stored_password
+    assert mocked_access_validation.assert_called_once
+
+
+def test_patch_user_password(client, session, user, token):
+    with patch("app.api.user.router.validate_transaction_access"):
+        response = client.patch(
+            f"/users/{user.id}",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"password": "SenhaNova"},
+        )
+
+    assert response.status_code == 200
+    session.refresh(user)
+    assert verify_password("SenhaNova", user.password)
+
+
+def test_patch_user_unchanged_writes_nothing(client, user, token, statements):
+    with patch("app.api.user.router.validate_transaction_access"):
+        statements.clear()
+        response = client.patch(
+            f"/users/{user.id}",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"display_name": user.display_name},
+        )
+
+    assert response.status_code == 200
+    assert not [sql for sql in statements if sql.startswith("UPDATE")]
+
+
+def test_patch_user_not_found(client, user, token):
+    with patch("app.api.user.router.validate_transaction_access"):
+        response = client.patch(
+            "/users/999",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"display_name": "Ninguém"},
+        )
+
+    assert response.status_code == 404
+
+
+def test_patch_user_duplicated_username(client, user, other_user, token):
+    with patch("app.api.user.router.validate_transaction_access"):
+        response = client.patch(
+            f"/users/{other_user.id}",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"username": user.username},
+        )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Object USER was not accepted"}